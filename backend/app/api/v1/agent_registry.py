@@ -0,0 +1,78 @@
+import time
+import httpx
+from langchain_openai import ChatOpenAI
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from app.core.config import settings
+from app.api_mcp.v1.tools import MCP_TOOLS
+
+# =========================================================
+# Agent Tool Registry (v1 agent)
+# Built once at application startup instead of per chat request:
+# - name -> tool callable (O(1) lookup instead of scanning the tool list)
+# - OpenAI tool schemas generated once (bind_tools regenerated all five per request)
+# - one bound model shared by every request, with a pooled HTTP client (connections / TLS reused)
+# =========================================================
+
+
+def _tool_name(tool) -> str:
+    # LangChain Tool 객체(.name) 또는 파이썬 함수(.__name__)
+    return getattr(tool, "name", None) or tool.__name__
+
+
+class AgentToolRegistry:
+    """Immutable after construction; safe to share across concurrent requests."""
+
+    def __init__(self, tools: list, llm, http_client: httpx.AsyncClient | None = None):
+        started = time.perf_counter()
+        self.tools = {_tool_name(tool): tool for tool in tools}
+        self.schemas = [convert_to_openai_tool(tool) for tool in tools]
+        # Pre-converted schemas pass through bind_tools as is
+        self.model = llm.bind_tools(self.schemas)
+        self.http_client = http_client
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def get(self, name: str):
+        return self.tools.get(name)
+
+    async def aclose(self):
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+
+def build_agent_registry(tools: list | None = None) -> AgentToolRegistry:
+    """Default registry: MCP tools + ChatOpenAI on a pooled async HTTP client."""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.AGENT_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.AGENT_HTTP_MAX_CONNECTIONS
+        ),
+        timeout=settings.AGENT_HTTP_TIMEOUT_SECONDS
+    )
+    llm = ChatOpenAI(
+        model=settings.AGENT_MODEL_NAME,
+        temperature=settings.AGENT_TEMPERATURE,
+        http_async_client=http_client
+    )
+    return AgentToolRegistry(tools if tools is not None else MCP_TOOLS, llm, http_client)
+
+
+AGENT_REGISTRY: AgentToolRegistry | None = None
+
+def init_agent_registry() -> AgentToolRegistry:
+    """Startup hook (lifespan). Must run inside the serving event loop: the async HTTP pool binds to it."""
+    global AGENT_REGISTRY
+    if AGENT_REGISTRY is None:
+        AGENT_REGISTRY = build_agent_registry()
+        print(f"[AgentRegistry] {len(AGENT_REGISTRY.tools)} tools registered ({AGENT_REGISTRY.build_ms:.1f}ms)")
+    return AGENT_REGISTRY
+
+def get_agent_registry() -> AgentToolRegistry:
+    """Registry built at startup (built on first use if the lifespan did not run, e.g. a bare router)."""
+    return AGENT_REGISTRY or init_agent_registry()
+
+async def aclose_agent_registry():
+    global AGENT_REGISTRY
+    if AGENT_REGISTRY is not None:
+        await AGENT_REGISTRY.aclose()
+        AGENT_REGISTRY = None
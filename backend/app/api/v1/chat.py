@@ -1,10 +1,15 @@
+import json
+import asyncio
+import inspect
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage
-from app.api_mcp.v1.tools import MCP_TOOLS
+from app.api.v1.agent_registry import AgentToolRegistry, get_agent_registry
+from app.core.config import settings
+from app.core.executor import run_blocking
 
 router = APIRouter()
 
@@ -24,131 +29,213 @@ class ChatResponse(BaseModel):
     response: str
     tool_calls: List[Dict[str, Any]] = []
 
+# -------------------------------------------------------------------------
+# Tool Execution (never blocks the event loop)
+# -------------------------------------------------------------------------
+async def _run_tool(selected_tool, tool_args: dict):
+    """
+    - LangChain Tool 객체: ainvoke (sync 전용 Tool이면 invoke를 툴 실행 스레드 풀에서)
+    - async 함수 (MCP 툴): 그대로 await
+    - sync 함수: 툴 실행 스레드 풀(TOOL_EXECUTOR, 크기 제한)에서 실행
+    """
+    if hasattr(selected_tool, "ainvoke"):
+        return await selected_tool.ainvoke(tool_args)
+    if hasattr(selected_tool, "invoke"):
+        return await run_blocking(selected_tool.invoke, tool_args)
+    if inspect.iscoroutinefunction(selected_tool):
+        return await selected_tool(**tool_args)
+    tool_result = await run_blocking(selected_tool, **tool_args)
+    if inspect.isawaitable(tool_result):
+        tool_result = await tool_result
+    return tool_result
+
+async def _execute_tool_call(registry: AgentToolRegistry, tool_call: dict, semaphore: asyncio.Semaphore) -> str:
+    """Runs one tool call under the step's concurrency cap and the per-tool timeout. Errors become the result text."""
+    tool_name = tool_call["name"]
+    selected_tool = registry.get(tool_name)
+    if not selected_tool:
+        return "Error: Tool not found."
+
+    async with semaphore:
+        try:
+            # 타임아웃 시 응답은 에러로 돌려주고 진행 (스레드 풀의 sync 툴은 끝날 때까지 백그라운드에서 실행됨)
+            tool_result = await asyncio.wait_for(
+                _run_tool(selected_tool, tool_call["args"]),
+                timeout=settings.AGENT_TOOL_TIMEOUT_SECONDS
+            )
+            return str(tool_result)
+        except asyncio.TimeoutError:
+            return f"Error: Tool '{tool_name}' timed out after {settings.AGENT_TOOL_TIMEOUT_SECONDS:g}s."
+        except Exception as e:
+            return f"Error: {str(e)}"
+
 # -------------------------------------------------------------------------
 # Agent Logic
 # -------------------------------------------------------------------------
+def _to_langchain_messages(request: ChatRequest) -> list:
+    # 프론트엔드에서 받은 JSON 데이터를 LangChain 객체로 변환
+    langchain_messages = []
+    for msg in request.messages:
+        if msg.role == "user":
+            langchain_messages.append(HumanMessage(content=msg.content))
+        elif msg.role == "assistant":
+            langchain_messages.append(AIMessage(content=msg.content))
+        elif msg.role == "tool":
+            # ToolMessage는 tool_call_id가 필수입니다.
+            langchain_messages.append(ToolMessage(
+                content=msg.content,
+                tool_call_id=msg.id, 
+                name=msg.name
+            ))
+        # SystemMessage 등 필요시 추가
+    return langchain_messages
+
+async def _stream_model(llm_with_tools, messages: list):
+    """
+    Streams one LLM turn: yields text deltas (str) as they arrive, then the merged AIMessageChunk
+    (tool_calls are assembled from the streamed tool_call_chunks).
+    """
+    merged = None
+    async for chunk in llm_with_tools.astream(messages):
+        if chunk.content:
+            yield chunk.content
+        merged = chunk if merged is None else merged + chunk
+    yield merged if merged is not None else AIMessage(content="")
+
+async def _agent_events(messages: list, stream: bool = False):
+    """
+    Agent Loop: LLM 호출 -> Tool 실행 -> LLM 호출 ... (Tool Call 없는 답변이 나오면 종료)
+    Yields events (dict with "type"):
+    - token       : 텍스트 조각 (stream=True 일 때만, 'step' = LLM 호출 번호)
+                    Tool Call로 끝난 스텝의 텍스트(서두)는 최종 답변이 아님 -> 클라이언트는 tool_start를 받으면 누적 답변을 비움
+    - tool_start  : 툴 실행 시작 (스텝의 모든 툴 호출에 대해 먼저 전송, 'step' 포함)
+    - tool_result : 툴 하나 완료 (완료 순서대로, 'index'는 tool_calls 안의 위치)
+    - done        : 최종 답변 + 전체 툴 로그
+    """
+    # 서버 시작 시 만든 레지스트리의 공유 모델 (요청마다 생성/bind_tools 하지 않음)
+    registry = get_agent_registry()
+    llm_with_tools = registry.model
+
+    # >> Streamlit UI에서 Tool 실행 과정을 보여주기 위해,
+    # 백엔드 내부에서 Loop를 돌면서 Tool을 실행하고 "최종 답변"과 "중간에 실행했던 Tool 로그"를 함께 반환
+    tool_logs = []
+    final_content = ""
+    current_messages = messages
+
+    # 무한 루프 방지
+    max_steps = 5
+    step_count = 0
+
+    while step_count < max_steps:
+        step_count += 1
+
+        # LLM 호출 (비동기: 응답을 기다리는 동안 다른 요청 처리)
+        if stream:
+            async for part in _stream_model(llm_with_tools, current_messages):
+                if isinstance(part, str):
+                    yield {"type": "token", "step": step_count, "content": part}
+                else:
+                    ai_msg = part
+        else:
+            ai_msg = await llm_with_tools.ainvoke(current_messages)
+
+        # 2) Tool Call 없이 답변만 있는 경우 (Loop 종료)
+        if not ai_msg.tool_calls:
+            final_content = ai_msg.content
+            break
+
+        # 1) Tool Call이 있는 경우
+        current_messages.append(ai_msg) # 대화 기록에 추가
+        for index, tool_call in enumerate(ai_msg.tool_calls):
+            yield {"type": "tool_start", "step": step_count, "index": index, "id": tool_call["id"],
+                   "name": tool_call["name"], "args": tool_call["args"]}
+
+        # 한 스텝의 Tool Call들은 서로 독립적이므로 동시에 실행 (스텝 지연 = 가장 느린 툴)
+        semaphore = asyncio.Semaphore(settings.AGENT_TOOL_CONCURRENCY)
+        tasks = [
+            asyncio.ensure_future(_execute_tool_call(registry, tool_call, semaphore))
+            for tool_call in ai_msg.tool_calls
+        ]
+        positions = {task: index for index, task in enumerate(tasks)}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=positions.get):
+                    tool_call = ai_msg.tool_calls[positions[task]]
+                    yield {"type": "tool_result", "index": positions[task], "id": tool_call["id"],
+                           "name": tool_call["name"], "result": task.result()}
+        finally:
+            # 스트림 클라이언트가 끊긴 경우 남은 툴 실행 취소
+            for task in pending:
+                task.cancel()
+
+        # 대화 기록/로그는 tool_calls 순서 그대로 (LLM이 보는 ToolMessage 순서 유지)
+        for tool_call, task in zip(ai_msg.tool_calls, tasks):
+            tool_result_content = task.result()
+            # 로그 기록 (프론트엔드 전달용)
+            tool_logs.append({
+                "name": tool_call["name"],
+                "args": tool_call["args"],
+                "result": tool_result_content
+            })
+
+            # 대화 기록에 Tool 결과 추가 (그래야 LLM이 결과를 보고 이어감)
+            current_messages.append(ToolMessage(
+                tool_call_id=tool_call["id"],
+                name=tool_call["name"],
+                content=tool_result_content
+            ))
+        # Loop 다시 실행 (Tool 결과 보고 LLM이 다시 생각)
+
+    yield {"type": "done", "response": final_content, "tool_calls": tool_logs}
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
     try:
-        # 1. Initialize LLM with Tools
-        # 모델 설정 (필요시 .env에서 불러오거나 상수로 관리)
-        llm = ChatOpenAI(model="gpt-4o", temperature=0.2)
-        tools = MCP_TOOLS
-        llm_with_tools = llm.bind_tools(tools)
-
-        # 2. Reconstruct LangChain Message History
-        # 프론트엔드에서 받은 JSON 데이터를 LangChain 객체로 변환
-        langchain_messages = []
-        for msg in request.messages:
-            if msg.role == "user":
-                langchain_messages.append(HumanMessage(content=msg.content))
-            elif msg.role == "assistant":
-                langchain_messages.append(AIMessage(content=msg.content))
-            elif msg.role == "tool":
-                # ToolMessage는 tool_call_id가 필수입니다.
-                langchain_messages.append(ToolMessage(
-                    content=msg.content,
-                    tool_call_id=msg.id, 
-                    name=msg.name
-                ))
-            # SystemMessage 등 필요시 추가
-
-        # 3. Invoke Agent (Single Turn)
-        # 이미 Tool 실행 결과가 포함된 히스토리라면, LLM은 다음 말을 하거나 멈춥니다.
-        # 마지막 메시지가 User라면 LLM은 답변하거나 Tool을 호출합니다.
-        
-        # 주의: 여기서는 "한 턴"만 실행하고 결과를 프론트엔드에 돌려줍니다.
-        # 프론트엔드가 Tool Call 응답을 받으면, Tool을 실행하고 다시 API를 호출해야 하는 구조가 *아니라*,
-        # **백엔드에서 Tool 실행까지 다 끝내고 최종 답변만 줄지**, 
-        # 아니면 **Tool 실행 요청을 프론트엔드에 줄지** 결정해야 합니다.
-        
-        # >> 사용자의 요구사항(Streamlit UI에서 Tool 실행 과정 보여주기)을 고려하면,
-        # 백엔드 내부에서 Loop를 돌면서 Tool을 실행하고, 
-        # "최종 답변"과 "중간에 실행했던 Tool 로그"를 함께 반환하는 것이 가장 깔끔합니다.
-
-        tool_logs = []
-        final_content = ""
-        
-        # Agent Loop
-        current_messages = langchain_messages
-        
-        # 무한 루프 방지
-        max_steps = 5
-        step_count = 0
-
-        while step_count < max_steps:
-            step_count += 1
-            
-            # LLM 호출
-            ai_msg = llm_with_tools.invoke(current_messages)
-            
-            # 1) Tool Call이 있는 경우
-            if ai_msg.tool_calls:
-                current_messages.append(ai_msg) # 대화 기록에 추가
-                
-                for tool_call in ai_msg.tool_calls:
-                    tool_name = tool_call["name"]
-                    tool_args = tool_call["args"]
-                    tool_id = tool_call["id"]
-                    
-                    # Tool 실행
-                    # tools 리스트 안의 요소가 LangChain Tool 객체일 수도 있고, 함수일 수도 있음
-                    selected_tool = None
-                    for t in tools:
-                        # 1. LangChain Tool 객체인 경우 (.name 속성)
-                        if hasattr(t, "name") and t.name == tool_name:
-                            selected_tool = t
-                            break
-                        # 2. 파이썬 함수인 경우 (.__name__ 속성)
-                        elif hasattr(t, "__name__") and t.__name__ == tool_name:
-                            selected_tool = t
-                            break
-                    
-                    tool_result_content = ""
-                    
-                    if selected_tool:
-                        try:
-                            # 실제 실행
-                            # 함수라면 바로 호출(tool_args), Tool 객체라면 .invoke(tool_args)
-                            if hasattr(selected_tool, "invoke"):
-                                tool_result = selected_tool.invoke(tool_args)
-                            else:
-                                tool_result = selected_tool(**tool_args)
-                                
-                            tool_result_content = str(tool_result)
-                        except Exception as e:
-                            tool_result_content = f"Error: {str(e)}"
-                    else:
-                        tool_result_content = "Error: Tool not found."
-
-                    # 로그 기록 (프론트엔드 전달용)
-                    tool_logs.append({
-                        "name": tool_name,
-                        "args": tool_args,
-                        "result": tool_result_content
-                    })
-
-                    # 대화 기록에 Tool 결과 추가 (그래야 LLM이 결과를 보고 이어감)
-                    current_messages.append(ToolMessage(
-                        tool_call_id=tool_id,
-                        name=tool_name,
-                        content=tool_result_content
-                    ))
-                
-                # Loop 다시 실행 (Tool 결과 보고 LLM이 다시 생각)
-                continue
-            
-            # 2) Tool Call 없이 답변만 있는 경우 (Loop 종료)
-            else:
-                final_content = ai_msg.content
-                break
-        
+        final = None
+        async for event in _agent_events(_to_langchain_messages(request)):
+            if event["type"] == "done":
+                final = event
+
         return ChatResponse(
-            response=final_content,
-            tool_calls=tool_logs
+            response=final["response"],
+            tool_calls=final["tool_calls"]
         )
 
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
+
+# -------------------------------------------------------------------------
+# Streaming (Server-Sent Events)
+# -------------------------------------------------------------------------
+def _sse(event: dict) -> str:
+    payload = {key: value for key, value in event.items() if key != "type"}
+    return f"event: {event['type']}\ndata: {json.dumps(payload, ensure_ascii=False, default=str)}\n\n"
+
+async def _sse_events(messages: list):
+    try:
+        async for event in _agent_events(messages, stream=True):
+            yield _sse(event)
+    except Exception as e:
+        # 응답 헤더가 이미 전송되었으므로 HTTP 에러 대신 error 이벤트로 전달
+        import traceback
+        traceback.print_exc()
+        yield _sse({"type": "error", "detail": str(e)})
+
+@router.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """
+    /chat 과 같은 Agent Loop를 SSE로 스트리밍:
+    tool_start / tool_result 이벤트, 답변 토큰(token, 스텝 번호 포함), 마지막에 done (최종 답변 + 툴 로그) 또는 error.
+    tool_start 이전에 받은 토큰은 툴 호출 전 서두이므로 답변에서 버려야 함.
+    """
+    return StreamingResponse(
+        _sse_events(_to_langchain_messages(request)),
+        media_type="text/event-stream",
+        # 프록시(nginx 등) 버퍼링 없이 바로 전달
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,8 +1,12 @@
 from fastapi import APIRouter
-from app.api.v1 import chat
+from app.api.v1 import chat, trends
 
 api_router = APIRouter()
 
 # Chat/Agent 관련 API
 api_router.include_router(chat.router, prefix="/agent", tags=["agent"])
-# 예: POST /api/v1/agent/chat
+# 예: POST /api/v1/agent/chat, POST /api/v1/agent/chat/stream (SSE)
+
+# 아카이브된 트렌드 조회 (페이지네이션)
+api_router.include_router(trends.router, prefix="/trends", tags=["trends"])
+# 예: GET /api/v1/trends?category=k_blog&limit=20&cursor=...
@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+
+from app.engine.tools.v1.trend_items import TREND_PAGE_SIZE, TREND_PAGE_MAX_SIZE, aget_trend_item, alist_trend_items
+from app.engine.tools.v1.trend_views import TREND_VIEWS
+
+router = APIRouter()
+
+# -------------------------------------------------------------------------
+# Pydantic Models (Response)
+# -------------------------------------------------------------------------
+class TrendItemResponse(BaseModel):
+    id: str
+    category: str
+    title: str
+    link: str
+    summary: str = ""
+    tags: List[str] = []
+    source_domain: str = ""
+    collected_at: datetime
+    view_count: int = 0
+
+class TrendPageResponse(BaseModel):
+    items: List[TrendItemResponse]
+    next_cursor: Optional[str] = None
+
+# -------------------------------------------------------------------------
+# Archived Trends (newest first, cursor pagination)
+# -------------------------------------------------------------------------
+@router.get("", response_model=TrendPageResponse)
+async def list_trends(
+    category: Optional[str] = None,
+    tag: Optional[List[str]] = Query(None),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(TREND_PAGE_SIZE, ge=1, le=TREND_PAGE_MAX_SIZE),
+    cursor: Optional[str] = None,
+):
+    try:
+        page = await alist_trend_items(category, tag, since, until, limit, cursor)
+    except ValueError:
+        # Malformed cursor (bad timestamp / ObjectId)
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+    # Listing pages are impressions, not views: only opened items (GET /trends/{item_id}) are counted
+    return TrendPageResponse(
+        items=[TrendItemResponse(id=str(doc.pop("_id")), **doc) for doc in page["items"]],
+        next_cursor=page["next_cursor"]
+    )
+
+# -------------------------------------------------------------------------
+# Top Viewed (precomputed every TREND_VIEW_TOP_REFRESH_SECONDS, not sorted per request)
+# -------------------------------------------------------------------------
+@router.get("/top", response_model=List[TrendItemResponse])
+async def top_viewed_trends(
+    category: str,
+    limit: int = Query(10, ge=1, le=TREND_PAGE_MAX_SIZE),
+):
+    return [
+        TrendItemResponse(id=str(doc["_id"]), **{k: v for k, v in doc.items() if k != "_id"})
+        for doc in TREND_VIEWS.top_viewed(category, limit)
+    ]
+
+# -------------------------------------------------------------------------
+# Single Item (opening an item counts as one view)
+# -------------------------------------------------------------------------
+@router.get("/{item_id}", response_model=TrendItemResponse)
+async def get_trend(item_id: str):
+    try:
+        doc = await aget_trend_item(item_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid item id.")
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Trend item not found.")
+
+    TREND_VIEWS.record([doc])
+    return TrendItemResponse(id=str(doc.pop("_id")), **doc)
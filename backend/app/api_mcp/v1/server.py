@@ -3,6 +3,10 @@ from app.api_mcp.v1.tools import mcp
 if __name__ == "__main__":
     import uvicorn
     import sys
+    import asyncio
+    from contextlib import asynccontextmanager
+    from app.engine.tools.v1.function_tool import awarm_up_tool_resources
+    from app.engine.tools.v1.trend_archiver import TREND_ARCHIVER
     
     # print(f"✅ [MCP] Starting FastMCP (SSE Mode) using uvicorn on port 8200...", flush=True)
     
@@ -25,6 +29,24 @@ if __name__ == "__main__":
         raw_app = mcp.sse_app()
         # print("⚠️ [MCP] Fallback to sse_app", flush=True)
 
+    # Warm up curriculum / track vectors / survey query embeddings without delaying server start,
+    # and run the trend archiving worker for the lifetime of the server.
+    # Runs inside the server's event loop: the Motor client is bound to the loop that first uses it.
+    session_lifespan = raw_app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with session_lifespan(app) as state:
+            warmup_task = asyncio.create_task(awarm_up_tool_resources())
+            await TREND_ARCHIVER.start()
+            yield state
+            if not warmup_task.done():
+                warmup_task.cancel()
+            # Drain queued archive items before exit
+            await TREND_ARCHIVER.stop()
+
+    raw_app.router.lifespan_context = lifespan
+
     app = TrustedHostMiddleware(raw_app, allowed_hosts=["*"])
 
     # We run it directly to ensure stability and control over the port
@@ -2,12 +2,13 @@ from typing import List, Annotated
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 from app.engine.tools.v1.function_tool import (
-    f_get_techtree_track,
-    f_get_techtree_path,
-    f_get_techtree_trend,
-    f_get_techtree_subject,
-    f_get_techtree_survey
+    af_get_techtree_track,
+    af_get_techtree_path,
+    af_get_techtree_trend,
+    af_get_techtree_subject,
+    af_get_techtree_survey
 )
+from app.engine.tools.v1.tool_memo import TOOL_MEMO
 from app.engine.tools.v1.schema_tool import (
     TrackOutput, 
     PathOutput, 
@@ -24,9 +25,13 @@ mcp = FastMCP("AI TechTree", host="0.0.0.0", port=8200, stateless_http=True)
 
 # ---------------------------------------------------------
 # Tool Definitions
+# Async: DB reads are awaited, blocking calls run on the bounded tool executor.
+# Deterministic tools (survey/path/subject) are memoized per curriculum version (TOOL_MEMO).
 # ---------------------------------------------------------
 @mcp.tool()
-def get_techtree_survey() -> SurveyOutput:
+# Load failure falls back to an empty survey (no error field): retried instead of memoized
+@TOOL_MEMO.memoize(cacheable=lambda survey: bool(survey.questions))
+async def get_techtree_survey() -> SurveyOutput:
     """
     Returns a simple survey to understand the user's development experience and AI interests.
 
@@ -40,11 +45,11 @@ def get_techtree_survey() -> SurveyOutput:
     - **Do NOT use**: If the user has already explicitly stated their development experience (e.g., "I'm a senior dev") AND their specific area of interest (e.g., "I want to build chatbots"). In that case, proceed directly to `get_techtree_track`.
     - **Goal**: Collect missing metadata to provide accurate recommendations.
     """
-    data = f_get_techtree_survey()
+    data = await af_get_techtree_survey()
     return SurveyOutput(**data)
 
 @mcp.tool()
-def get_techtree_track(
+async def get_techtree_track(
     interests: Annotated[List[str], Field(description="List of keywords. Pass ['ALL'] to see all available tracks.")],
     experience_level: Annotated[str, Field(description="User's experience level ('beginner', 'intermediate', 'expert').")]
 ) -> TrackOutput:
@@ -63,11 +68,12 @@ def get_techtree_track(
     - **From Survey**: If you have the result from `get_techtree_survey`, use the EXACT list of keywords from the user's selected interest option as the `interests` argument. (e.g. `interests=['llm', 'langchain', ...]`)
     - **Show All Tracks**: If the user asks for a list of tracks or is unsure, Call this tool with `interests=["ALL"]`.
     """
-    data = f_get_techtree_track(interests, experience_level)
+    data = await af_get_techtree_track(interests, experience_level)
     return TrackOutput(**data)
 
 @mcp.tool()
-def get_techtree_path(
+@TOOL_MEMO.memoize
+async def get_techtree_path(
     track_name: Annotated[str, Field(description="Exact name of the track (e.g., 'Track 1: AI Engineer').")]
 ) -> PathOutput:
     """
@@ -84,13 +90,15 @@ def get_techtree_path(
     - **Focus on Sequence**: Emphasize the logical order of study (Step 1 -> Step 2 -> Step 3).
     - Step 3 (Application) focuses on projects and specialized domains.
     - Do NOT suggest specific time durations (e.g., "2 weeks") unless explicitly asked. Focus on **what to learn first** and **why**.
+    - If `resolved_from` is set, the given name was auto-corrected to `track`. No retry is needed.
     """
-    data = f_get_techtree_path(track_name)
+    data = await af_get_techtree_path(track_name)
     return PathOutput(**data)
 
 
 @mcp.tool()
-def get_techtree_subject(
+@TOOL_MEMO.memoize
+async def get_techtree_subject(
     subject_name: Annotated[str, Field(description="The exact name of the subject (e.g., 'Vector DB', 'Python Syntax').")]
 ) -> SubjectOutput:
     """
@@ -105,12 +113,13 @@ def get_techtree_subject(
     IMPORTANT FOR LLM: 
     - **Trigger Condition**: Use this when the user asks for "What is X?", "What should I study in X?", or details about a specific roadmap item.
     - **Goal**: Explain the specific concepts (Lv1, Lv2, Lv3) required to master the subject.
+    - A single concept (e.g., 'Dependency Injection 원리') also works: `matched_concepts` shows where it is taught.
     """
-    data = f_get_techtree_subject(subject_name)
+    data = await af_get_techtree_subject(subject_name)
     return SubjectOutput(**data)
 
 @mcp.tool()
-def get_techtree_trend(
+async def get_techtree_trend(
     keywords: Annotated[List[str], Field(description="List of technical keywords (e.g., ['LLM', 'Agent', 'RAG']). Include 3-5 related keywords for better tagging.")],
     category: Annotated[str, Field(description="Target content category ('tech_news', 'engineering', 'research', 'k_blog').")] = "k_blog"
 ) -> TrendOutput:
@@ -134,7 +143,7 @@ def get_techtree_trend(
     - "engineering": Implementation details (GitHub, WandB, LangChain).
     - "research": Academic papers (Arxiv).
     """
-    data = f_get_techtree_trend(keywords, category)
+    data = await af_get_techtree_trend(keywords, category)
     return TrendOutput(**data)
 
 # No need to explicitly manually list MCP_TOOLS list if using @mcp.tool decorator with FastMCP's internal registry,
@@ -1,5 +1,9 @@
+import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# backend/ 디렉토리 (로컬 캐시 파일 기본 위치)
+BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 class Settings(BaseSettings):
     # 필수 환경 변수 (값 없으면 에러 발생)
     OPENAI_API_KEY: str
@@ -9,7 +13,88 @@ class Settings(BaseSettings):
     # 선택적 환경 변수 (기본값 제공)
     PROJECT_NAME: str = "AI TechTree"
     API_V1_STR: str = "/api/v1"
-    
+
+    # Curriculum Index (tracks 컬렉션 버전 확인 주기, 초)
+    CURRICULUM_VERSION_CHECK_SECONDS: float = 30.0
+
+    # Embedding Store (프로세스 간 공유되는 임베딩 파일 위치)
+    EMBEDDING_STORE_DIR: str = os.path.join(BACKEND_ROOT, ".cache", "embeddings")
+
+    # Embedding Provider ("openai": OpenAI API / "local": 오프라인 해시 n-gram TF-IDF)
+    EMBEDDING_PROVIDER: str = "openai"
+    LOCAL_EMBEDDING_DIM: int = 256
+
+    # Query Embedding Cache (관심 키워드 리스트 -> 쿼리 벡터, TTL 0이면 만료 없음)
+    QUERY_EMBEDDING_CACHE_SIZE: int = 512
+    QUERY_EMBEDDING_CACHE_TTL_SECONDS: float = 0
+
+    # Tool Executor (임베딩/검색 등 블로킹 작업용 스레드 풀 크기)
+    TOOL_EXECUTOR_WORKERS: int = 8
+
+    # Tool Memoization (survey/path/subject 결과 캐시 최대 항목 수, 커리큘럼 버전별)
+    TOOL_MEMO_MAXSIZE: int = 512
+
+    # Agent Model (v1 에이전트 공유 모델, OpenAI HTTP 커넥션 풀)
+    AGENT_MODEL_NAME: str = "gpt-4o"
+    AGENT_TEMPERATURE: float = 0.2
+    AGENT_HTTP_MAX_CONNECTIONS: int = 20
+    AGENT_HTTP_TIMEOUT_SECONDS: float = 60.0
+
+    # Agent Tool Calls (한 스텝에서 동시에 실행할 툴 호출 수, 툴 하나당 제한 시간, 초)
+    AGENT_TOOL_CONCURRENCY: int = 4
+    AGENT_TOOL_TIMEOUT_SECONDS: float = 30.0
+
+    # Trend Search Cache (키워드+카테고리 -> 검색 결과, fresh 이후 stale 구간에서는 백그라운드 갱신)
+    TREND_CACHE_SIZE: int = 256
+    TREND_CACHE_FRESH_SECONDS: float = 900
+    TREND_CACHE_STALE_SECONDS: float = 86400
+
+    # Offline Trend Prefetch (scripts/prefetch_trends.py): 이 시간 안에 캐시된 검색은 다시 실행하지 않음
+    # cron 주기(6시간) 이상이어야 매 실행마다 전체 재검색으로 검색 쿼터를 쓰지 않음 (STALE 이하로 유지)
+    TREND_PREFETCH_MAX_AGE_SECONDS: float = 6 * 3600
+
+    # Trend Archiver (검색 결과 아카이빙 큐: 최대 대기 수, 배치 크기, 배치 대기 시간, 종료 시 드레인 제한 시간)
+    TREND_ARCHIVE_QUEUE_SIZE: int = 1000
+    TREND_ARCHIVE_BATCH_SIZE: int = 50
+    TREND_ARCHIVE_FLUSH_SECONDS: float = 1.0
+    TREND_ARCHIVE_DRAIN_SECONDS: float = 10.0
+
+    # Trend Search (도메인 검색이 최근 지연 p분위를 넘기면 글로벌 검색을 병렬 시작, 전체 마감 시간, 초)
+    # TREND_SEARCH_HEDGE_PERCENTILE을 비우면 헤징 없이 기존처럼 순차 fallback
+    TREND_SEARCH_HEDGE_PERCENTILE: float | None = 0.9
+    TREND_SEARCH_HEDGE_DEFAULT_SECONDS: float = 4.0
+    TREND_SEARCH_DEADLINE_SECONDS: float = 12.0
+    TREND_SEARCH_WORKERS: int = 16
+
+    # Search Backend ("tavily": 실제 API / "record": 실제 API + 응답 기록 / "replay": 기록된 응답으로 오프라인 재생)
+    # replay 모드 지연: lognormal(중앙값, sigma) + tail 확률로 5~10초 지연, 실패 확률
+    SEARCH_BACKEND: str = "tavily"
+    SEARCH_FIXTURE_PATH: str = os.path.join(BACKEND_ROOT, ".cache", "search_fixtures.jsonl")
+    SEARCH_REPLAY_LATENCY_SECONDS: float = 0.0
+    SEARCH_REPLAY_LATENCY_SIGMA: float = 0.5
+    SEARCH_REPLAY_TAIL_RATE: float = 0.0
+    SEARCH_REPLAY_FAILURE_RATE: float = 0.0
+
+    # Archive-first Trend Search (아카이브 BM25 검색으로 충분하면 웹 검색 생략)
+    # 카테고리별 신선도 기준(시간): 뉴스는 짧게, 논문은 길게
+    TREND_ARCHIVE_FIRST: bool = True
+    TREND_ARCHIVE_FRESHNESS_HOURS: dict[str, float] = {
+        "tech_news": 24,
+        "engineering": 24 * 7,
+        "research": 24 * 30,
+        "k_blog": 24 * 14,
+    }
+    TREND_ARCHIVE_MIN_HITS: int = 3           # 이 개수 이상 매칭되어야 아카이브로 응답
+    TREND_ARCHIVE_MIN_COVERAGE: float = 0.6   # 문서가 포함해야 하는 쿼리 토큰 비율
+    TREND_ARCHIVE_INDEX_REFRESH_SECONDS: float = 60
+    TREND_ARCHIVE_INDEX_REBUILD_SECONDS: float = 3600
+
+    # Trend View Counter (조회수 메모리 집계 후 주기적으로 $inc 일괄 기록)
+    TREND_VIEW_SHARDS: int = 16
+    TREND_VIEW_FLUSH_SECONDS: float = 5.0
+    TREND_VIEW_TOP_N: int = 20
+    TREND_VIEW_TOP_REFRESH_SECONDS: float = 300   # 조회수 상위 목록 재계산 주기 (flush 주기와 별도)
+
     # .env 파일 로드 설정
     model_config = SettingsConfigDict(
         env_file=".env", 
@@ -0,0 +1,22 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+
+# Bounded pool for blocking work (embedding / search HTTP clients, file I/O, CPU-heavy index builds).
+# asyncio.to_thread uses the loop's default executor, which is shared with everything else in the process;
+# a dedicated pool caps how many tool calls can block at once without starving the event loop.
+TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.TOOL_EXECUTOR_WORKERS,
+    thread_name_prefix="tool-worker"
+)
+
+async def run_blocking(func, *args, **kwargs):
+    """Runs a blocking callable on TOOL_EXECUTOR and awaits its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(TOOL_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+def shutdown_executor():
+    """Shutdown hook: drops queued work, lets running calls finish in the background."""
+    TOOL_EXECUTOR.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,124 @@
+import time
+import threading
+from typing import Any, Callable, Optional
+
+from app.core.executor import run_blocking
+
+class LazyResource:
+    """
+    Single-flight lazy initializer shared by sync and async callers.
+    - 한 번에 하나의 호출자만 factory를 실행하고, 나머지는 완료될 때까지 기다립니다.
+    - is_stale(value)가 True이면 재빌드하며, 재빌드 중에는 기존 값을 계속 제공합니다.
+    - factory가 None을 반환하거나 예외를 던지면 'failed' 상태가 되고, retry_after초 후 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        is_stale: Optional[Callable[[Any], bool]] = None,
+        retry_after: float = 0.0,
+    ):
+        self.name = name
+        self._factory = factory
+        self._is_stale = is_stale
+        self._retry_after = retry_after
+        self._lock = threading.Lock()
+
+        self._value = None
+        self._state = "idle"  # idle -> loading -> ready | failed
+        self._error: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+        self.build_count = 0
+
+    # -----------------------------------------------------
+    # State
+    # -----------------------------------------------------
+    @property
+    def ready(self) -> bool:
+        return self._value is not None
+
+    def status(self) -> dict:
+        return {
+            "name": self.name,
+            "state": self._state,
+            "ready": self.ready,
+            "error": self._error,
+            "loaded_at": self._loaded_at,
+        }
+
+    def reset(self):
+        with self._lock:
+            self._value = None
+            self._state = "idle"
+            self._error = None
+            self._failed_at = None
+
+    # -----------------------------------------------------
+    # Access
+    # -----------------------------------------------------
+    def _usable(self, value) -> bool:
+        if value is None:
+            return False
+        if self._is_stale is None:
+            return True
+        try:
+            return not self._is_stale(value)
+        except Exception:
+            return True
+
+    def _in_backoff(self) -> bool:
+        return (
+            self._state == "failed"
+            and self._failed_at is not None
+            and time.monotonic() - self._failed_at < self._retry_after
+        )
+
+    def get(self):
+        """Returns the resource (or None if it cannot be built), building it at most once concurrently."""
+        value = self._value
+        if self._usable(value):
+            return value
+        if value is None and self._in_backoff():
+            return None
+
+        # Stale value available -> don't wait for another thread's rebuild
+        if not self._lock.acquire(blocking=value is None):
+            return value
+        try:
+            # Double-check: another caller may have finished while we waited
+            current = self._value
+            if self._usable(current):
+                return current
+            if current is None and self._in_backoff():
+                return None
+
+            self._state = "loading"
+            try:
+                built = self._factory()
+            except Exception as e:
+                built = None
+                self._error = str(e)
+                print(f"[Resource] Failed to initialize '{self.name}': {e}")
+
+            self.build_count += 1
+            if built is None:
+                self._state = "failed" if current is None else "ready"
+                self._failed_at = time.monotonic()
+                return current
+
+            self._value = built
+            self._state = "ready"
+            self._error = None
+            self._loaded_at = time.time()
+            return built
+        finally:
+            self._lock.release()
+
+    async def aget(self):
+        """Async variant: the fast path never leaves the event loop, builds run on the bounded tool executor."""
+        value = self._value
+        if self._usable(value):
+            return value
+        return await run_blocking(self.get)
@@ -0,0 +1,458 @@
+import re
+import json
+import heapq
+import time
+import asyncio
+import hashlib
+import threading
+from types import MappingProxyType
+
+# Database Connection
+from app.core.database import get_db
+from app.core.config import settings
+from app.core.executor import run_blocking
+
+# =========================================================
+# 1. Constants
+# =========================================================
+
+# sync_track_to_db.py가 동기화 후 버전 스탬프를 기록하는 문서
+CURRICULUM_META_COLLECTION = "meta"
+CURRICULUM_META_ID = "tracks"
+
+# 부분 일치 후보 검색용 문자 n-gram 크기
+SUBJECT_NGRAM_SIZE = 3
+
+# Track 이름 자동 보정 기준 (top score 이상 & 2위와의 격차 이상일 때만 확정)
+TRACK_AUTO_RESOLVE_SCORE = 0.8
+TRACK_AUTO_RESOLVE_MARGIN = 0.1
+# 후보로 노출할 최소 점수
+TRACK_CANDIDATE_MIN_SCORE = 0.35
+
+
+# =========================================================
+# 2. Build Helpers (tracks documents -> legacy dict)
+# =========================================================
+
+def build_tracks_dict(docs: list[dict]) -> dict:
+    """
+    Converts 'tracks' documents (sorted by 'order') to the legacy dictionary format.
+    tracks.json structure: Track -> {"description", "steps": {Step -> {Option -> {Subject -> Levels}}}}
+    """
+    tracks_dict = {}
+    for doc in docs:
+        # Use 'title' as the track key (e.g., "Track 0: The Origin")
+        track_name = doc.get("title")
+        if not track_name:
+            continue
+
+        # Reconstruct 'steps' dictionary from List[TrackStep]
+        steps_dict = {}
+        for step in doc.get("steps", []):
+            step_name = step.get("step_name")
+            step_desc = step.get("description", "")
+
+            # Reconstruct 'options' dictionary from List[TrackBranchOption]
+            options_dict = {}
+            for option in step.get("options", []):
+                option_name = option.get("option_name")
+                option_desc = option.get("description", "")
+
+                # Reconstruct 'subjects' dictionary from List[TrackSubject]
+                subjects_dict = {}
+                for subject in option.get("subjects", []):
+                    subject_title = subject.get("title")
+                    subject_desc = subject.get("description", "")
+
+                    # levels is a nested dict or object (LevelsContent)
+                    levels = subject.get("levels", {})
+
+                    # tracks.json structure: "SubjectName": { "description": "...", "Lv1": [...] }
+                    formatted_subject_data = {
+                        "Lv1": levels.get("Lv1", []),
+                        "Lv2": levels.get("Lv2", []),
+                        "Lv3": levels.get("Lv3", [])
+                    }
+                    if subject_desc:
+                        formatted_subject_data["description"] = subject_desc
+
+                    subjects_dict[subject_title] = formatted_subject_data
+
+                # tracks.json structure: "OptionName": { "description": "...", "Subject1": ... }
+                options_dict[option_name] = subjects_dict
+                if option_desc:
+                    options_dict[option_name]["description"] = option_desc
+
+            # Same for Step
+            steps_dict[step_name] = options_dict
+            if step_desc:
+                steps_dict[step_name]["description"] = step_desc
+
+        tracks_dict[track_name] = {
+            "description": doc.get("description", ""),
+            "steps": steps_dict
+        }
+
+    return tracks_dict
+
+def compute_curriculum_version(tracks: dict) -> str:
+    """Content hash of the curriculum (stable across processes)."""
+    payload = json.dumps(tracks, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+# =========================================================
+# 3. SubjectIndex (Inverted Index)
+# =========================================================
+
+def _char_ngrams(text: str, n: int = SUBJECT_NGRAM_SIZE) -> set[str]:
+    """Character n-grams of an already lower-cased string."""
+    if len(text) < n:
+        return set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+class SubjectIndex:
+    """
+    Precomputed lookup tables for f_get_techtree_subject.
+    - records : normalized name -> {"subject", "track", ("category"), "details"}  (exact hit, O(1))
+    - postings: char n-gram -> subject/option names                           (partial hit candidates)
+    Options are indexed too, matching the legacy step -> option -> subject walk.
+    """
+    __slots__ = ("records", "names", "_postings")
+
+    def __init__(self, tracks: dict):
+        self.records = {}
+        self.names = set()
+        self._postings = {}
+
+        for track_name, track_val in tracks.items():
+            for step_val in track_val.get("steps", {}).values():
+                for key, val in step_val.items():
+                    if not isinstance(val, dict):
+                        continue
+                    # Level 1 (Option, or a direct Subject)
+                    self._add(key, {"subject": key, "track": track_name, "details": val})
+
+                    # Group/Option Nested
+                    if "Lv1" not in val:
+                        for sub_key, sub_val in val.items():
+                            if isinstance(sub_val, dict):
+                                self._add(sub_key, {"subject": sub_key, "track": track_name, "category": key, "details": sub_val})
+
+    def _add(self, name: str, record: dict):
+        lowered = name.lower()
+        # First occurrence wins (tracks are in 'order' sequence)
+        self.records.setdefault(lowered, record)
+        if name in self.names:
+            return
+        self.names.add(name)
+        for gram in _char_ngrams(lowered):
+            self._postings.setdefault(gram, set()).add(name)
+
+    def lookup(self, subject_name: str) -> dict | None:
+        """Exact (case-insensitive) match. Returns a copy of the record."""
+        record = self.records.get(subject_name.lower().strip())
+        return dict(record) if record else None
+
+    def candidates(self, subject_name: str) -> list[str]:
+        """
+        Names containing the query, sorted.
+        Intersects n-gram postings (rarest first) and verifies the substring on the survivors.
+        """
+        query = subject_name.lower().strip()
+        grams = _char_ngrams(query)
+        if grams:
+            postings = sorted((self._postings.get(g, set()) for g in grams), key=len)
+            pool = set(postings[0])
+            for posting in postings[1:]:
+                if not pool:
+                    break
+                pool &= posting
+        else:
+            # Query shorter than n-gram size: scan distinct names
+            pool = self.names
+        return sorted(name for name in pool if query in name.lower())
+
+
+def collect_concepts(tracks: dict) -> list[dict]:
+    """
+    Flattens every Lv1/Lv2/Lv3 concept with a pointer back to its subject, level and track.
+    e.g. {"concept": "JSON 요청과 응답 구조 이해", "level": "Lv1", "subject": "FastAPI Essentials", ...}
+    """
+    concepts = []
+    for track_name, track_val in tracks.items():
+        for step_val in track_val.get("steps", {}).values():
+            for option_key, option_val in step_val.items():
+                if not isinstance(option_val, dict):
+                    continue
+                # Direct Subject or Option -> Subjects
+                if "Lv1" in option_val:
+                    subjects = [(option_key, option_val, None)]
+                else:
+                    subjects = [(k, v, option_key) for k, v in option_val.items() if isinstance(v, dict)]
+
+                for subject_name, subject_val, category in subjects:
+                    for level in ("Lv1", "Lv2", "Lv3"):
+                        for concept in subject_val.get(level, []):
+                            concepts.append({
+                                "concept": concept,
+                                "level": level,
+                                "subject": subject_name,
+                                "category": category,
+                                "track": track_name,
+                            })
+    return concepts
+
+
+# =========================================================
+# 4. TrackMatcher (Ranked Fuzzy Track Resolution)
+# =========================================================
+
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+_NUMBER = re.compile(r"\d+")
+
+def _normalize_title(text: str) -> str:
+    """'Track 1: AI Engineer' -> 'track 1 ai engineer'"""
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+def _levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+def _numbers_conflict(query: str, alias: str) -> bool:
+    """'track 10' vs 'track 1 ...': both name a track number and the numbers differ."""
+    query_numbers, alias_numbers = set(_NUMBER.findall(query)), set(_NUMBER.findall(alias))
+    return bool(query_numbers and alias_numbers and query_numbers != alias_numbers)
+
+def _containment(query: str, alias: str) -> float:
+    """Boost when one side is a whole-token run of the other ('engineer' in 'ai engineer', not 'track1' in 'track10')."""
+    shorter, longer = sorted((query, alias), key=len)
+    if len(shorter) >= 2 and f" {shorter} " in f" {longer} ":
+        return 0.6 + 0.4 * len(shorter) / len(longer)
+    return 0.0
+
+def _similarity(query: str, query_grams: set[str], alias: str, alias_grams: set[str]) -> float:
+    """Blend of trigram Dice and normalized edit distance, boosted for token containment."""
+    if query == alias:
+        return 1.0
+    if not query or not alias or _numbers_conflict(query, alias):
+        return 0.0
+
+    dice = 0.0
+    if query_grams and alias_grams:
+        dice = 2 * len(query_grams & alias_grams) / (len(query_grams) + len(alias_grams))
+    edit = 1 - _levenshtein(query, alias) / max(len(query), len(alias))
+    return max((dice + edit) / 2, _containment(query, alias))
+
+class TrackMatcher:
+    """
+    Precomputed aliases for each track title (full title, 'Track N', role names),
+    in spaced and compact ('track1aiengineer') forms, with their padded trigrams.
+    rank() bounds every alias from trigram postings and length difference first,
+    and runs the edit distance only where the bound can still beat the best score of that track.
+    """
+    __slots__ = ("_aliases", "_postings")
+
+    def __init__(self, track_names):
+        self._aliases = []
+        self._postings = {}
+        for title in track_names:
+            normalized = _normalize_title(title)
+            forms = {normalized}
+            if ":" in title:
+                prefix, role = title.split(":", 1)
+                forms.update({_normalize_title(prefix), _normalize_title(role)})
+                # 'AI Modeler / Researcher' -> 'ai modeler', 'researcher'
+                forms.update(_normalize_title(part) for part in role.split("/"))
+            for form in forms:
+                for variant in {form, form.replace(" ", "")}:
+                    if variant:
+                        grams = _char_ngrams(f" {variant} ")
+                        for gram in grams:
+                            self._postings.setdefault(gram, []).append(len(self._aliases))
+                        self._aliases.append((title, variant, grams))
+
+    def _bounded(self, variant: str, grams: set[str]) -> list[tuple[float, int]]:
+        """(upper bound of _similarity, alias id) for aliases that can reach the candidate threshold."""
+        shared = {}
+        for gram in grams:
+            for alias_id in self._postings.get(gram, ()):
+                shared[alias_id] = shared.get(alias_id, 0) + 1
+
+        bounded = []
+        for alias_id, (_, alias, alias_grams) in enumerate(self._aliases):
+            common = shared.get(alias_id, 0)
+            dice = 2 * common / (len(grams) + len(alias_grams)) if grams and alias_grams else 0.0
+            # Lower bounds of the edit distance: the length difference, and one edit changes at most 3 trigrams
+            min_edits = max(
+                abs(len(variant) - len(alias)),
+                -(-(len(grams) - common) // 3),
+                -(-(len(alias_grams) - common) // 3)
+            )
+            edit_bound = 1 - min_edits / max(len(variant), len(alias), 1)
+            bound = 1.0 if variant == alias else max((dice + edit_bound) / 2, _containment(variant, alias))
+            if bound >= TRACK_CANDIDATE_MIN_SCORE:
+                bounded.append((bound, alias_id))
+        return bounded
+
+    def rank(self, query: str, limit: int = 5) -> list[tuple[str, float]]:
+        """Tracks ordered by their best alias score (score >= TRACK_CANDIDATE_MIN_SCORE)."""
+        normalized = _normalize_title(query)
+        variants = {normalized, normalized.replace(" ", "")}
+
+        candidates = []
+        for variant in variants:
+            grams = _char_ngrams(f" {variant} ")
+            candidates.extend((bound, alias_id, variant, grams) for bound, alias_id in self._bounded(variant, grams))
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+
+        best = {}
+        for bound, alias_id, variant, grams in candidates:
+            # Nothing below the current top 'limit' scores can enter (or change) the result
+            if len(best) >= limit and bound <= heapq.nlargest(limit, best.values())[-1]:
+                break
+            title, alias, alias_grams = self._aliases[alias_id]
+            if bound <= best.get(title, 0.0):
+                continue
+            score = _similarity(variant, grams, alias, alias_grams)
+            if score > best.get(title, 0.0):
+                best[title] = score
+
+        ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+        return [(title, round(score, 3)) for title, score in ranked if score >= TRACK_CANDIDATE_MIN_SCORE][:limit]
+
+    @staticmethod
+    def confident_match(ranked: list[tuple[str, float]]) -> str | None:
+        """Returns the top track of rank() only when it is a confident, unambiguous match."""
+        if not ranked:
+            return None
+        top_title, top_score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if top_score >= TRACK_AUTO_RESOLVE_SCORE and top_score - runner_up >= TRACK_AUTO_RESOLVE_MARGIN:
+            return top_title
+        return None
+
+    def resolve(self, query: str) -> str | None:
+        return self.confident_match(self.rank(query, limit=2))
+
+
+# =========================================================
+# 5. CurriculumIndex
+# =========================================================
+
+class CurriculumIndex:
+    """
+    Immutable, process-wide snapshot of the 'tracks' collection.
+    Built once and shared by every f_get_techtree_* call until the version stamp changes.
+    NOTE: Nested dicts are shared between callers. Treat them as read-only.
+    """
+    __slots__ = ("tracks", "version", "source_stamp", "built_at", "subjects", "track_matcher", "concepts")
+
+    def __init__(self, tracks: dict, source_stamp: str | None = None):
+        self.tracks = MappingProxyType(tracks)
+        self.version = compute_curriculum_version(tracks)
+        self.subjects = SubjectIndex(tracks)
+        self.track_matcher = TrackMatcher(tracks.keys())
+        self.concepts = tuple(collect_concepts(tracks))
+        # Stamp observed in DB at build time (meta version or latest 'last_updated')
+        self.source_stamp = source_stamp
+        self.built_at = time.monotonic()
+
+    @property
+    def track_names(self) -> list[str]:
+        return list(self.tracks.keys())
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+
+# Global instance (Lazy Loaded)
+_CURRICULUM_INDEX: CurriculumIndex | None = None
+_LAST_VERSION_CHECK = 0.0
+_INDEX_LOCK = threading.Lock()
+
+def get_curriculum_index() -> CurriculumIndex:
+    """
+    Returns the current snapshot without touching the DB (sync callers: tool worker threads, resource builders).
+    aget_curriculum_index() loads it and keeps it fresh; before the first load an empty index is returned.
+    """
+    index = _CURRICULUM_INDEX
+    return index if index is not None else CurriculumIndex({})
+
+
+# ---------------------------------------------------------
+# Loading (Motor)
+# ---------------------------------------------------------
+
+# In-flight refresh shared by concurrent coroutines (single-flight per event loop)
+_REFRESH_TASK: asyncio.Task | None = None
+
+async def _aread_source_stamp(db) -> str | None:
+    """
+    Reads the cheap version stamp of the tracks collection.
+    1) meta.tracks.version (written by sync_track_to_db.py)
+    2) Fallback: latest 'last_updated' among tracks
+    """
+    meta = await db[CURRICULUM_META_COLLECTION].find_one({"_id": CURRICULUM_META_ID})
+    if meta and meta.get("version"):
+        return str(meta["version"])
+
+    latest = await db["tracks"].find_one({}, {"last_updated": 1}, sort=[("last_updated", -1)])
+    if latest and latest.get("last_updated"):
+        return str(latest["last_updated"])
+    return None
+
+async def _arefresh_index(index: CurriculumIndex | None) -> CurriculumIndex:
+    """Reads the stamp and, only if it changed, the full collection. Index compilation runs off the loop."""
+    global _CURRICULUM_INDEX, _LAST_VERSION_CHECK
+    try:
+        db = get_db()
+        stamp = await _aread_source_stamp(db)
+        if index is not None and stamp == index.source_stamp:
+            return index
+
+        docs = [doc async for doc in db["tracks"].find({}).sort("order", 1)]
+        rebuilt = await run_blocking(CurriculumIndex, build_tracks_dict(docs), stamp)
+        with _INDEX_LOCK:
+            _CURRICULUM_INDEX = rebuilt
+            _LAST_VERSION_CHECK = time.monotonic()
+        return rebuilt
+    except Exception as e:
+        print(f"Error loading track data from MongoDB: {e}")
+        return index if index is not None else CurriculumIndex({})
+
+async def aget_curriculum_index() -> CurriculumIndex:
+    """
+    Returns the compiled curriculum index, rebuilding it only when the version stamp changed
+    (the stamp is read at most once per CURRICULUM_VERSION_CHECK_SECONDS).
+    Concurrent callers share one in-flight refresh. On load failure the current (or an empty) index is returned.
+    """
+    global _REFRESH_TASK, _LAST_VERSION_CHECK
+    index = _CURRICULUM_INDEX
+    now = time.monotonic()
+    if index is not None and now - _LAST_VERSION_CHECK < settings.CURRICULUM_VERSION_CHECK_SECONDS:
+        return index
+
+    task = _REFRESH_TASK
+    loop = asyncio.get_running_loop()
+    if task is None or task.done() or task.get_loop() is not loop:
+        if index is not None:
+            _LAST_VERSION_CHECK = now
+        task = _REFRESH_TASK = loop.create_task(_arefresh_index(index))
+    # shield: a cancelled caller must not cancel the refresh other callers are waiting on
+    return await asyncio.shield(task)
+
+def invalidate_curriculum_index():
+    """Reload hook: drops the cached snapshot so the next call rebuilds it."""
+    global _CURRICULUM_INDEX, _LAST_VERSION_CHECK, _REFRESH_TASK
+    with _INDEX_LOCK:
+        _CURRICULUM_INDEX = None
+        _LAST_VERSION_CHECK = 0.0
+        _REFRESH_TASK = None
@@ -0,0 +1,88 @@
+import math
+import zlib
+import hashlib
+import numpy as np
+from collections import Counter
+from typing import Protocol
+
+# =========================================================
+# Embedding Providers
+# - "openai": OpenAIEmbeddings (network, text-embedding-3-small)
+# - "local" : 해시 기반 문자 n-gram TF-IDF (NumPy, 네트워크 불필요, 결정적)
+# 두 구현 모두 embed_documents / embed_query / model_name 인터페이스를 따릅니다.
+# =========================================================
+
+class EmbeddingProvider(Protocol):
+    """
+    Structural interface of every embedding backend (LangChain Embeddings compatible, duck-typed:
+    OpenAIEmbeddings satisfies it without subclassing).
+    'model_name' identifies the vector space, so stores/caches never mix vectors of different providers.
+    """
+    model_name: str = ""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]: ...
+
+    def embed_query(self, text: str) -> list[float]: ...
+
+
+class LocalHashingEmbeddings(EmbeddingProvider):
+    """
+    Deterministic offline embeddings.
+    1) character n-grams (per word, padded) -> sublinear TF x IDF (IDF fitted on the curriculum corpus)
+    2) signed feature hashing (crc32) projects the sparse vector onto 'dim' dense float32 dimensions
+    """
+
+    def __init__(self, dim: int = 256, ngram_range: tuple[int, int] = (2, 4), corpus: list[str] | None = None):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self._idf = {}
+        self._default_idf = 1.0
+        self.model_name = f"local-hash-{dim}"
+        if corpus:
+            self.fit(corpus)
+
+    def _ngrams(self, text: str) -> list[str]:
+        grams = []
+        low, high = self.ngram_range
+        for word in text.lower().split():
+            padded = f" {word} "
+            for n in range(low, high + 1):
+                grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+        return grams
+
+    def fit(self, corpus: list[str]) -> "LocalHashingEmbeddings":
+        """Fits IDF weights. The fitted corpus is part of model_name (different IDF = different space)."""
+        df = Counter()
+        for text in corpus:
+            df.update(set(self._ngrams(text)))
+        n_docs = len(corpus)
+        self._idf = {gram: math.log((1 + n_docs) / (1 + count)) + 1.0 for gram, count in df.items()}
+        self._default_idf = math.log(1 + n_docs) + 1.0
+
+        digest = hashlib.sha1("\n".join(sorted(corpus)).encode("utf-8")).hexdigest()[:8]
+        self.model_name = f"local-hash-{self.dim}-{digest}"
+        return self
+
+    def _bucket(self, gram: str) -> tuple[int, float]:
+        # crc32 is stable across processes (unlike the salted built-in hash())
+        h = zlib.crc32(gram.encode("utf-8"))
+        return h % self.dim, (1.0 if (h >> 16) & 1 else -1.0)
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for gram, count in Counter(self._ngrams(text)).items():
+            bucket, sign = self._bucket(gram)
+            vector[bucket] += sign * (1.0 + math.log(count)) * self._idf.get(gram, self._default_idf)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self._embed(text).tolist() for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text).tolist()
+
+
+def embedding_model_name(model, default: str) -> str:
+    """Vector-space identifier of an embedding backend (LangChain models expose 'model')."""
+    return getattr(model, "model_name", None) or getattr(model, "model", None) or default
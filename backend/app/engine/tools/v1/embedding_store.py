@@ -0,0 +1,199 @@
+import os
+import re
+import json
+import hashlib
+import numpy as np
+
+from app.core.config import settings
+
+# =========================================================
+# Persistent Embedding Store (Shared across processes)
+# - vectors : <name>.<model>.<digest>.npy  (float32 matrix, memory-mapped read-only)
+# - sidecar : <name>.<model>.json          (model, dim, [{key, hash}] row index, current npy file)
+# API / MCP / Worker 프로세스가 같은 파일을 공유하며, 변경된 텍스트만 다시 임베딩합니다.
+# 모델별로 파일을 나누므로 다른 임베딩 모델을 쓰는 프로세스끼리 서로의 벡터를 덮어쓰거나 지우지 않습니다.
+# =========================================================
+
+def content_hash(text: str) -> str:
+    """Hash of the embedded text. Rows are reused whenever the text is unchanged."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def _model_slug(model_name: str) -> str:
+    """File-name safe model name (e.g. 'BAAI/bge-m3' -> 'BAAI_bge-m3')."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+
+
+class EmbeddingStore:
+    """
+    On-disk vector store keyed by content hash.
+    Writers publish a new immutable .npy file and then atomically swap the sidecar,
+    so readers never observe a half-written matrix.
+    """
+
+    def __init__(self, name: str, directory: str | None = None):
+        self.name = name
+        self._directory = directory
+
+    @property
+    def directory(self) -> str:
+        # Resolved per call so settings.EMBEDDING_STORE_DIR can be changed at runtime (tests, scripts)
+        return self._directory or settings.EMBEDDING_STORE_DIR
+
+    def sidecar_path(self, model_name: str) -> str:
+        return os.path.join(self.directory, f"{self.name}.{_model_slug(model_name)}.json")
+
+    def _read_sidecar(self, model_name: str) -> dict:
+        with open(self.sidecar_path(model_name), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    # -----------------------------------------------------
+    # Read
+    # -----------------------------------------------------
+    def load(self, model_name: str) -> tuple[list[dict], np.ndarray | None]:
+        """
+        Returns (entries, matrix) for the given model, or ([], None) if nothing usable is stored.
+        The matrix is a read-only memory map shared with every other process.
+        """
+        try:
+            sidecar = self._read_sidecar(model_name)
+            if sidecar.get("model") != model_name:
+                return [], None
+
+            matrix = np.load(os.path.join(self.directory, sidecar["file"]), mmap_mode="r")
+            entries = sidecar.get("entries", [])
+            if matrix.shape[0] != len(entries):
+                return [], None
+            return entries, matrix
+        except FileNotFoundError:
+            return [], None
+        except Exception as e:
+            print(f"[EmbeddingStore] Failed to load '{self.name}': {e}")
+            return [], None
+
+    # -----------------------------------------------------
+    # Write
+    # -----------------------------------------------------
+    def _publish(self, model_name: str, entries: list[dict], matrix: np.ndarray):
+        if not entries:
+            # Never swap the shared store for an empty one (it would wipe every process's vectors)
+            raise ValueError("refusing to publish an empty store")
+        os.makedirs(self.directory, exist_ok=True)
+
+        digest = hashlib.sha1(
+            (model_name + "".join(e["hash"] for e in entries)).encode("utf-8")
+        ).hexdigest()[:16]
+        file_name = f"{self.name}.{_model_slug(model_name)}.{digest}.npy"
+        file_path = os.path.join(self.directory, file_name)
+
+        # 1. Immutable vector file (content-addressed, so concurrent writers produce the same bytes)
+        if not os.path.exists(file_path):
+            tmp_path = f"{file_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(matrix, dtype=np.float32))
+            os.replace(tmp_path, file_path)
+
+        # 2. Atomic sidecar swap
+        sidecar = {
+            "model": model_name,
+            "dim": int(matrix.shape[1]) if matrix.ndim == 2 else 0,
+            "file": file_name,
+            "entries": entries,
+        }
+        try:
+            superseded = self._read_sidecar(model_name).get("file")
+        except Exception:
+            superseded = None
+        tmp_sidecar = f"{self.sidecar_path(model_name)}.{os.getpid()}.tmp"
+        with open(tmp_sidecar, "w", encoding="utf-8") as f:
+            json.dump(sidecar, f, ensure_ascii=False)
+        os.replace(tmp_sidecar, self.sidecar_path(model_name))
+
+        # 3. Remove only the vector file this sidecar replaced (open memory maps stay valid on POSIX).
+        #    Files of other models / names are never touched.
+        if superseded and superseded != file_name:
+            try:
+                os.remove(os.path.join(self.directory, superseded))
+            except OSError:
+                pass
+
+    def sync(self, model, model_name: str, keys: list[str], texts: list[str]) -> tuple[list[str], np.ndarray]:
+        """
+        Returns (keys, matrix) for the given texts.
+        Only texts whose hash is not already stored are sent to model.embed_documents().
+        An empty text list (e.g. the curriculum failed to load) leaves the stored vectors untouched.
+        """
+        if not texts:
+            return keys, np.zeros((0, 0), dtype=np.float32)
+
+        hashes = [content_hash(text) for text in texts]
+        entries, stored = self.load(model_name)
+        row_by_hash = {entry["hash"]: i for i, entry in enumerate(entries)}
+
+        missing = [i for i, h in enumerate(hashes) if h not in row_by_hash]
+        if not missing and [e["key"] for e in entries] == keys and [e["hash"] for e in entries] == hashes:
+            # Fast path: stored matrix already matches row-for-row
+            return keys, stored
+
+        new_vectors = {}
+        if missing:
+            print(f"[EmbeddingStore] Embedding {len(missing)}/{len(texts)} changed entries for '{self.name}'.")
+            vectors = model.embed_documents([texts[i] for i in missing])
+            new_vectors = {hashes[i]: np.asarray(v, dtype=np.float32) for i, v in zip(missing, vectors)}
+
+        rows = []
+        for h in hashes:
+            if h in new_vectors:
+                rows.append(new_vectors[h])
+            else:
+                rows.append(np.asarray(stored[row_by_hash[h]], dtype=np.float32))
+        matrix = np.vstack(rows) if rows else np.zeros((0, 0), dtype=np.float32)
+
+        new_entries = [{"key": k, "hash": h} for k, h in zip(keys, hashes)]
+        try:
+            self._publish(model_name, new_entries, matrix)
+            # Re-open as a shared memory map (unless another process swapped in a different layout)
+            published_entries, published = self.load(model_name)
+            if published is not None and published_entries == new_entries:
+                matrix = published
+        except Exception as e:
+            # Read-only filesystem etc. -> keep the in-memory result
+            print(f"[EmbeddingStore] Failed to persist '{self.name}': {e}")
+        return keys, matrix
+
+
+class VectorIndex:
+    """
+    Pre-normalized, contiguous float32 matrix for cosine top-k search.
+    One matrix-vector product scores every row, so it scales to thousands of tracks/sub-tracks.
+    """
+    __slots__ = ("keys", "matrix")
+
+    def __init__(self, keys: list[str], vectors):
+        matrix = np.array(vectors, dtype=np.float32, copy=True)
+        if matrix.ndim != 2:
+            matrix = matrix.reshape(len(keys), -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.keys = list(keys)
+        self.matrix = np.ascontiguousarray(matrix / norms)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def top_k(self, query_vector, k: int = 3) -> list[tuple[str, float]]:
+        """Returns [(key, cosine score), ...] in descending score order."""
+        if not self.keys:
+            return []
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        scores = self.matrix @ (query / norm)
+        k = min(k, len(self.keys))
+        if k < len(self.keys):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(self.keys))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.keys[i], float(scores[i])) for i in top]
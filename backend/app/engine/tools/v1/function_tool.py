@@ -1,126 +1,103 @@
 import os
 import json
-import threading
-import numpy as np
+import asyncio
 from datetime import datetime
 from urllib.parse import urlparse
 from langchain_openai import OpenAIEmbeddings
-from tavily import TavilyClient
 
-# Database Connection
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.resource import LazyResource
+from app.core.executor import run_blocking
+from app.engine.tools.v1.curriculum_index import get_curriculum_index, aget_curriculum_index
+from app.engine.tools.v1.embedding_store import EmbeddingStore, VectorIndex
+from app.engine.tools.v1.embedding_provider import LocalHashingEmbeddings, embedding_model_name
+from app.engine.tools.v1.trend_cache import TREND_SEARCH_CACHE, trend_cache_key
+from app.engine.tools.v1.trend_archiver import TREND_ARCHIVER
+from app.engine.tools.v1.search_client import SearchClient, create_search_client, TREND_SEARCH
+from app.engine.tools.v1.trend_search_index import TREND_ARCHIVE_SEARCH
+from app.engine.tools.v1.simhash import simhash, to_int64, collapse_near_duplicates
 
 # =========================================================
 # 1. Global Setup & Utilities
 # =========================================================
 
-# Global instances (Lazy Loaded)
-EMBEDDING_MODEL = None
-TAVILY_CLIENT = None
-TRACK_EMBEDDINGS = {} 
+EMBEDDING_MODEL_NAME = "text-embedding-3-small"
+
+# 추천 결과에 함께 반환할 트랙 수 (best + alternatives)
+TRACK_SEARCH_TOP_K = 3
+
+# Concept 시맨틱 검색: 후보 수 / 과목으로 바로 안내할 최소 유사도
+CONCEPT_SEARCH_TOP_K = 5
+CONCEPT_MATCH_MIN_SCORE = 0.4
+
+# Track vectors persisted on disk, shared read-only by API / MCP / worker processes
+TRACK_EMBEDDING_STORE = EmbeddingStore("track_vectors")
+
+# Query vectors keyed by (embedding model name, normalized sorted interest list)
+QUERY_EMBEDDING_CACHE = TTLCache(
+    maxsize=settings.QUERY_EMBEDDING_CACHE_SIZE,
+    ttl=settings.QUERY_EMBEDDING_CACHE_TTL_SECONDS
+)
+
+# Static source data (backend/app/source)
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "source")
+
+def _create_embedding_model():
+    """
+    Embedding Model factory (Track / Concept Search).
+    settings.EMBEDDING_PROVIDER selects the backend: "openai" (default) or "local" (offline, deterministic).
+    """
+    if settings.EMBEDDING_PROVIDER == "local":
+        # IDF is fitted on the curriculum itself, so the model follows the curriculum version
+        index = get_curriculum_index()
+        corpus = _track_texts(index)[1] + _concept_texts(index)[1]
+        model = LocalHashingEmbeddings(dim=settings.LOCAL_EMBEDDING_DIM, corpus=corpus)
+        model.curriculum_version = index.version
+        return model
+
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OpenAI API Key not found.")
+    return OpenAIEmbeddings(model=EMBEDDING_MODEL_NAME, api_key=api_key)
+
+def _create_tavily_client():
+    """
+    Search client factory (behind the SearchClient interface).
+    settings.SEARCH_BACKEND selects the backend: "tavily" (default), "record" or "replay" (offline fixtures).
+    """
+    api_key = os.environ.get("TAVILY_API_KEY")
+    if not api_key and settings.SEARCH_BACKEND != "replay":
+        print("Warning: TAVILY_API_KEY not found.")
+        return None
+    return create_search_client(settings.SEARCH_BACKEND, api_key, settings.SEARCH_FIXTURE_PATH)
+
+# Global instances (Lazy Loaded, single-flight: one caller builds while the others wait)
+EMBEDDING_MODEL = LazyResource(
+    "embedding_model",
+    _create_embedding_model,
+    is_stale=lambda model: getattr(model, "curriculum_version", None) not in (None, get_curriculum_index().version),
+    retry_after=5.0
+)
+TAVILY_CLIENT = LazyResource("tavily_client", _create_tavily_client, retry_after=5.0)
 
 def _get_embedding_model():
     """Lazily initialize Embedding Model (Only for Track Search)."""
-    global EMBEDDING_MODEL
-    if EMBEDDING_MODEL is None:
-        try:
-             api_key = os.environ.get("OPENAI_API_KEY")
-             if not api_key:
-                 raise ValueError("OpenAI API Key not found.")
-             EMBEDDING_MODEL = OpenAIEmbeddings(model="text-embedding-3-small", api_key=api_key)
-        except Exception as e:
-            print(f"Failed to initialize embedding model: {e}")
-            return None
-    return EMBEDDING_MODEL
+    return EMBEDDING_MODEL.get()
+
+def _get_embedding_model_name(model) -> str:
+    return embedding_model_name(model, EMBEDDING_MODEL_NAME)
 
 def _get_tavily_client():
     """Lazily initialize Tavily Client."""
-    global TAVILY_CLIENT
-    if TAVILY_CLIENT is None:
-        try:
-            api_key = os.environ.get("TAVILY_API_KEY")
-            if api_key:
-                TAVILY_CLIENT = TavilyClient(api_key=api_key)
-            else:
-                print("Warning: TAVILY_API_KEY not found.")
-        except Exception as e:
-            print(f"Failed to initialize Tavily client: {e}")
-    return TAVILY_CLIENT
+    return TAVILY_CLIENT.get()
 
 def _load_track_data() -> dict:
     """
-    Loads track data from MongoDB and converts it to the legacy dictionary format.
-    Target Collection: tracks
+    Returns the curriculum in the legacy dictionary format from the in-process CurriculumIndex.
+    The snapshot is loaded (and re-read on a version change) by aget_curriculum_index() in the af_* entry points.
     """
-    try:
-        db = get_db()
-        # Sort by 'order' to maintain Track 0, 1, 2... sequence
-        cursor = db["tracks"].find({}).sort("order", 1)
-        
-        tracks_dict = {}
-        for doc in cursor:
-            # Use 'title' as the track key (e.g., "Track 0: The Origin")
-            track_name = doc.get("title") 
-            if not track_name: 
-                continue
-
-            # Reconstruct 'steps' dictionary from List[TrackStep]
-            steps_dict = {}
-            for step in doc.get("steps", []):
-                step_name = step.get("step_name")
-                step_desc = step.get("description", "")
-                
-                # Reconstruct 'options' dictionary from List[TrackBranchOption]
-                options_dict = {}
-                for option in step.get("options", []):
-                    option_name = option.get("option_name")
-                    option_desc = option.get("description", "")
-                    
-                    # Reconstruct 'subjects' dictionary from List[TrackSubject]
-                    subjects_dict = {}
-                    for subject in option.get("subjects", []):
-                        subject_title = subject.get("title")
-                        subject_desc = subject.get("description", "")
-                        
-                        # levels is a nested dict or object (LevelsContent)
-                        levels = subject.get("levels", {})
-                        
-                        # If description exists, add it to the subject dict as well (custom format for tool logic)
-                        # NOTE: The original logic expects levels dict here. 
-                        # To keep it compatible but carry description, we might need a wrapper or just rely on 'description' key if it's treated as a dict.
-                        # Ideally, tracks_json structure is: "SubjectName": { "description": "...", "Lv1": [...] }
-                        
-                        formatted_subject_data = {
-                            "Lv1": levels.get("Lv1", []),
-                            "Lv2": levels.get("Lv2", []),
-                            "Lv3": levels.get("Lv3", [])
-                        }
-                        if subject_desc:
-                            formatted_subject_data["description"] = subject_desc
-                            
-                        subjects_dict[subject_title] = formatted_subject_data
-                    
-                    # Same for Option, it needs to be a dict of Subjects but also carry its own description
-                    # tracks.json structure: "OptionName": { "description": "...", "Subject1": ... }
-                    options_dict[option_name] = subjects_dict
-                    if option_desc:
-                        options_dict[option_name]["description"] = option_desc
-                
-                # Same for Step
-                steps_dict[step_name] = options_dict
-                if step_desc:
-                    steps_dict[step_name]["description"] = step_desc
-            
-            tracks_dict[track_name] = {
-                "description": doc.get("description", ""),
-                "steps": steps_dict
-            }
-            
-        return tracks_dict
-
-    except Exception as e:
-        print(f"Error loading track data from MongoDB: {e}")
-        return {} 
+    return get_curriculum_index().tracks
 
 def _extract_domain(url: str) -> str:
     """Extracts simplified domain from URL."""
@@ -137,14 +114,6 @@ def _clean_text(text: str) -> str:
     text = text.replace("\n", " ").replace("\t", " ").replace("\r", " ")
     return " ".join(text.split())
 
-def _cosine_similarity(vec_a, vec_b):
-    """Calculates Cosine Similarity between two vectors."""
-    norm_a = np.linalg.norm(vec_a)
-    norm_b = np.linalg.norm(vec_b)
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return np.dot(vec_a, vec_b) / (norm_a * norm_b)
-
 
 # =========================================================
 # 2. Tool Logic: Survey (get_techtree_survey)
@@ -156,8 +125,7 @@ def f_get_techtree_survey() -> dict:
     Loads data from 'backend/app/source/surveys.json'.
     """
     try:
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        source_path = os.path.join(current_dir, "..", "source", "surveys.json")
+        source_path = os.path.join(SOURCE_DIR, "surveys.json")
         
         if not os.path.exists(source_path):
              return {"error": f"Survey file not found at {source_path}"}
@@ -178,19 +146,11 @@ def f_get_techtree_survey() -> dict:
 # 3. Tool Logic: Track Recommendation (get_techtree_track)
 # =========================================================
 
-def _initialize_track_embeddings():
-    """Lazily initializes embeddings for all tracks."""
-    if TRACK_EMBEDDINGS:
-        return
-    
-    model = _get_embedding_model()
-    if not model:
-        return
-
+def _track_texts(index) -> tuple[list[str], list[str]]:
+    """(track names, texts to embed) built from name, description and step names."""
     texts = []
     keys = []
-    ai_tech_tree = _load_track_data()
-    for track_name, track_data in ai_tech_tree.items():
+    for track_name, track_data in index.tracks.items():
         description = track_data.get("description", "")
         # Include Step names to enhance context
         steps_content = []
@@ -201,39 +161,121 @@ def _initialize_track_embeddings():
         full_text = f"{track_name}. {description}. Key Areas: {', '.join(steps_content)}"
         texts.append(full_text)
         keys.append(track_name)
-    
-    try:
-        embeddings = model.embed_documents(texts)
-        for key, vector in zip(keys, embeddings):
-            TRACK_EMBEDDINGS[key] = vector
-    except Exception as e:
-        print(f"Error generating embeddings: {e}")
+    return keys, texts
 
-def perform_search_similarity(query_text: str) -> dict:
-    """Finds best matching track using embedding similarity."""
-    _initialize_track_embeddings()
-    if not TRACK_EMBEDDINGS:
-         return {"error": "Failed to initialize embeddings."}
-         
+def _build_track_vectors():
+    """
+    Loads embeddings for all tracks from the on-disk store.
+    Only tracks whose text changed since the last run are re-embedded.
+    Returns (curriculum version, VectorIndex), or None if the model or the curriculum is unavailable.
+    """
+    index = get_curriculum_index()
+    model = _get_embedding_model()
+    if not model or not index.tracks:
+        return None
+
+    keys, texts = _track_texts(index)
+    keys, matrix = TRACK_EMBEDDING_STORE.sync(model, _get_embedding_model_name(model), keys, texts)
+    # Published as a whole: callers never observe a half-filled index
+    return index.version, VectorIndex(keys, matrix)
+
+# VectorIndex over all track embeddings, rebuilt when the curriculum version changes
+TRACK_VECTORS = LazyResource(
+    "track_vectors",
+    _build_track_vectors,
+    is_stale=lambda value: value[0] != get_curriculum_index().version,
+    retry_after=5.0
+)
+
+def _get_track_vector_index() -> VectorIndex | None:
+    value = TRACK_VECTORS.get()
+    return value[1] if value else None
+
+def tool_resources_status() -> list[dict]:
+    """Readiness of the lazily initialized tool resources (for health checks)."""
+    resources = [EMBEDDING_MODEL, TAVILY_CLIENT, TRACK_VECTORS, CONCEPT_VECTORS]
+    return [resource.status() for resource in resources]
+
+def _normalize_interests(interests: list[str]) -> tuple[str, ...]:
+    """Cache key: lower-cased, de-duplicated, sorted interest keywords."""
+    return tuple(sorted({k.lower().strip() for k in interests if k and k.strip()}))
+
+def _get_query_vector(interests: list[str]):
+    """Returns the query embedding for the interests, served from QUERY_EMBEDDING_CACHE when possible."""
     model = _get_embedding_model()
     if not model:
-        return {"error": "Embedding model not initialized."}
+        raise ValueError("Embedding model not initialized.")
+
+    normalized = _normalize_interests(interests)
+    key = (_get_embedding_model_name(model), normalized)
+    vector = QUERY_EMBEDDING_CACHE.get(key)
+    if vector is not None:
+        return vector
+
+    vector = model.embed_query(" ".join(normalized))
+    QUERY_EMBEDDING_CACHE.set(key, vector)
+    return vector
+
+def prewarm_query_cache() -> int:
+    """
+    Pre-embeds every interest option in surveys.json (single batch call),
+    so the survey -> get_techtree_track path needs no embedding round trip.
+    Returns the number of newly cached queries.
+    """
+    model = _get_embedding_model()
+    if not model:
+        return 0
+    model_name = _get_embedding_model_name(model)
+
+    survey = f_get_techtree_survey()
+    keys = set()
+    for question in survey.get("questions", []):
+        for option in question.get("options", []):
+            interests = option.get("value", {}).get("interest")
+            if interests:
+                keys.add((model_name, _normalize_interests(interests)))
+
+    missing = [key for key in keys if QUERY_EMBEDDING_CACHE.get(key) is None]
+    if not missing:
+        return 0
+
+    try:
+        vectors = model.embed_documents([" ".join(normalized) for _, normalized in missing])
+    except Exception as e:
+        print(f"Error pre-warming query embeddings: {e}")
+        return 0
+    for key, vector in zip(missing, vectors):
+        QUERY_EMBEDDING_CACHE.set(key, vector)
+    return len(missing)
+
+def warm_up_tool_resources():
+    """Startup hook: loads track embeddings and pre-warms the query cache (blocking, run off the event loop)."""
+    TRACK_VECTORS.get()
+    CONCEPT_VECTORS.get()
+    warmed = prewarm_query_cache()
+    print(f"[Warmup] Track/Concept vectors ready, {warmed} survey queries pre-embedded.")
+
+def perform_search_similarity(interests: list[str], top_k: int = TRACK_SEARCH_TOP_K) -> dict:
+    """Finds the top-k matching tracks using embedding similarity (single matrix-vector product)."""
+    track_vectors = _get_track_vector_index()
+    if not track_vectors:
+         return {"error": "Failed to initialize embeddings."}
 
     try:
-        query_vector = model.embed_query(query_text)
+        query_vector = _get_query_vector(interests)
     except Exception as e:
         return {"error": f"Embedding generation failed: {e}"}
     
-    best_track = None
-    best_score = -1.0
-    
-    for track_name, track_vector in TRACK_EMBEDDINGS.items():
-        score = _cosine_similarity(query_vector, track_vector)
-        if score > best_score:
-            best_score = score
-            best_track = track_name
-            
-    return {"best_track": best_track, "score": best_score}
+    ranked = track_vectors.top_k(query_vector, top_k)
+    if not ranked:
+        return {"best_track": None, "score": -1.0, "matches": []}
+
+    best_track, best_score = ranked[0]
+    return {
+        "best_track": best_track,
+        "score": best_score,
+        "matches": [{"track_name": name, "score": score} for name, score in ranked]
+    }
 
 def f_get_techtree_track(interests: list[str], experience_level: str) -> dict:
     """
@@ -253,8 +295,7 @@ def f_get_techtree_track(interests: list[str], experience_level: str) -> dict:
         return {"available_tracks": all_tracks, "message": "Here are all the available AI Tech Tracks."}
 
     # 1. Semantic Search
-    query_text = " ".join(interests)
-    result = perform_search_similarity(query_text)
+    result = perform_search_similarity(interests)
     
     if "error" in result:
         return result
@@ -289,7 +330,11 @@ def f_get_techtree_track(interests: list[str], experience_level: str) -> dict:
             "description": track_info.get("description", ""),
             "matching_score": round(float(best_score), 2),
             "reason": f"Your interests in '{', '.join(interests)}' match this track's focus on {track_info.get('description', '')}.",
-            "track_content": track_summary # Replaced starting_point with rich content
+            "track_content": track_summary, # Replaced starting_point with rich content
+            "alternatives": [
+                {"track_name": match["track_name"], "matching_score": round(float(match["score"]), 2)}
+                for match in result.get("matches", [])[1:]
+            ]
         }
     else:
         return {"error": "No suitable track found."}
@@ -304,13 +349,23 @@ def f_get_techtree_path(track_name: str) -> dict:
     Main logic for 'get_ai_path'.
     Retrieves and structures the full roadmap for a specific track.
     """
-    ai_tech_tree = _load_track_data()
+    index = get_curriculum_index()
+    ai_tech_tree = index.tracks
     track_data = ai_tech_tree.get(track_name)
+    resolved_from = None
     
     if not track_data:
-        # 1. Fuzzy Search for Candidates
-        all_tracks = list(ai_tech_tree.keys())
-        matches = [t for t in all_tracks if track_name.lower() in t.lower() or t.lower() in track_name.lower()]
+        # 1. Ranked Fuzzy Search (trigram + edit distance over track titles)
+        ranked = index.track_matcher.rank(track_name)
+        resolved_name = index.track_matcher.confident_match(ranked)
+        if resolved_name:
+            # Confident match -> answer directly so the agent skips a retry round trip
+            resolved_from = track_name
+            track_name = resolved_name
+            track_data = ai_tech_tree[resolved_name]
+
+    if not track_data:
+        matches = [name for name, _ in ranked]
         
         if matches:
              return {
@@ -383,65 +438,105 @@ def f_get_techtree_path(track_name: str) -> dict:
                         }
                          roadmap_structure[step_name].append(subject_info)
     
-    return {
+    result = {
         "track": track_name,
         "description": track_data.get("description"),
         "roadmap": roadmap_structure,
         "note": "Use 'get_techtree_detail' for specific subject details."
     }
+    if resolved_from:
+        result["resolved_from"] = resolved_from
+    return result
 
 
 # =========================================================
 # 5. Tool Logic: Subject Details (get_techtree_subject)
 # =========================================================
 
+def _concept_texts(index) -> tuple[list[str], list[str]]:
+    """(concept keys, texts to embed) with the subject name as context."""
+    keys = [f"{c['track']}/{c['subject']}/{c['level']}/{c['concept']}" for c in index.concepts]
+    texts = [f"{c['concept']} ({c['subject']})" for c in index.concepts]
+    return keys, texts
+
+def _build_concept_vectors():
+    """
+    Embeds every Lv1~Lv3 concept (with its subject as context) through the on-disk store.
+    Returns (curriculum version, VectorIndex keyed by concept position, concept records).
+    """
+    index = get_curriculum_index()
+    model = _get_embedding_model()
+    if not model or not index.concepts:
+        return None
+
+    keys, texts = _concept_texts(index)
+    _, matrix = CONCEPT_EMBEDDING_STORE.sync(model, _get_embedding_model_name(model), keys, texts)
+    return index.version, VectorIndex(list(range(len(keys))), matrix), index.concepts
+
+# Concept vectors (several hundred rows), rebuilt when the curriculum version changes
+CONCEPT_EMBEDDING_STORE = EmbeddingStore("concept_vectors")
+CONCEPT_VECTORS = LazyResource(
+    "concept_vectors",
+    _build_concept_vectors,
+    is_stale=lambda value: value[0] != get_curriculum_index().version,
+    retry_after=5.0
+)
+
+def search_concepts(query_text: str, top_k: int = CONCEPT_SEARCH_TOP_K) -> list[dict]:
+    """Semantic search over all concepts. Each hit points back to its subject, level and track."""
+    value = CONCEPT_VECTORS.get()
+    if not value:
+        return []
+    _, concept_vectors, concepts = value
+
+    try:
+        query_vector = _get_query_vector([query_text])
+    except Exception as e:
+        print(f"Concept search failed: {e}")
+        return []
+
+    return [
+        {**concepts[position], "score": round(score, 3)}
+        for position, score in concept_vectors.top_k(query_vector, top_k)
+    ]
+
+
 def f_get_techtree_subject(subject_name: str) -> dict:
     """
     Finds detailed concepts (Lv1, Lv2, Lv3) for a specific subject across all tracks.
     Used by 'get_techtree_detail'.
     """
-    # Normalize query
-    query = subject_name.lower().strip()
-    
-    ai_tech_tree = _load_track_data()
     # =========================================================
     # Refined Logic: Exact -> Fuzzy -> Guidance
     # =========================================================
-    
-    # 1. Collect all subjects first for search
-    matches = []
-    
-    ai_tech_tree = _load_track_data()
-    for track_name, track_val in ai_tech_tree.items():
-        for step_name, step_val in track_val.get("steps", {}).items():
-            for key, val in step_val.items():
-                if isinstance(val, dict):
-                    # Check Level 1 (Subject)
-                    if key.lower() == query:
-                         return {"subject": key, "track": track_name, "details": val}
-                    if query in key.lower():
-                        matches.append(key)
-                        
-                    # Check Group/Option Nested
-                    if "Lv1" not in val:
-                         for sub_key, sub_val in val.items():
-                            if isinstance(sub_val, dict):
-                                if sub_key.lower() == query:
-                                    return {"subject": sub_key, "track": track_name, "category": key, "details": sub_val}
-                                if query in sub_key.lower():
-                                    matches.append(sub_key)
+    subject_index = get_curriculum_index().subjects
+
+    # 1. Exact Match (precomputed normalized name -> record)
+    record = subject_index.lookup(subject_name)
+    if record:
+        return record
 
     # 2. Fuzzy Match Results (Partially Found)
-    if matches:
-        # Remove duplicates and sort
-        unique_matches = sorted(list(set(matches)))
+    # n-gram postings -> unique, sorted subject names containing the query
+    unique_matches = subject_index.candidates(subject_name)
+    if unique_matches:
         return {
             "error": f"Subject '{subject_name}' not found exact match.",
             "message": f"Did you mean one of these? {', '.join(unique_matches[:5])}",
             "candidates": unique_matches[:5]
         }
 
-    # 3. Not Found -> Guide Agent to use Track Tool
+    # 3. Concept-level Semantic Fallback (answers in one round trip instead of redirecting to get_techtree_track)
+    concept_hits = [hit for hit in search_concepts(subject_name) if hit["score"] >= CONCEPT_MATCH_MIN_SCORE]
+    if concept_hits:
+        best = concept_hits[0]
+        record = subject_index.lookup(best["subject"])
+        if record:
+            record["message"] = f"'{subject_name}' is covered as a {best['level']} concept of '{best['subject']}'."
+            record["matched_concepts"] = concept_hits
+            return record
+
+    # 4. Not Found -> Guide Agent to use Track Tool
     return {
         "error": f"Subject '{subject_name}' not found in the curriculum.",
         "guide": f"RECOMMENDATION: The concept '{subject_name}' might be part of a broader track. Please Call 'get_techtree_track' with interests=['{subject_name}'] to find the relevant track first."
@@ -452,66 +547,50 @@ def f_get_techtree_subject(subject_name: str) -> dict:
 # 6. Tool Logic: Trends (get_techtree_trend)
 # =========================================================
 
-def _process_and_save_background(results: list[dict], search_terms: list[str], category: str = "tech_news"):
+def _build_archive_item(res: dict, search_terms: list[str]) -> dict:
+    """Cleans a raw Tavily result into the 'trend_items' document shape (category is added on write)."""
+    link = res.get("url")
+    content = _clean_text(res.get("content", ""))
+    item = {
+        "title": _clean_text(res.get("title")),
+        "link": link,
+        "summary": content[:800] + "...",
+        "tags": search_terms,
+        "source_domain": _extract_domain(link),
+        "collected_at": datetime.utcnow(),
+        "view_count": 0
+    }
+    # Near-duplicate fingerprint (mirrors of an archived article are collapsed by the archiver)
+    fingerprint = simhash(content)
+    if fingerprint is not None:
+        item["simhash"] = to_int64(fingerprint)
+    return item
+
+def _archive_batch(results: list[dict], search_terms: list[str], category: str) -> list[tuple[str, dict]]:
+    return [(category, _build_archive_item(res, search_terms)) for res in results if res.get("url")]
+
+async def _aarchive_results(results: list[dict], search_terms: list[str], category: str) -> dict | None:
     """
-    Background Task: Clean content and save unique items to MongoDB 'trends' collection (Grouped by Category).
+    Hands results to the archiving worker; without a running worker (scripts) awaits one bulk batch inline.
+    Returns {"inserted", "skipped", "duplicates"} for inline writes (queued writes are counted in TREND_ARCHIVER.metrics()).
     """
-    try:
-        db = get_db()
-        collection = db["trends"]
-        
-        for res in results:
-            link = res.get("url")
-            if not link: 
-                continue
-
-            # Check for duplicates using the link WITHIN the specific category
-            # We look for a document with this category that ALREADY has this link in 'items'
-            exists = collection.find_one({
-                "category": category,
-                "items.link": link
-            })
-            
-            if exists:
-                continue
-            
-            clean_summary = _clean_text(res.get("content", ""))[:800] + "..."
-            domain = _extract_domain(link)
-            
-            new_item = {
-                "title": _clean_text(res.get("title")),
-                "link": link,
-                "summary": clean_summary,
-                "tags": search_terms,
-                "source_domain": domain,
-                "collected_at": datetime.utcnow(),
-                "view_count": 0
-            }
-            
-            # Upsert logic: Update the array of the category document
-            collection.update_one(
-                {"category": category},
-                {
-                    "$push": {"items": new_item},
-                    "$set": {"last_updated": datetime.utcnow()}
-                },
-                upsert=True
-            )
-            print(f"[Async] Saved new trend to category '{category}': {new_item['title']}")
-            
-    except Exception as e:
-        print(f"[Async] Background save to MongoDB failed: {e}")
+    batch = _archive_batch(results, search_terms, category)
+    if batch and not TREND_ARCHIVER.submit(category, [item for _, item in batch]):
+        return await TREND_ARCHIVER.flush(batch)
+    return None
 
-def f_get_techtree_trend(keywords: list[str], category: str = "tech_news") -> list[dict]:
+def _search_trends(keywords: list[str], category: str, client: SearchClient | None = None) -> tuple[dict, list[dict], list[str]]:
     """
-    Executes web search using Tavily with domain filtering and background archiving.
+    Executes web search using Tavily with domain filtering (blocking HTTP, hedged, deadline-bounded).
+    Returns (tool response, raw results to archive, normalized search terms).
+    'client' overrides the configured search client (benchmarks).
     """
-    client = _get_tavily_client()
+    client = client or _get_tavily_client()
     if not client:
         return {
             "answer": "검색 클라이언트를 사용할 수 없습니다.",
             "items": [{"title": "System Error", "link": "", "summary": "Search client not available."}]
-        }
+        }, [], []
 
     # 1. 키워드 정규화 및 쿼리 생성
     search_terms = [k.lower().strip() for k in keywords if k.strip()]
@@ -564,33 +643,51 @@ def f_get_techtree_trend(keywords: list[str], category: str = "tech_news") -> li
     tavily_answer = "advanced" # Advanced(LLM) or Basic(Simple)
     tavily_topic = "general" # "general", "news" and "finance
 
+    no_summary = "관련 요약 내용을 생성할 수 없습니다."
+
     try:
-        # 1. Main Search
-        response = client.search(
-            query=search_query,
-            search_depth="advanced",
-            topic=tavily_topic,
-            include_answer=tavily_answer,
-            max_results=5,
-            include_domains=target_domains
-        )
-        
-        results = response.get("results", [])
-        ai_summary = response.get("answer", "관련 요약 내용을 생성할 수 없습니다.")
-        
-        # 2. Fallback Search (Global)
-        if not results:
-             print(f"[Fallback] No results in category '{category}'. Switching to global search.")
-             fb_response = client.search(
+        # 1. Main Search (domain filtered) + 2. Fallback Search (Global)
+        # The fallback starts after an empty main search, or in parallel once the main search runs
+        # past its usual latency (hedge). The whole call is bounded by TREND_SEARCH.deadline.
+        outcome = TREND_SEARCH.search(
+            client,
+            primary_kwargs=dict(
+                query=search_query,
+                search_depth="advanced",
+                topic=tavily_topic,
+                include_answer=tavily_answer,
+                max_results=5,
+                include_domains=target_domains
+            ),
+            fallback_kwargs=dict(
                 query=search_query, 
                 search_depth="basic",
                 topic=tavily_topic,
                 include_answer=tavily_answer,
                 max_results=3
             )
+        )
+        
+        response = outcome["primary"] or {}
+        results = list(response.get("results", []))
+        ai_summary = response.get("answer", no_summary)
+        
+        if not results:
+             fb_response = outcome["fallback"]
+             # Past the deadline the error is just the client timeout -> answered below as a timeout
+             if fb_response is None and outcome["error"] and not outcome["timed_out"]:
+                 raise outcome["error"]
+             fb_response = fb_response or {}
+             print(f"[Fallback] No results in category '{category}'. Switching to global search (hedged={outcome['hedged']}).")
              results.extend(fb_response.get("results", []))
-             if not ai_summary or ai_summary == "관련 요약 내용을 생성할 수 없습니다.":
-                 ai_summary = fb_response.get("answer")
+             if not ai_summary or ai_summary == no_summary:
+                 ai_summary = fb_response.get("answer") or no_summary
+
+        if outcome["timed_out"] and not results:
+            ai_summary = "검색 시간이 초과되었습니다. 잠시 후 다시 시도해 주세요."
+
+        # 같은 글의 미러/재게시 링크는 첫 번째(도메인 검색 우선) 결과만 남김
+        results = collapse_near_duplicates(results, lambda res: _clean_text(res.get("content", "")))
 
         # 3. Format Response
         user_response_items = []
@@ -608,24 +705,141 @@ def f_get_techtree_trend(keywords: list[str], category: str = "tech_news") -> li
             }
             user_response_items.append(item)
             
-        # 4. Background Archiving
-        if results:
-            thread = threading.Thread(
-                target=_process_and_save_background, 
-                args=(results, search_terms, category)
-            )
-            thread.start()
-            
         # 최종 반환: 요약 답변과 검색 결과 리스트를 딕셔너리로 묶어서 반환
         return {
             "answer": ai_summary,
             "items": user_response_items[:5],
-            "category": category
-        }
+            "category": category,
+            "source": "web"
+        }, results, search_terms
 
     except Exception as e:
         return {
             "answer": f"검색 중 오류가 발생했습니다: {str(e)}",
             "items": [{"title": "Search Error", "link": "", "summary": str(e)}],
             "category": category
-        }
+        }, [], search_terms
+
+def _cached_trend_response(entry: dict) -> dict:
+    return {**entry["response"], "cached_at": entry["cached_at"].isoformat()}
+
+def _archive_trend_response(hits: list[dict], keywords: list[str], category: str) -> dict:
+    """Formats archive hits like a web search response (no LLM summary: the agent summarizes the items)."""
+    items = []
+    for hit in hits:
+        domain = hit.get("source_domain")
+        items.append({
+            "title": f"{hit['title']} | {domain}" if domain else hit["title"],
+            "link": hit["link"],
+            "summary": hit.get("summary", ""),
+            "tags": hit.get("tags", []),
+            "collected_at": hit["collected_at"].isoformat()
+        })
+    newest = max(hit["collected_at"] for hit in hits)
+    return {
+        "answer": f"아카이브에서 '{', '.join(keywords)}' 관련 자료 {len(items)}건을 찾았습니다. (최근 수집: {newest:%Y-%m-%d})",
+        "items": items,
+        "category": category,
+        "source": "archive"
+    }
+
+def _answer_from_archive(keywords: list[str], category: str) -> dict | None:
+    if not settings.TREND_ARCHIVE_FIRST:
+        return None
+    hits = TREND_ARCHIVE_SEARCH.answer(keywords, category)
+    if not hits:
+        return None
+    # Items archived before fingerprinting may still contain mirrors
+    hits = collapse_near_duplicates(hits, lambda hit: hit.get("summary", ""))
+    if len(hits) < TREND_ARCHIVE_SEARCH.min_hits:
+        return None
+    return _archive_trend_response(hits, keywords, category)
+
+def f_get_techtree_trend(keywords: list[str], category: str = "tech_news") -> dict:
+    """
+    Sync entry point for scripts / benchmarks (no running event loop in the calling thread).
+    get_db() is the async Motor database, so this runs af_get_techtree_trend on a private loop
+    instead of keeping a second, sync-driver implementation.
+    """
+    return asyncio.run(af_get_techtree_trend(keywords, category))
+
+
+# =========================================================
+# 7. Async Entry Points (MCP tools / v1 agent)
+# - DB access is awaited on the event loop (Motor)
+# - Blocking work (embedding / search HTTP, file I/O) runs on the bounded tool executor
+# =========================================================
+
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+def _spawn_background(coro) -> asyncio.Task:
+    task = asyncio.get_running_loop().create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+    return task
+
+async def af_get_techtree_survey() -> dict:
+    return await run_blocking(f_get_techtree_survey)
+
+async def af_get_techtree_track(interests: list[str], experience_level: str) -> dict:
+    await aget_curriculum_index()
+    # Query embedding may hit the embedding API
+    return await run_blocking(f_get_techtree_track, interests, experience_level)
+
+async def af_get_techtree_path(track_name: str) -> dict:
+    index = await aget_curriculum_index()
+    if track_name in index.tracks:
+        # Exact hit: pure in-memory lookup on the index snapshot, no I/O
+        return f_get_techtree_path(track_name)
+    # Miss: fuzzy ranking over every track alias is CPU work, keep it off the loop
+    return await run_blocking(f_get_techtree_path, track_name)
+
+async def af_get_techtree_subject(subject_name: str) -> dict:
+    await aget_curriculum_index()
+    # Semantic fallback may hit the embedding API
+    return await run_blocking(f_get_techtree_subject, subject_name)
+
+# Cache keys with a background refresh in flight (one refresh per key)
+_TREND_REFRESHES: set[str] = set()
+
+async def _asearch_and_cache(keywords: list[str], category: str, key: str) -> dict:
+    response, results, search_terms = await run_blocking(_search_trends, keywords, category)
+    if results:
+        await _aarchive_results(results, search_terms, category)
+        await TREND_SEARCH_CACHE.aset(key, response)
+    return response
+
+def _schedule_trend_refresh(keywords: list[str], category: str, key: str):
+    if key in _TREND_REFRESHES:
+        return
+    _TREND_REFRESHES.add(key)
+    task = _spawn_background(_asearch_and_cache(keywords, category, key))
+    task.add_done_callback(lambda _: _TREND_REFRESHES.discard(key))
+
+async def af_get_techtree_trend(keywords: list[str], category: str = "tech_news") -> dict:
+    """
+    Fresh cache hit -> no search. Stale hit -> served now, refreshed in the background.
+    Miss -> archive-first (enough fresh archived matches) -> live search.
+    """
+    key = trend_cache_key(keywords, category)
+    cached = await TREND_SEARCH_CACHE.aget(key)
+    if cached:
+        if not cached["fresh"]:
+            _schedule_trend_refresh(keywords, category, key)
+        return _cached_trend_response(cached)
+
+    if settings.TREND_ARCHIVE_FIRST:
+        await TREND_ARCHIVE_SEARCH.arefresh()
+        archived = _answer_from_archive(keywords, category)
+        if archived:
+            return archived
+
+    return await _asearch_and_cache(keywords, category, key)
+
+async def awarm_up_tool_resources():
+    """Async startup hook: loads the curriculum and trend archive index on the loop, then warms embeddings on the tool executor."""
+    await aget_curriculum_index()
+    if settings.TREND_ARCHIVE_FIRST:
+        await TREND_ARCHIVE_SEARCH.arefresh(force=True)
+    await run_blocking(warm_up_tool_resources)
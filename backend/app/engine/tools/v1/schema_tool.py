@@ -8,6 +8,10 @@ class TrackItem(BaseModel):
     track_name: str = Field(description="Name of the AI track")
     description: str = Field(description="Brief overview of what this track covers.")
 
+class RankedTrack(BaseModel):
+    track_name: str = Field(description="Name of the AI track")
+    matching_score: float = Field(description="Similarity score (0.0 to 1.0) for this track.")
+
 class TrackOutput(BaseModel):
     # Case A: List all tracks
     message: Optional[str] = Field(None, description="Message displayed when listing all available tracks.")
@@ -19,6 +23,7 @@ class TrackOutput(BaseModel):
     matching_score: Optional[float] = Field(None, description="Similarity score (0.0 to 1.0) indicating how well the track matches user interests.")
     reason: Optional[str] = Field(None, description="Explanation of why this track was recommended.")
     track_content: Optional[Dict[str, Any]] = Field(None, description="Summary of the track content, including key steps and topics. Use this to give a high-level overview.")
+    alternatives: Optional[List[RankedTrack]] = Field(None, description="Next best matching tracks, ordered by score. Mention them when the scores are close.")
 
     # Common
     error: Optional[str] = Field(None, description="Error message if the operation failed.")
@@ -46,7 +51,8 @@ class PathOutput(BaseModel):
     error: Optional[str] = Field(None, description="Error message if the operation failed.")
     
     # Fuzzy / Guide
-    candidates: Optional[List[str]] = Field(None, description="List of similar tracks found.")
+    resolved_from: Optional[str] = Field(None, description="Original track name when it was auto-corrected to 'track'.")
+    candidates: Optional[List[str]] = Field(None, description="List of similar tracks found, best match first.")
     guide: Optional[str] = Field(None, description="Guidance for the agent if track is not found.")
 
 # ==========================================
@@ -63,12 +69,22 @@ class TrendOutput(BaseModel):
     answer: str = Field(description="AI-generated summary/insight synthesizing the search results to answer the user's query.")
     items: List[TrendItem] = Field(description="List of raw search results (articles, papers, repos) used to generate the answer.")
     category: str = Field(description="Category of the search (e.g., 'tech_news', 'research').")
+    cached_at: Optional[str] = Field(None, description="ISO timestamp of the cached search this answer was served from (None if searched live).")
+    source: Optional[str] = Field(None, description="'web' (live search) or 'archive' (previously collected articles, no web search).")
     
     error: Optional[str] = Field(None, description="Error message if the operation failed.")
 
 # ==========================================
 # 4. Subject Tool Schemas (get_techtree_subject)
 # ==========================================
+class ConceptMatch(BaseModel):
+    concept: str = Field(description="Concept text that matched the query.")
+    level: str = Field(description="Level of the concept ('Lv1', 'Lv2', 'Lv3').")
+    subject: str = Field(description="Subject this concept belongs to.")
+    category: Optional[str] = Field(None, description="Option/category of the subject.")
+    track: str = Field(description="Track this concept belongs to.")
+    score: float = Field(description="Semantic similarity score.")
+
 class SubjectOutput(BaseModel):
     subject: Optional[str] = Field(None, description="The specific subject being queried.")
     track: Optional[str] = Field(None, description="The track this subject belongs to.")
@@ -83,6 +99,7 @@ class SubjectOutput(BaseModel):
     # Fuzzy Search / Guidance
     message: Optional[str] = Field(None, description="Suggestion message when exact match is not found.")
     candidates: Optional[List[str]] = Field(None, description="List of similar subjects found.")
+    matched_concepts: Optional[List[ConceptMatch]] = Field(None, description="Concepts semantically matching the query when it is not a subject name itself.")
     guide: Optional[str] = Field(None, description="Guidance instruction for the Agent on what to do next (e.g., use another tool).")
     
     error: Optional[str] = Field(None, description="Error message if the operation failed.")
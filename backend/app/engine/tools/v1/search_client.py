@@ -0,0 +1,376 @@
+import os
+import json
+import time
+import random
+import threading
+from collections import deque
+from typing import Protocol
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from tavily import TavilyClient
+
+from app.core.config import settings
+
+# =========================================================
+# Search Clients
+# - "tavily": TavilyClient (network)
+# - "record": TavilyClient, every request/response pair is appended to a JSONL fixture file
+# - "replay": serves recorded responses offline with injected latency / failures (benchmarks)
+# - fake    : in-process client with generated results (tests)
+# All follow TavilyClient.search(**kwargs) -> {"answer", "results": [...]}.
+# timeout: seconds the call may take (None = backend default); it is not part of the request (fixture key).
+# =========================================================
+
+class SearchClient(Protocol):
+    """Structural interface of every web search backend (TavilyClient.search compatible, duck-typed)."""
+    name: str = ""
+
+    def search(self, timeout: float | None = None, **kwargs) -> dict: ...
+
+
+class TavilySearchClient(SearchClient):
+    name = "tavily"
+
+    def __init__(self, api_key: str):
+        self._client = TavilyClient(api_key=api_key)
+
+    def search(self, timeout: float | None = None, **kwargs) -> dict:
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return self._client.search(**kwargs)
+
+
+def fixture_key(kwargs: dict) -> str:
+    """Canonical request key (argument order and domain list order do not matter)."""
+    canonical = {k: sorted(v) if isinstance(v, list) else v for k, v in kwargs.items()}
+    return json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+
+def lognormal_latency(
+    median: float,
+    sigma: float,
+    tail_rate: float = 0.0,
+    tail_range: tuple[float, float] = (5.0, 10.0),
+    seed: int | None = None,
+):
+    """latency(kwargs) -> seconds: lognormal around 'median', plus a uniform slow tail with probability 'tail_rate'."""
+    rng = random.Random(seed)
+    lock = threading.Lock()
+
+    def latency(kwargs: dict) -> float:
+        with lock:
+            if tail_rate and rng.random() < tail_rate:
+                return rng.uniform(*tail_range)
+            return median * rng.lognormvariate(0.0, sigma) if median else 0.0
+    return latency
+
+
+class RecordingSearchClient(SearchClient):
+    """Wraps a live client and appends {"request", "response"} lines to a fixture file."""
+    name = "record"
+
+    def __init__(self, inner: SearchClient, path: str):
+        self._inner = inner
+        self.path = path
+        self._lock = threading.Lock()
+
+    def search(self, timeout: float | None = None, **kwargs) -> dict:
+        response = self._inner.search(timeout=timeout, **kwargs)
+        line = json.dumps({"request": kwargs, "response": response}, ensure_ascii=False, default=str)
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return response
+
+
+class SearchReplayError(RuntimeError):
+    """Injected search failure (replay mode)."""
+
+
+def _sleep_within(latency: float, timeout: float | None, kwargs: dict):
+    """Simulated latency that honours the per-call timeout like the HTTP client does."""
+    if timeout is not None and latency > timeout:
+        time.sleep(timeout)
+        raise TimeoutError(f"Search for '{kwargs.get('query', '')}' timed out after {timeout:.2f}s")
+    time.sleep(latency)
+
+
+class ReplaySearchClient(SearchClient):
+    """
+    Serves responses captured by RecordingSearchClient.
+    - exact request match first; otherwise (strict=False) a recorded response of the same search_depth, round robin
+    - latency(kwargs) -> seconds to sleep; failure_rate -> share of calls raising SearchReplayError
+    """
+    name = "replay"
+
+    def __init__(self, path: str, latency=None, failure_rate: float = 0.0, strict: bool = False, seed: int | None = None):
+        self._latency = latency or (lambda kwargs: 0.0)
+        self.failure_rate = failure_rate
+        self.strict = strict
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._exact: dict[str, dict] = {}
+        self._by_depth: dict[str, list[dict]] = {}
+        self._next: dict[str, int] = {}
+        self.calls = 0
+        self.misses = 0
+        self.failures = 0
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                self._exact[fixture_key(record["request"])] = record["response"]
+                self._by_depth.setdefault(record["request"].get("search_depth"), []).append(record["response"])
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def _lookup(self, kwargs: dict) -> dict:
+        response = self._exact.get(fixture_key(kwargs))
+        if response is not None:
+            return response
+        self.misses += 1
+        candidates = [] if self.strict else self._by_depth.get(kwargs.get("search_depth"), [])
+        if not candidates:
+            return {"answer": "", "results": []}
+        depth = kwargs.get("search_depth")
+        position = self._next.get(depth, 0)
+        self._next[depth] = position + 1
+        return candidates[position % len(candidates)]
+
+    def search(self, timeout: float | None = None, **kwargs) -> dict:
+        with self._lock:
+            self.calls += 1
+            latency = self._latency(kwargs)
+            failed = self.failure_rate and self._rng.random() < self.failure_rate
+            if failed:
+                self.failures += 1
+            else:
+                response = self._lookup(kwargs)
+        _sleep_within(latency, timeout, kwargs)
+        if failed:
+            raise SearchReplayError(f"Replayed failure for '{kwargs.get('query', '')}'")
+        return response
+
+
+def create_search_client(backend: str, api_key: str | None, fixture_path: str) -> SearchClient | None:
+    """settings.SEARCH_BACKEND -> client. 'tavily' / 'record' need an API key, 'replay' needs a fixture file."""
+    if backend == "replay":
+        return ReplaySearchClient(
+            fixture_path,
+            latency=lognormal_latency(
+                settings.SEARCH_REPLAY_LATENCY_SECONDS,
+                settings.SEARCH_REPLAY_LATENCY_SIGMA,
+                tail_rate=settings.SEARCH_REPLAY_TAIL_RATE,
+            ),
+            failure_rate=settings.SEARCH_REPLAY_FAILURE_RATE,
+        )
+    if not api_key:
+        return None
+    client = TavilySearchClient(api_key=api_key)
+    return RecordingSearchClient(client, fixture_path) if backend == "record" else client
+
+
+class FakeSearchClient(SearchClient):
+    """
+    Deterministic stand-in for benchmarks.
+    - latency(kwargs) -> seconds to sleep (e.g. a heavy-tailed sample for the domain-filtered query)
+    - respond(kwargs) -> response dict (defaults to one result per call)
+    """
+    name = "fake"
+
+    def __init__(self, latency=None, respond=None):
+        self._latency = latency or (lambda kwargs: 0.0)
+        self._respond = respond or self._default_response
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _default_response(kwargs: dict) -> dict:
+        return {
+            "answer": f"Summary for {kwargs.get('query', '')}",
+            "results": [{"title": "Fake result", "url": f"https://example.com/{kwargs.get('search_depth')}", "content": ""}],
+        }
+
+    def search(self, timeout: float | None = None, **kwargs) -> dict:
+        with self._lock:
+            self.calls += 1
+            latency = self._latency(kwargs)
+        _sleep_within(latency, timeout, kwargs)
+        return self._respond(kwargs)
+
+
+# =========================================================
+# Hedged Search
+# The global fallback used to start only after the domain-filtered search came back empty.
+# Now it also starts early ("hedge") once the primary has run longer than the p-th percentile
+# of recent primary latencies, and the whole call is bounded by a deadline.
+# =========================================================
+
+class LatencyTracker:
+    """Rolling window of observed latencies; percentile() falls back to a default until warmed up."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float, default: float) -> float:
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return default
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def _result(future) -> tuple[dict | None, Exception | None]:
+    try:
+        return future.result(), None
+    except Exception as e:
+        return None, e
+
+def _has_results(response: dict | None) -> bool:
+    return bool(response and response.get("results"))
+
+
+class HedgedSearch:
+    """
+    Runs primary (+ fallback) searches on a dedicated pool.
+    - primary answers with results -> primary is used
+    - primary is empty or failed -> fallback is started (once) and used
+    - primary is slower than the hedge delay -> fallback is started in parallel; the first one with results wins
+    - deadline passed without results -> whatever finished so far is returned ('timed_out' = True); unfinished calls are abandoned
+    hedge_percentile=None disables hedging (fallback only after an empty primary, as before).
+    Abandoned calls must not pin pool threads: every call gets the remaining deadline as its client timeout,
+    and no hedge is started while all workers are busy (it would only queue behind the calls it hedges).
+    """
+
+    def __init__(
+        self,
+        hedge_percentile: float | None,
+        hedge_default: float,
+        deadline: float | None,
+        max_workers: int,
+    ):
+        self.hedge_percentile = hedge_percentile
+        self.hedge_default = hedge_default
+        self.deadline = deadline
+        self.latencies = LatencyTracker()
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.hedges = 0
+        self.hedges_skipped = 0
+        self.timeouts = 0
+
+    def hedge_delay(self) -> float | None:
+        if self.hedge_percentile is None:
+            return None
+        return self.latencies.percentile(self.hedge_percentile, self.hedge_default)
+
+    def saturated(self) -> bool:
+        with self._lock:
+            return self.in_flight >= self.max_workers
+
+    def _submit(self, client: SearchClient, kwargs: dict, track: bool, deadline_at: float | None):
+        with self._lock:
+            self.in_flight += 1
+        try:
+            return self._pool.submit(self._timed, client, kwargs, track, deadline_at)
+        except Exception:
+            with self._lock:
+                self.in_flight -= 1
+            raise
+
+    def _timed(self, client: SearchClient, kwargs: dict, track: bool, deadline_at: float | None) -> dict:
+        try:
+            started = time.monotonic()
+            # Remaining deadline (measured when the call actually starts, queueing included) -> client timeout
+            timeout = max(0.01, deadline_at - started) if deadline_at is not None else None
+            response = client.search(timeout=timeout, **kwargs)
+            if track:
+                self.latencies.record(time.monotonic() - started)
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def search(self, client: SearchClient, primary_kwargs: dict, fallback_kwargs: dict) -> dict:
+        """Returns {"primary": dict | None, "fallback": dict | None, "timed_out": bool, "hedged": bool, "error": Exception | None}."""
+        started = time.monotonic()
+        deadline_at = started + self.deadline if self.deadline else None
+        hedge_at = started + self.hedge_delay() if self.hedge_percentile is not None else None
+
+        primary = self._submit(client, primary_kwargs, True, deadline_at)
+        fallback = None
+        outcome = {"primary": None, "fallback": None, "timed_out": False, "hedged": False, "error": None}
+
+        def start_fallback():
+            nonlocal fallback
+            # A call started past the deadline could only time out
+            if fallback is None and (deadline_at is None or time.monotonic() < deadline_at):
+                fallback = self._submit(client, fallback_kwargs, False, deadline_at)
+
+        while True:
+            if primary.done():
+                outcome["primary"], outcome["error"] = _result(primary)
+                if _has_results(outcome["primary"]):
+                    break
+                # Empty or failed primary -> the fallback is the answer
+                start_fallback()
+            if fallback is not None and fallback.done():
+                # Hedge: the first usable answer wins, even while the primary is still running
+                if primary.done() or _has_results(_result(fallback)[0]):
+                    break
+            if hedge_at is not None and fallback is None and time.monotonic() >= hedge_at:
+                hedge_at = None
+                if self.saturated():
+                    # Every worker is busy -> the hedge would only queue; keep waiting on the primary
+                    self.hedges_skipped += 1
+                else:
+                    start_fallback()
+                    outcome["hedged"] = True
+                    self.hedges += 1
+                continue
+            if deadline_at is not None and time.monotonic() >= deadline_at:
+                break
+
+            # Sleep until a search finishes, the hedge point or the deadline
+            pending = [f for f in (primary, fallback) if f is not None and not f.done()]
+            wake_points = [t for t in (deadline_at, hedge_at if fallback is None else None) if t is not None]
+            timeout = max(0.0, min(wake_points) - time.monotonic()) if wake_points else None
+            wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        if fallback is not None and fallback.done():
+            outcome["fallback"], fallback_error = _result(fallback)
+            outcome["error"] = outcome["error"] or fallback_error
+        # Checked after the loop: calls cut by their client timeout finish right at the deadline
+        if deadline_at is not None and time.monotonic() >= deadline_at \
+                and not (_has_results(outcome["primary"]) or _has_results(outcome["fallback"])):
+            outcome["timed_out"] = True
+            self.timeouts += 1
+        return outcome
+
+    def stats(self) -> dict:
+        return {
+            "hedge_delay": self.hedge_delay(),
+            "deadline": self.deadline,
+            "hedges": self.hedges,
+            "hedges_skipped": self.hedges_skipped,
+            "timeouts": self.timeouts,
+            "in_flight": self.in_flight,
+        }
+
+
+TREND_SEARCH = HedgedSearch(
+    hedge_percentile=settings.TREND_SEARCH_HEDGE_PERCENTILE,
+    hedge_default=settings.TREND_SEARCH_HEDGE_DEFAULT_SECONDS,
+    deadline=settings.TREND_SEARCH_DEADLINE_SECONDS,
+    max_workers=settings.TREND_SEARCH_WORKERS
+)
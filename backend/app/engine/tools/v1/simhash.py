@@ -0,0 +1,103 @@
+from hashlib import blake2b
+from collections import Counter
+
+from app.engine.tools.v1.trend_search_index import tokenize
+
+# =========================================================
+# SimHash Near-Duplicate Detection
+# The same article shows up under several links / mirror domains.
+# - simhash(): 64-bit fingerprint over the tokens of the cleaned text (Korean words as bigrams, so local order counts)
+# - NearDuplicateIndex: banded LSH. A fingerprint is split into (max_distance + 1) bands;
+#   by the pigeonhole principle two fingerprints within max_distance bits share at least one band,
+#   so only the items in matching band buckets are compared (no scan over the whole archive).
+# =========================================================
+
+SIMHASH_BITS = 64
+# <= 3 differing bits -> same article (unrelated texts differ in ~20+ bits).
+# 4 bands of 16 bits keep buckets small (~1.5 entries per bucket at 100k items); a wider distance
+# means narrower bands and candidate lists that grow with the archive.
+NEAR_DUPLICATE_DISTANCE = 3
+MIN_TOKENS = 8                # shorter texts (empty summaries, one-liners) are never collapsed
+
+_MASK = (1 << SIMHASH_BITS) - 1
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(blake2b(feature.encode("utf-8"), digest_size=SIMHASH_BITS // 8).digest(), "big")
+
+def simhash(text: str) -> int | None:
+    """64-bit SimHash of the text, or None if it is too short to fingerprint reliably."""
+    tokens = tokenize(text)
+    if len(tokens) < MIN_TOKENS:
+        return None
+    weights = [0] * SIMHASH_BITS
+    for feature, count in Counter(tokens).items():
+        h = _feature_hash(feature)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if h >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+def to_int64(fingerprint: int) -> int:
+    """Unsigned -> signed 64-bit (BSON has no unsigned 64-bit integer)."""
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+def from_int64(value: int) -> int:
+    return value & _MASK
+
+
+class NearDuplicateIndex:
+    """key -> fingerprint, with band buckets for sublinear near-duplicate lookup."""
+
+    def __init__(self, max_distance: int = NEAR_DUPLICATE_DISTANCE):
+        self.max_distance = max_distance
+        self._bands = max_distance + 1
+        self._band_bits = SIMHASH_BITS // self._bands
+        self._buckets: list[dict[int, list]] = [{} for _ in range(self._bands)]
+        self._fingerprints: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def _band_values(self, fingerprint: int):
+        for band in range(self._bands):
+            shift = band * self._band_bits
+            # The last band takes the remaining bits so every bit belongs to a band
+            width = SIMHASH_BITS - shift if band == self._bands - 1 else self._band_bits
+            yield band, fingerprint >> shift & ((1 << width) - 1)
+
+    def add(self, key, fingerprint: int):
+        if key in self._fingerprints:
+            return
+        self._fingerprints[key] = fingerprint
+        for band, value in self._band_values(fingerprint):
+            self._buckets[band].setdefault(value, []).append(key)
+
+    def candidates(self, fingerprint: int) -> set:
+        found = set()
+        for band, value in self._band_values(fingerprint):
+            found.update(self._buckets[band].get(value, ()))
+        return found
+
+    def find(self, fingerprint: int, exclude=None):
+        """Key of an indexed near-duplicate (other than 'exclude'), or None."""
+        for key in self.candidates(fingerprint):
+            if key != exclude and hamming(fingerprint, self._fingerprints[key]) <= self.max_distance:
+                return key
+        return None
+
+
+def collapse_near_duplicates(items: list[dict], text_of) -> list[dict]:
+    """Keeps the first item of every near-duplicate group (input order = preference order)."""
+    index = NearDuplicateIndex()
+    kept = []
+    for position, item in enumerate(items):
+        fingerprint = simhash(text_of(item))
+        if fingerprint is not None:
+            if index.find(fingerprint) is not None:
+                continue
+            index.add(position, fingerprint)
+        kept.append(item)
+    return kept
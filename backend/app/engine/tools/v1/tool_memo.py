@@ -0,0 +1,94 @@
+import json
+import inspect
+import functools
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.engine.tools.v1.curriculum_index import aget_curriculum_index
+
+# =========================================================
+# Tool Result Memoization (deterministic MCP tools)
+# get_techtree_survey / path / subject only depend on their arguments and the curriculum snapshot,
+# so results are shared across requests, agent turns and the MCP server:
+# - key: (tool name, canonical arguments, curriculum version)
+# - bounded LRU (TTLCache without TTL) with hit/miss counters
+# - a re-sync changes the curriculum version: entries of the old version are dropped on first sight
+# NOTE: Cached results are shared between callers. Treat them as read-only.
+# =========================================================
+
+
+def canonical_args(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Positional/keyword/default spellings of the same call -> one string (sorted JSON)."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return json.dumps(bound.arguments, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class ToolResultMemo:
+
+    def __init__(self, maxsize: int, version_of=None):
+        self._cache = TTLCache(maxsize=maxsize)
+        # async () -> current curriculum version (the index snapshot refreshes itself on a version check)
+        self._version_of = version_of or self._curriculum_version
+        self.version: str | None = None
+        self.invalidations = 0
+        self.uncached = 0
+
+    @staticmethod
+    async def _curriculum_version() -> str:
+        return (await aget_curriculum_index()).version
+
+    async def _current_version(self) -> str:
+        version = await self._version_of()
+        if version != self.version:
+            if self.version is not None:
+                # Re-synced tracks: every memoized result belongs to the old snapshot
+                self._cache.clear()
+                self.invalidations += 1
+            self.version = version
+        return version
+
+    def memoize(self, tool=None, *, cacheable=None):
+        """
+        Decorator for async tools (@memoize or @memoize(cacheable=...)). functools.wraps keeps the
+        signature / docstring, so FastMCP and convert_to_openai_tool still see the original tool.
+        Results with 'error' set (e.g. a subject not found while the concept vectors are warming up) are not kept,
+        nor results rejected by 'cacheable' (tools whose fallback has no error field, e.g. an empty survey).
+        """
+        if tool is None:
+            return functools.partial(self.memoize, cacheable=cacheable)
+        name = tool.__name__
+        signature = inspect.signature(tool)
+
+        @functools.wraps(tool)
+        async def memoized(*args, **kwargs):
+            version = await self._current_version()
+            key = (name, canonical_args(signature, args, kwargs), version)
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+
+            result = await tool(*args, **kwargs)
+            # Only store results computed against the snapshot that is still current
+            keep = getattr(result, "error", None) is None and (cacheable is None or cacheable(result))
+            if keep and version == self.version:
+                self._cache.set(key, result)
+            else:
+                self.uncached += 1
+            return result
+
+        return memoized
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self._cache.stats(),
+            "version": self.version[:12] if self.version else None,
+            "invalidations": self.invalidations,
+            "uncached": self.uncached,
+        }
+
+
+TOOL_MEMO = ToolResultMemo(maxsize=settings.TOOL_MEMO_MAXSIZE)
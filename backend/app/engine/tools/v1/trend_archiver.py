@@ -0,0 +1,238 @@
+import time
+import asyncio
+from pymongo.errors import BulkWriteError
+
+# Database Connection
+from app.core.database import get_db
+from app.core.config import settings
+from app.engine.tools.v1.trend_items import TREND_ITEMS_COLLECTION, build_item_upserts
+from app.engine.tools.v1.simhash import NearDuplicateIndex, from_int64
+
+# =========================================================
+# Trend Archiver
+# One long-lived worker per process in place of a thread per search.
+# - bounded queue: when full, new items are dropped and counted (search latency never waits on archiving)
+# - batching: flush when batch_size items are collected or flush_interval passed since the first one
+# - one bulk_write of idempotent upserts into 'trend_items' per flush (no per-item find_one + update_one)
+# - near-duplicates (same article under another link, SimHash) of archived items are dropped before the write
+# - stop() drains what is queued, bounded by a timeout
+# =========================================================
+
+_STOP = object()
+
+
+class TrendArchiver:
+    """Async archiving worker. submit() is safe to call from the event loop and from worker threads."""
+
+    def __init__(self, maxsize: int, batch_size: int, flush_interval: float, drain_timeout: float):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drain_timeout = drain_timeout
+
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        # category -> fingerprints of archived items (link -> simhash)
+        self._fingerprints: dict[str, NearDuplicateIndex] = {}
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.inserted = 0
+        self.skipped = 0
+        self.duplicates = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    # -----------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        await self.load_fingerprints()
+        self._task = self._loop.create_task(self._run())
+
+    async def load_fingerprints(self):
+        """Indexes the fingerprints of everything already archived (projection: category, link, simhash)."""
+        fingerprints = {}
+        try:
+            cursor = get_db()[TREND_ITEMS_COLLECTION].find(
+                {"simhash": {"$exists": True}}, {"_id": 0, "category": 1, "link": 1, "simhash": 1}
+            )
+            async for doc in cursor:
+                fingerprints.setdefault(doc["category"], NearDuplicateIndex()).add(doc["link"], from_int64(doc["simhash"]))
+        except Exception as e:
+            print(f"[Archiver] Loading fingerprints failed, near-duplicates are only collapsed within new items: {e}")
+            return
+        self._fingerprints = fingerprints
+
+    async def stop(self):
+        """Graceful drain: flushes everything queued before the sentinel, then exits."""
+        if not self.running:
+            return
+        task = self._task
+        await self._queue.put(_STOP)
+        try:
+            await asyncio.wait_for(task, self.drain_timeout)
+        except asyncio.TimeoutError:
+            print(f"[Archiver] Drain timed out, {self._queue.qsize()} items abandoned.")
+        finally:
+            self._task = None
+
+    # -----------------------------------------------------
+    # Producer side
+    # -----------------------------------------------------
+    def _enqueue(self, category: str, items: list[dict]):
+        for item in items:
+            try:
+                self._queue.put_nowait((category, item))
+                self.enqueued += 1
+            except asyncio.QueueFull:
+                self.dropped += 1
+
+    def submit(self, category: str, items: list[dict]) -> bool:
+        """Queues archive items without blocking. Returns False if the worker is not running."""
+        if not self.running:
+            return False
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._enqueue(category, items)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, category, items)
+        return True
+
+    # -----------------------------------------------------
+    # Consumer side
+    # -----------------------------------------------------
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self.flush(batch)
+
+    # -----------------------------------------------------
+    # Near-duplicate collapsing (per category: reads and archive-first search are category scoped)
+    # -----------------------------------------------------
+    def _collapse(self, batch: list[tuple[str, dict]]) -> tuple[list[tuple[str, dict]], list[tuple[str, str, int]]]:
+        """Drops items whose fingerprint matches another link in the archive or earlier in the batch."""
+        kept, fresh = [], []
+        batch_index: dict[str, NearDuplicateIndex] = {}
+        for category, item in batch:
+            value = item.get("simhash")
+            if value is None:
+                kept.append((category, item))
+                continue
+            fingerprint = from_int64(value)
+            link = item["link"]
+            archived = self._fingerprints.get(category)
+            if (archived and archived.find(fingerprint, exclude=link)) or \
+                    category in batch_index and batch_index[category].find(fingerprint, exclude=link):
+                continue
+            batch_index.setdefault(category, NearDuplicateIndex()).add(link, fingerprint)
+            kept.append((category, item))
+            fresh.append((category, link, fingerprint))
+        return kept, fresh
+
+    def _remember(self, fresh: list[tuple[str, str, int]]):
+        # Only after a successful write: a failed batch must not hide its mirrors later
+        for category, link, fingerprint in fresh:
+            self._fingerprints.setdefault(category, NearDuplicateIndex()).add(link, fingerprint)
+
+    def _record_flush(self, started: float, result: dict | None):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.flushes += 1
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._total_flush_ms += elapsed_ms
+        if result is None:
+            self.failed_flushes += 1
+        else:
+            self.inserted += result["inserted"]
+            self.skipped += result["skipped"]
+            self.duplicates += result["duplicates"]
+
+    def _flush_result(self, started: float, batch: list, kept: list, fresh: list, upserted: int) -> dict:
+        # Skipped: already archived, or repeated within the batch. Duplicates: mirrors of another link
+        self._remember(fresh)
+        result = {"inserted": upserted, "skipped": len(kept) - upserted, "duplicates": len(batch) - len(kept)}
+        self._record_flush(started, result)
+        return result
+
+    def _flush_failed(self, started: float, batch: list, kept: list, fresh: list, e: Exception) -> dict | None:
+        # Concurrent upserts of the same link from another process: the item is archived, not lost
+        if isinstance(e, BulkWriteError) and all(err.get("code") == 11000 for err in e.details.get("writeErrors", [])):
+            return self._flush_result(started, batch, kept, fresh, e.details.get("nUpserted", 0))
+        self._record_flush(started, None)
+        print(f"[Archiver] Bulk write of {len(kept)} items failed: {e}")
+        return None
+
+    async def flush(self, batch: list[tuple[str, dict]]) -> dict | None:
+        """
+        Dedup + write in one round trip (upserts against the unique (category, link) key).
+        Returns {"inserted", "skipped", "duplicates"}, or None if the write failed.
+        """
+        started = time.perf_counter()
+        kept, fresh = self._collapse(batch)
+        if not kept:
+            return self._flush_result(started, batch, kept, fresh, 0)
+        try:
+            result = await get_db()[TREND_ITEMS_COLLECTION].bulk_write(build_item_upserts(kept), ordered=False)
+        except Exception as e:
+            return self._flush_failed(started, batch, kept, fresh, e)
+        return self._flush_result(started, batch, kept, fresh, result.upserted_count)
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_maxsize": self.maxsize,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "duplicates": self.duplicates,
+            "fingerprints": sum(len(index) for index in self._fingerprints.values()),
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "max_flush_ms": round(self.max_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+        }
+
+
+TREND_ARCHIVER = TrendArchiver(
+    maxsize=settings.TREND_ARCHIVE_QUEUE_SIZE,
+    batch_size=settings.TREND_ARCHIVE_BATCH_SIZE,
+    flush_interval=settings.TREND_ARCHIVE_FLUSH_SECONDS,
+    drain_timeout=settings.TREND_ARCHIVE_DRAIN_SECONDS
+)
@@ -0,0 +1,99 @@
+from datetime import datetime
+
+# Database Connection
+from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# =========================================================
+# Trend Search Result Cache (two tiers)
+# - L1: in-process LRU (TTLCache)
+# - L2: 'trend_search_cache' collection, shared by API / MCP processes.
+#       TTL index on 'cached_at' (scripts/init_db.py) removes entries after the stale window.
+# Entry age decides how it is served:
+#   age < TREND_CACHE_FRESH_SECONDS  -> fresh, served as-is
+#   age < TREND_CACHE_STALE_SECONDS  -> stale, served while the caller refreshes it in the background
+# =========================================================
+
+TREND_CACHE_COLLECTION = "trend_search_cache"
+
+
+def trend_cache_key(keywords: list[str], category: str) -> str:
+    """Lower-cased, de-duplicated, sorted keywords + category (order/case of keywords does not matter)."""
+    terms = sorted({k.lower().strip() for k in keywords if k and k.strip()})
+    return f"{category.lower()}|{','.join(terms)}"
+
+
+class TrendSearchCache:
+    """Two-tier cache of get_techtree_trend responses keyed by trend_cache_key()."""
+
+    def __init__(self, maxsize: int, fresh_seconds: float, stale_seconds: float):
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self._local = TTLCache(maxsize=maxsize, ttl=stale_seconds)  # key -> (response, cached_at)
+        self.remote_hits = 0
+
+    def _age(self, cached_at: datetime) -> float:
+        return (datetime.utcnow() - cached_at).total_seconds()
+
+    def _entry(self, response: dict, cached_at: datetime) -> dict | None:
+        """Returns {'response', 'cached_at', 'fresh'} or None once the stale window has passed."""
+        age = self._age(cached_at)
+        if age >= self.stale_seconds:
+            return None
+        return {"response": response, "cached_at": cached_at, "fresh": age < self.fresh_seconds}
+
+    def get_local(self, key: str) -> dict | None:
+        """L1 only (no I/O)."""
+        entry = self._local.get(key)
+        return self._entry(*entry) if entry else None
+
+    def set_local(self, key: str, response: dict, cached_at: datetime | None = None):
+        self._local.set(key, (response, cached_at or datetime.utcnow()))
+
+    async def aget(self, key: str) -> dict | None:
+        """L1, then L2 (one indexed find_one). L2 hits are promoted to L1."""
+        entry = self.get_local(key)
+        if entry:
+            return entry
+
+        try:
+            doc = await get_db()[TREND_CACHE_COLLECTION].find_one({"_id": key})
+        except Exception as e:
+            print(f"[TrendCache] Read failed: {e}")
+            return None
+        if not doc:
+            return None
+
+        entry = self._entry(doc["response"], doc["cached_at"])
+        if entry:
+            self.remote_hits += 1
+            self.set_local(key, doc["response"], doc["cached_at"])
+        return entry
+
+    async def aset(self, key: str, response: dict):
+        cached_at = datetime.utcnow()
+        self.set_local(key, response, cached_at)
+        try:
+            await get_db()[TREND_CACHE_COLLECTION].update_one(
+                {"_id": key},
+                {"$set": {"response": response, "cached_at": cached_at}},
+                upsert=True
+            )
+        except Exception as e:
+            # L1 still holds it; L2 is best-effort
+            print(f"[TrendCache] Write failed: {e}")
+
+    def clear(self):
+        self._local.clear()
+
+    def stats(self) -> dict:
+        return {**self._local.stats(), "remote_hits": self.remote_hits}
+
+
+TREND_SEARCH_CACHE = TrendSearchCache(
+    maxsize=settings.TREND_CACHE_SIZE,
+    fresh_seconds=settings.TREND_CACHE_FRESH_SECONDS,
+    stale_seconds=settings.TREND_CACHE_STALE_SECONDS
+)
+
@@ -0,0 +1,124 @@
+from datetime import datetime
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne, DESCENDING
+
+# Database Connection
+from app.core.database import get_db
+
+# =========================================================
+# Trend Items (one document per archived link)
+# Replaces the per-category 'trends' document whose 'items' array grew without bound.
+# Indexes (scripts/init_db.py):
+#   (category, link) unique  -> idempotent upserts
+#   (category, collected_at) -> paginated / time-ranged reads per category
+#   tags, collected_at
+# =========================================================
+
+TREND_ITEMS_COLLECTION = "trend_items"
+
+TREND_PAGE_SIZE = 20
+TREND_PAGE_MAX_SIZE = 100
+
+
+def build_item_upserts(batch: list[tuple[str, dict]]) -> list[UpdateOne]:
+    """
+    (category, item) pairs -> idempotent upserts keyed by (category, link).
+    $setOnInsert: an already archived link is left untouched (view_count, collected_at are kept).
+    """
+    ops = []
+    seen = set()
+    for category, item in batch:
+        key = (category, item["link"])
+        if key in seen:
+            continue
+        seen.add(key)
+        ops.append(UpdateOne(
+            {"category": category, "link": item["link"]},
+            {"$setOnInsert": {**item, "category": category}},
+            upsert=True
+        ))
+    return ops
+
+
+# ---------------------------------------------------------
+# Reads (newest first, keyset pagination)
+# ---------------------------------------------------------
+
+def encode_cursor(doc: dict) -> str:
+    return f"{doc['collected_at'].isoformat()}|{doc['_id']}"
+
+def decode_cursor(cursor: str) -> tuple[datetime, ObjectId]:
+    """Raises ValueError on a malformed cursor."""
+    collected_at, _, doc_id = cursor.partition("|")
+    try:
+        return datetime.fromisoformat(collected_at), ObjectId(doc_id)
+    except InvalidId as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+def build_items_query(
+    category: str | None = None,
+    tags: list[str] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+) -> dict:
+    query = {}
+    if category:
+        query["category"] = category
+    if tags:
+        query["tags"] = {"$in": [t.lower().strip() for t in tags]}
+
+    time_range = {}
+    if since:
+        time_range["$gte"] = since
+    if until:
+        time_range["$lt"] = until
+    if time_range:
+        query["collected_at"] = time_range
+
+    if cursor:
+        # Resume strictly after the last item of the previous page (ties on collected_at broken by _id)
+        last_at, last_id = decode_cursor(cursor)
+        query["$or"] = [
+            {"collected_at": {"$lt": last_at}},
+            {"collected_at": last_at, "_id": {"$lt": last_id}},
+        ]
+    return query
+
+async def alist_trend_items(
+    category: str | None = None,
+    tags: list[str] | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = TREND_PAGE_SIZE,
+    cursor: str | None = None,
+) -> dict:
+    """
+    One page of archived items, newest first.
+    Returns {"items": [...], "next_cursor": str | None}; pass next_cursor back to get the following page.
+    """
+    limit = max(1, min(limit, TREND_PAGE_MAX_SIZE))
+    query = build_items_query(category, tags, since, until, cursor)
+    # Fetch one extra document to know whether another page exists
+    docs = await (
+        get_db()[TREND_ITEMS_COLLECTION]
+        .find(query)
+        .sort([("collected_at", DESCENDING), ("_id", DESCENDING)])
+        .limit(limit + 1)
+        .to_list(length=limit + 1)
+    )
+    has_more = len(docs) > limit
+    docs = docs[:limit]
+    return {
+        "items": docs,
+        "next_cursor": encode_cursor(docs[-1]) if has_more else None
+    }
+
+async def aget_trend_item(item_id: str) -> dict | None:
+    """One archived item by id (None if missing). Raises ValueError on a malformed id."""
+    try:
+        doc_id = ObjectId(item_id)
+    except InvalidId as e:
+        raise ValueError(f"Invalid item id: {item_id}") from e
+    return await get_db()[TREND_ITEMS_COLLECTION].find_one({"_id": doc_id})
@@ -0,0 +1,210 @@
+import re
+import math
+import time
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+# Database Connection
+from app.core.database import get_db
+from app.core.config import settings
+from app.core.executor import run_blocking
+from app.engine.tools.v1.trend_items import TREND_ITEMS_COLLECTION
+
+# =========================================================
+# Archive-first Trend Search
+# In-process BM25 over archived 'trend_items' (title, summary, tags).
+# - Korean words are indexed as character bigrams (no morphological analyzer needed: "도입기를" ~ "도입")
+# - Only items inside the widest per-category freshness window are loaded
+# - Incremental refresh by 'collected_at' watermark, full rebuild periodically to drop expired items
+# =========================================================
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title / tags count more than the summary
+TITLE_WEIGHT = 2
+TAG_WEIGHT = 2
+
+# Overlap when reading past the watermark (items are written up to a flush interval after 'collected_at')
+REFRESH_OVERLAP_SECONDS = 120
+
+_TOKEN_RE = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+_PROJECTION = {"title": 1, "link": 1, "summary": 1, "tags": 1, "source_domain": 1, "category": 1, "collected_at": 1}
+
+
+def tokenize(text: str) -> list[str]:
+    tokens = []
+    for word in _TOKEN_RE.findall((text or "").lower()):
+        if "가" <= word[0] <= "힣" and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+def freshness_window(category: str) -> timedelta:
+    """Per-category freshness (news ages fast, papers slowly). Unknown categories use 'k_blog'."""
+    windows = settings.TREND_ARCHIVE_FRESHNESS_HOURS
+    return timedelta(hours=windows.get(category.lower(), windows["k_blog"]))
+
+
+class BM25Index:
+    """Append-only BM25 postings (token -> {doc position: term frequency})."""
+
+    def __init__(self):
+        self._postings: dict[str, dict[int, int]] = {}
+        self._lengths: list[int] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, tokens: list[str]) -> int:
+        position = len(self._lengths)
+        for token, tf in Counter(tokens).items():
+            self._postings.setdefault(token, {})[position] = tf
+        self._lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        return position
+
+    def score(self, query_tokens: list[str]) -> dict[int, tuple[float, int]]:
+        """position -> (BM25 score, number of distinct query tokens matched)."""
+        n_docs = len(self._lengths)
+        if not n_docs:
+            return {}
+        avg_length = self._total_length / n_docs
+        scores = {}
+        for token in set(query_tokens):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for position, tf in postings.items():
+                norm = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[position] / avg_length))
+                score, matched = scores.get(position, (0.0, 0))
+                scores[position] = (score + idf * norm, matched + 1)
+        return scores
+
+
+class TrendArchiveSearch:
+    """
+    Ranked local search over the trend archive.
+    search() is pure in-memory (sync callers too); arefresh() pulls new items with the async driver.
+    """
+
+    def __init__(self, min_hits: int, min_coverage: float, refresh_seconds: float, rebuild_seconds: float):
+        self.min_hits = min_hits
+        self.min_coverage = min_coverage
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+
+        self._lock = threading.Lock()
+        self._index = BM25Index()
+        self._docs: list[dict] = []
+        self._ids: set = set()
+        self._watermark: datetime | None = None
+        self._built_at = 0.0
+        self._refreshed_at = 0.0
+        self._refreshing = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # -----------------------------------------------------
+    # Loading
+    # -----------------------------------------------------
+    def _add_docs(self, docs: list[dict], reset: bool = False):
+        with self._lock:
+            if reset:
+                self._index, self._docs, self._ids = BM25Index(), [], set()
+            for doc in docs:
+                if doc["_id"] in self._ids:
+                    continue
+                self._ids.add(doc["_id"])
+                tags = doc.get("tags") or []
+                tokens = (
+                    tokenize(doc.get("title", "")) * TITLE_WEIGHT
+                    + tokenize(" ".join(tags)) * TAG_WEIGHT
+                    + tokenize(doc.get("summary", ""))
+                )
+                self._index.add(tokens)
+                self._docs.append(doc)
+                if self._watermark is None or doc["collected_at"] > self._watermark:
+                    self._watermark = doc["collected_at"]
+
+    async def arefresh(self, force: bool = False):
+        """Incremental load past the watermark (at most every refresh_seconds); full rebuild every rebuild_seconds."""
+        now = time.monotonic()
+        if self._refreshing or (not force and now - self._refreshed_at < self.refresh_seconds):
+            return
+        self._refreshing = True
+        try:
+            rebuild = self._watermark is None or now - self._built_at >= self.rebuild_seconds
+            widest = max(settings.TREND_ARCHIVE_FRESHNESS_HOURS.values())
+            since = datetime.utcnow() - timedelta(hours=widest)
+            if not rebuild:
+                since = max(since, self._watermark - timedelta(seconds=REFRESH_OVERLAP_SECONDS))
+
+            cursor = get_db()[TREND_ITEMS_COLLECTION].find({"collected_at": {"$gte": since}}, _PROJECTION)
+            docs = [doc async for doc in cursor.sort("collected_at", 1)]
+            if rebuild:
+                self._watermark = None
+            # Tokenizing thousands of documents is CPU work -> off the event loop
+            await run_blocking(self._add_docs, docs, rebuild)
+            if rebuild:
+                self._built_at = now
+            self._refreshed_at = now
+        except Exception as e:
+            print(f"[ArchiveSearch] Refresh failed: {e}")
+        finally:
+            self._refreshing = False
+
+    # -----------------------------------------------------
+    # Query
+    # -----------------------------------------------------
+    def search(self, keywords: list[str], category: str, limit: int = 5) -> list[dict]:
+        """
+        Fresh archived items for the category ranked by BM25.
+        Only documents covering at least min_coverage of the query tokens count as hits.
+        """
+        query_tokens = set(tokenize(" ".join(keywords)))
+        if not query_tokens:
+            return []
+        cutoff = datetime.utcnow() - freshness_window(category)
+
+        with self._lock:
+            scored = self._index.score(list(query_tokens))
+            ranked = []
+            for position, (score, matched) in scored.items():
+                doc = self._docs[position]
+                if doc["category"] != category or doc["collected_at"] < cutoff:
+                    continue
+                if matched / len(query_tokens) < self.min_coverage:
+                    continue
+                ranked.append((score, doc))
+
+        ranked.sort(key=lambda item: (item[0], item[1]["collected_at"]), reverse=True)
+        return [{**doc, "score": round(score, 3)} for score, doc in ranked[:limit]]
+
+    def answer(self, keywords: list[str], category: str, limit: int = 5) -> list[dict] | None:
+        """Hits if the archive can answer on its own (>= min_hits fresh matches), else None (go to the web)."""
+        hits = self.search(keywords, category, limit)
+        if len(hits) >= self.min_hits:
+            self.hits += 1
+            return hits
+        self.misses += 1
+        return None
+
+    def stats(self) -> dict:
+        return {"documents": len(self._docs), "hits": self.hits, "misses": self.misses}
+
+
+TREND_ARCHIVE_SEARCH = TrendArchiveSearch(
+    min_hits=settings.TREND_ARCHIVE_MIN_HITS,
+    min_coverage=settings.TREND_ARCHIVE_MIN_COVERAGE,
+    refresh_seconds=settings.TREND_ARCHIVE_INDEX_REFRESH_SECONDS,
+    rebuild_seconds=settings.TREND_ARCHIVE_INDEX_REBUILD_SECONDS
+)
@@ -0,0 +1,185 @@
+import time
+import asyncio
+import threading
+from collections import Counter
+from pymongo import UpdateOne
+
+# Database Connection
+from app.core.database import get_db
+from app.core.config import settings
+from app.engine.tools.v1.trend_items import TREND_ITEMS_COLLECTION
+
+# =========================================================
+# Trend View Counter (write-behind)
+# Views of opened archive items (GET /trends/{item_id}) are counted in memory and written as aggregated $inc
+# in one bulk_write per flush interval (and at shutdown), instead of one update per view.
+# Listing pages and tool responses are impressions, not views, and are not counted.
+# - sharded counters: concurrent recorders rarely share a lock
+# - top viewed per category is recomputed every top_refresh_interval (distinct + one query per category)
+#   and served from memory
+# =========================================================
+
+
+class ShardedCounter:
+    """(category, link) -> pending views, split over independently locked shards."""
+
+    def __init__(self, shards: int):
+        self._shards = [(threading.Lock(), Counter()) for _ in range(max(1, shards))]
+
+    def add(self, key: tuple[str, str], count: int = 1):
+        lock, counter = self._shards[hash(key) % len(self._shards)]
+        with lock:
+            counter[key] += count
+
+    def drain(self) -> Counter:
+        """Takes every pending count (each shard is swapped out under its own lock)."""
+        drained = Counter()
+        for lock, counter in self._shards:
+            with lock:
+                pending = counter.copy()
+                counter.clear()
+            drained.update(pending)
+        return drained
+
+    def pending(self) -> int:
+        return sum(sum(counter.values()) for _, counter in self._shards)
+
+
+class TrendViewTracker:
+    """record() is safe from any thread; flush() / the timer loop run on the server's event loop."""
+
+    def __init__(self, shards: int, flush_interval: float, top_n: int, top_refresh_interval: float):
+        self.flush_interval = flush_interval
+        self.top_n = top_n
+        self.top_refresh_interval = top_refresh_interval
+        self._counter = ShardedCounter(shards)
+        self._task: asyncio.Task | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        # category -> top viewed items (replaced as a whole, never mutated)
+        self._top: dict[str, list[dict]] = {}
+        self.top_refreshed_at: float | None = None
+
+        self.recorded = 0
+        self.flushed_views = 0
+        self.unmatched = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+
+    # -----------------------------------------------------
+    # Recording
+    # -----------------------------------------------------
+    def record(self, items: list[dict], category: str | None = None):
+        """Counts one view per opened item. An item's own 'category' wins over the given category."""
+        for item in items:
+            link, item_category = item.get("link"), item.get("category") or category
+            if link and item_category:
+                self._counter.add((item_category, link))
+                self.recorded += 1
+
+    # -----------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self):
+        if self.running:
+            return
+        self._flush_lock = asyncio.Lock()
+        await self.refresh_top()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stops the timer and writes what is still pending."""
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+            # On its own, longer interval (not only after a local flush: other API workers write counts too)
+            if self.top_refreshed_at is None or time.time() - self.top_refreshed_at >= self.top_refresh_interval:
+                await self.refresh_top()
+
+    # -----------------------------------------------------
+    # Write-behind
+    # -----------------------------------------------------
+    async def flush(self) -> int:
+        """One bulk_write of aggregated $inc for all pending views. Returns the number of views written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            pending = self._counter.drain()
+            if not pending:
+                return 0
+            ops = [
+                UpdateOne({"category": category, "link": link}, {"$inc": {"view_count": count}})
+                for (category, link), count in pending.items()
+            ]
+            try:
+                result = await get_db()[TREND_ITEMS_COLLECTION].bulk_write(ops, ordered=False)
+            except Exception as e:
+                # Keep the counts for the next flush instead of losing them
+                for key, count in pending.items():
+                    self._counter.add(key, count)
+                self.failed_flushes += 1
+                print(f"[TrendViews] Flush of {len(ops)} counters failed: {e}")
+                return 0
+
+            views = sum(pending.values())
+            self.flushes += 1
+            self.flushed_views += views
+            # Links not (yet) archived have no document to count on
+            self.unmatched += len(ops) - result.matched_count
+            return views
+
+    # -----------------------------------------------------
+    # Top viewed (precomputed)
+    # -----------------------------------------------------
+    async def refresh_top(self):
+        """Recomputes the top viewed items of every category (index: category + view_count)."""
+        try:
+            collection = get_db()[TREND_ITEMS_COLLECTION]
+            top = {}
+            for category in await collection.distinct("category"):
+                cursor = collection.find(
+                    {"category": category, "view_count": {"$gt": 0}},
+                    {"category": 1, "title": 1, "link": 1, "summary": 1, "tags": 1,
+                     "source_domain": 1, "view_count": 1, "collected_at": 1}
+                ).sort("view_count", -1).limit(self.top_n)
+                top[category] = [doc async for doc in cursor]
+        except Exception as e:
+            print(f"[TrendViews] Top viewed refresh failed: {e}")
+            return
+        self._top = top
+        self.top_refreshed_at = time.time()
+
+    def top_viewed(self, category: str, limit: int | None = None) -> list[dict]:
+        return self._top.get(category, [])[:limit or self.top_n]
+
+    def metrics(self) -> dict:
+        return {
+            "running": self.running,
+            "pending_views": self._counter.pending(),
+            "recorded": self.recorded,
+            "flushed_views": self.flushed_views,
+            "unmatched": self.unmatched,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+        }
+
+
+TREND_VIEWS = TrendViewTracker(
+    shards=settings.TREND_VIEW_SHARDS,
+    flush_interval=settings.TREND_VIEW_FLUSH_SECONDS,
+    top_n=settings.TREND_VIEW_TOP_N,
+    top_refresh_interval=settings.TREND_VIEW_TOP_REFRESH_SECONDS
+)
@@ -1,18 +1,49 @@
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.executor import shutdown_executor
+from app.engine.tools.v1.function_tool import awarm_up_tool_resources, tool_resources_status
+from app.engine.tools.v1.trend_archiver import TREND_ARCHIVER
+from app.engine.tools.v1.trend_search_index import TREND_ARCHIVE_SEARCH
+from app.engine.tools.v1.trend_views import TREND_VIEWS
+from app.engine.tools.v1.tool_memo import TOOL_MEMO
+from app.api.v1.agent_registry import init_agent_registry, aclose_agent_registry
 
 # Import API Routers (New Flattened Structure)
 from app.api.v1.router import api_router as api_router_v1
 from app.api.v2.router import api_router as api_router_v2
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 1. Startup: 커리큘럼 인덱스 로드 + 트랙 임베딩 로드 + 설문 쿼리 임베딩 캐시 워밍업
+    # 네트워크 호출은 툴 실행 스레드 풀에서 실행하여 서버 기동을 막지 않습니다.
+    warmup_task = asyncio.create_task(awarm_up_tool_resources())
+    # 트렌드 검색 결과 아카이빙 워커 (배치 bulk_write)
+    await TREND_ARCHIVER.start()
+    # 트렌드 조회수 집계 (주기적 $inc 일괄 기록 + 카테고리별 인기 항목 갱신)
+    await TREND_VIEWS.start()
+    # v1 에이전트 툴 레지스트리 (툴 스키마, 공유 모델 + HTTP 커넥션 풀)
+    init_agent_registry()
+    yield
+    # 2. Shutdown: 대기 중인 아카이브 항목을 모두 기록한 뒤 종료
+    if not warmup_task.done():
+        warmup_task.cancel()
+    await TREND_ARCHIVER.stop()
+    await TREND_VIEWS.stop()
+    await aclose_agent_registry()
+    shutdown_executor()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="Unified Backend for Web Client (REST) and PlayMCP (Agent)",
-    version="0.2.0"
+    version="0.2.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -41,3 +72,22 @@ async def root():
             "api_v1": "/docs"
         }
     }
+
+@app.get("/health")
+async def health():
+    """Liveness + readiness of lazily initialized tool resources (embeddings, search client)."""
+    resources = tool_resources_status()
+    if all(r["ready"] for r in resources):
+        status = "ok"
+    elif any(r["state"] in ("idle", "loading") for r in resources):
+        status = "warming_up"
+    else:
+        status = "degraded"
+    return {
+        "status": status,
+        "resources": resources,
+        "archiver": TREND_ARCHIVER.metrics(),
+        "archive_search": TREND_ARCHIVE_SEARCH.stats(),
+        "views": TREND_VIEWS.metrics(),
+        "tool_memo": TOOL_MEMO.stats()
+    }
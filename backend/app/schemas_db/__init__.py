@@ -3,7 +3,7 @@ from .user import User, UserProfile, UserStats, AuthInfo
 from .track import Track, TrackStep, TrackSubject, TrackBranchOption
 from .interview import Interview, InterviewResult, InterviewMessage
 from .question import Question
-from .trend import Trend, TrendCategory
+from .trend import Trend, TrendCategory, ArchivedTrend
 from .concept import Concept
 
 __all__ = [
@@ -12,6 +12,6 @@ __all__ = [
     "Track", "TrackStep", "TrackSubject", "TrackBranchOption",
     "Interview", "InterviewResult", "InterviewMessage",
     "Question",
-    "Trend", "TrendCategory",
+    "Trend", "TrendCategory", "ArchivedTrend",
     "Concept"
 ]
@@ -17,8 +17,10 @@ class Trend(BaseModel):
 
 class TrendCategory(MongoDBModel):
     """
-    [Collection]: trends
+    [Collection]: trends (Legacy)
     카테고리별로 트렌드를 묶어서 저장하는 구조
+    NOTE: items 배열이 계속 커지므로 신규 데이터는 'trend_items'(ArchivedTrend)에 저장합니다.
+          기존 데이터는 scripts/migrate_trends_to_items.py로 이전합니다.
     """
     category: str  # e.g., "tech_news", "engineering"
     items: List[Trend] = Field(default_factory=list)
@@ -41,3 +43,24 @@ class TrendCategory(MongoDBModel):
                 ]
             }
         }
+
+
+class ArchivedTrend(MongoDBModel, Trend):
+    """
+    [Collection]: trend_items
+    링크 하나당 문서 하나로 저장하는 구조 (category + link 유니크)
+    """
+    category: str  # e.g., "tech_news", "engineering"
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "category": "tech_news",
+                "title": "2025년을 위한 7개의 데이터베이스",
+                "link": "https://news.hada.io/weekly/202451",
+                "summary": "AI 시대에 주목받는 DB 7선 정리...",
+                "tags": ["데이터베이스", "backend"],
+                "source_domain": "news.hada.io",
+                "view_count": 10
+            }
+        }
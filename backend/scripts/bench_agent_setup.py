@@ -0,0 +1,59 @@
+import sys
+import os
+import time
+
+# Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_root = os.path.dirname(current_dir)
+sys.path.append(backend_root)
+
+# 벤치마크는 외부 API를 호출하지 않으므로 더미 키로 Settings 초기화
+os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+
+from langchain_openai import ChatOpenAI
+from app.api_mcp.v1.tools import MCP_TOOLS
+from app.api.v1.agent_registry import build_agent_registry
+
+# Agent Setup Benchmark (per chat request, before the first LLM call)
+# - per-request: ChatOpenAI 생성 + bind_tools(MCP_TOOLS) (스키마 재생성) + 툴 리스트 선형 탐색
+# - registry   : 시작 시 만든 레지스트리의 공유 모델 + dict 조회
+# Usage: python scripts/bench_agent_setup.py [requests]
+
+def _find_tool(tools: list, tool_name: str):
+    for t in tools:
+        if getattr(t, "name", None) == tool_name or getattr(t, "__name__", None) == tool_name:
+            return t
+    return None
+
+def _tool_names() -> list[str]:
+    return [getattr(t, "name", None) or t.__name__ for t in MCP_TOOLS]
+
+def per_request(requests: int) -> float:
+    names = _tool_names()
+    started = time.perf_counter()
+    for _ in range(requests):
+        llm_with_tools = ChatOpenAI(model="gpt-4o", temperature=0.2).bind_tools(MCP_TOOLS)
+        for name in names:
+            _find_tool(MCP_TOOLS, name)
+    return (time.perf_counter() - started) * 1000 / requests
+
+def registry_reuse(requests: int) -> tuple[float, float]:
+    registry = build_agent_registry()
+    names = _tool_names()
+    started = time.perf_counter()
+    for _ in range(requests):
+        llm_with_tools = registry.model
+        for name in names:
+            registry.get(name)
+    return registry.build_ms, (time.perf_counter() - started) * 1000 / requests
+
+def run(requests: int = 200):
+    print(f"📊 Agent Setup Benchmark ({len(MCP_TOOLS)} tools, {requests} requests)")
+    per_request_ms = per_request(requests)
+    build_ms, reuse_ms = registry_reuse(requests)
+    print(f"per-request build : {per_request_ms:8.3f} ms / request")
+    print(f"registry (startup): {build_ms:8.3f} ms once")
+    print(f"registry reuse    : {reuse_ms:8.4f} ms / request")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,83 @@
+import sys
+import os
+import time
+import asyncio
+import statistics
+
+# Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_root = os.path.dirname(current_dir)
+sys.path.append(backend_root)
+
+# 벤치마크는 외부 API를 호출하지 않으므로 더미 키로 Settings 초기화
+os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+
+import mongomock
+import mongomock_motor
+
+from app.engine.tools.v1 import curriculum_index, function_tool
+from sync_track_to_db import _load_track_data, build_track_docs
+
+# Curriculum Index Benchmark
+# - Before: 매 호출마다 tracks 컬렉션 전체 조회 + 스냅샷 재구성 (프로세스 내 인덱스 없음)
+# - After : 프로세스 내 CurriculumIndex 조회
+# Usage: python scripts/bench_curriculum_index.py [iterations]
+
+def _setup_db():
+    """Same tracks in a sync stand-in (per-call legacy scan) and a Motor stand-in (what get_db() returns)."""
+    docs = build_track_docs(_load_track_data())
+    db = mongomock.MongoClient()["ai_techtree_bench"]
+    db["tracks"].insert_many([dict(doc) for doc in docs])
+    motor_db = mongomock_motor.AsyncMongoMockClient()["ai_techtree_bench"]
+    asyncio.run(motor_db["tracks"].insert_many(docs))
+    curriculum_index.get_db = lambda: motor_db
+    return db
+
+def _legacy_index(db):
+    """Per-call full collection scan (pre-index behaviour), wrapped so the current tool code can read it."""
+    docs = list(db["tracks"].find({}).sort("order", 1))
+    return curriculum_index.CurriculumIndex(curriculum_index.build_tracks_dict(docs))
+
+def _measure(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean": statistics.mean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": samples[int(len(samples) * 0.95) - 1],
+    }
+
+def run(iterations: int = 200):
+    db = _setup_db()
+    calls = {
+        "get_techtree_path": lambda: function_tool.f_get_techtree_path("Track 1: AI Engineer"),
+        "get_techtree_subject": lambda: function_tool.f_get_techtree_subject("FastAPI Essentials"),
+    }
+
+    print(f"📊 Curriculum Index Benchmark ({iterations} calls each, ms/call)")
+    print(f"{'tool':<24}{'mode':<8}{'mean':>10}{'p50':>10}{'p95':>10}")
+
+    # The tools read the curriculum through get_curriculum_index() (imported into function_tool)
+    original_getter = function_tool.get_curriculum_index
+    for name, call in calls.items():
+        # Before: a fresh snapshot per call
+        function_tool.get_curriculum_index = lambda: _legacy_index(db)
+        before = _measure(call, iterations)
+
+        # After: compiled index (warm, loaded once the way the af_* entry points do)
+        function_tool.get_curriculum_index = original_getter
+        curriculum_index.invalidate_curriculum_index()
+        asyncio.run(curriculum_index.aget_curriculum_index())
+        call()
+        after = _measure(call, iterations)
+
+        for mode, stats in (("before", before), ("after", after)):
+            print(f"{name:<24}{mode:<8}{stats['mean']:>10.3f}{stats['p50']:>10.3f}{stats['p95']:>10.3f}")
+        print(f"{'':<24}{'speedup':<8}{before['mean'] / after['mean']:>10.1f}x")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,111 @@
+import sys
+import os
+import time
+import asyncio
+from datetime import datetime
+
+# Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_root = os.path.dirname(current_dir)
+sys.path.append(backend_root)
+
+# 벤치마크는 외부 API를 호출하지 않으므로 더미 키로 Settings 초기화
+os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+
+import mongomock
+from pymongo import UpdateOne
+
+from app.engine.tools.v1 import trend_archiver
+from app.engine.tools.v1.trend_archiver import TrendArchiver
+
+# Trend Archive Round Trip Benchmark
+# - Before: 결과마다 find_one(중복 확인) + update_one($push) -> 2N round trips
+# - After : (category, link) 유니크 키에 대한 $setOnInsert upsert를 bulk_write 한 번으로 -> 1 round trip
+# Usage: python scripts/bench_trend_archive.py
+
+class RoundTripCollection:
+    """
+    Local Mongo stand-in (mongomock) that counts client -> server round trips.
+    bulk_write is replayed op by op because mongomock 4.3 rejects the UpdateOne of pymongo >= 4.11,
+    but it is still counted as the single round trip a real server would see.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.round_trips = 0
+
+    def find_one(self, *args, **kwargs):
+        self.round_trips += 1
+        return self._collection.find_one(*args, **kwargs)
+
+    def update_one(self, *args, **kwargs):
+        self.round_trips += 1
+        return self._collection.update_one(*args, **kwargs)
+
+    def bulk_write(self, requests, ordered=True):
+        self.round_trips += 1
+        upserted = 0
+        for op in requests:
+            assert isinstance(op, UpdateOne)
+            result = self._collection.update_one(op._filter, op._doc, upsert=op._upsert)
+            upserted += result.upserted_id is not None
+        return type("BulkResult", (), {"upserted_count": upserted})()
+
+class AsyncRoundTripCollection:
+    """Awaitable bulk_write over a RoundTripCollection (TrendArchiver.flush() awaits the Motor call)."""
+
+    def __init__(self, collection: RoundTripCollection):
+        self._collection = collection
+
+    async def bulk_write(self, requests, ordered=True):
+        return self._collection.bulk_write(requests, ordered)
+
+def _results(n: int, offset: int = 0) -> list[dict]:
+    return [
+        {"title": f"post {i}", "link": f"https://toss.tech/article/{i}", "summary": "", "tags": ["rag"],
+         "source_domain": "toss.tech", "collected_at": datetime.utcnow(), "view_count": 0}
+        for i in range(offset, offset + n)
+    ]
+
+def _legacy_archive(collection, items: list[dict], category: str) -> dict:
+    """Pre-batching behaviour (_process_and_save_background on the embedded 'trends' layout)."""
+    stats = {"inserted": 0, "skipped": 0}
+    for item in items:
+        if collection.find_one({"category": category, "items.link": item["link"]}):
+            stats["skipped"] += 1
+            continue
+        collection.update_one(
+            {"category": category},
+            {"$push": {"items": item}, "$set": {"last_updated": datetime.utcnow()}},
+            upsert=True
+        )
+        stats["inserted"] += 1
+    return stats
+
+def run():
+    print("📊 Trend Archive Benchmark (round trips per archive call)")
+    print(f"{'N':>5}  {'mode':<8}{'round trips':>12}{'inserted':>10}{'skipped':>9}{'ms':>9}")
+
+    for n in (5, 20, 100):
+        # Second call repeats half of the first call's links (typical re-search)
+        calls = [_results(n), _results(n, offset=n // 2)]
+
+        db = mongomock.MongoClient()["ai_techtree_bench"]
+        legacy = RoundTripCollection(db["trends"])
+        batched = RoundTripCollection(db["trend_items"])
+        archiver = TrendArchiver(maxsize=1, batch_size=n, flush_interval=0, drain_timeout=0)
+        trend_archiver.get_db = lambda: {trend_archiver.TREND_ITEMS_COLLECTION: AsyncRoundTripCollection(batched)}
+
+        for items in calls:
+            for mode, collection, archive in (
+                ("before", legacy, lambda: _legacy_archive(legacy, items, "k_blog")),
+                ("after", batched, lambda: asyncio.run(archiver.flush([("k_blog", item) for item in items]))),
+            ):
+                collection.round_trips = 0
+                start = time.perf_counter()
+                stats = archive()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                print(f"{n:>5}  {mode:<8}{collection.round_trips:>12}{stats['inserted']:>10}{stats['skipped']:>9}{elapsed_ms:>9.2f}")
+
+if __name__ == "__main__":
+    run()
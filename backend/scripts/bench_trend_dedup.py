@@ -0,0 +1,76 @@
+import sys
+import os
+import time
+import random
+
+# Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_root = os.path.dirname(current_dir)
+sys.path.append(backend_root)
+
+# 벤치마크는 외부 API를 호출하지 않으므로 더미 키로 Settings 초기화
+os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+
+from app.engine.tools.v1.simhash import NearDuplicateIndex, NEAR_DUPLICATE_DISTANCE, SIMHASH_BITS, hamming, simhash
+
+# Near-Duplicate Lookup Benchmark
+# - linear: 아카이브 전체 fingerprint와 해밍 거리 비교 (O(N))
+# - lsh   : 밴드 버킷 후보만 비교 (NearDuplicateIndex)
+# 아카이브 fingerprint는 무작위 64-bit 값, 조회는 절반이 near-duplicate(<= max distance 비트 변경)
+# Usage: python scripts/bench_trend_dedup.py [queries]
+
+SIZES = (1_000, 10_000, 100_000)
+LINEAR_MAX_SIZE = 100_000
+
+def _perturb(rng: random.Random, fingerprint: int) -> int:
+    for bit in rng.sample(range(SIMHASH_BITS), rng.randint(0, NEAR_DUPLICATE_DISTANCE)):
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+def _linear_find(fingerprints: list[int], fingerprint: int) -> bool:
+    return any(hamming(fingerprint, other) <= NEAR_DUPLICATE_DISTANCE for other in fingerprints)
+
+def _fingerprint_cost(rng: random.Random, samples: int = 200) -> float:
+    """Average ms to fingerprint a ~800 character summary (independent of the archive size)."""
+    vocab = [f"term{i}" for i in range(5000)]
+    texts = [" ".join(rng.choice(vocab) for _ in range(120)) for _ in range(samples)]
+    started = time.perf_counter()
+    for text in texts:
+        simhash(text)
+    return (time.perf_counter() - started) * 1000 / samples
+
+def run(queries: int = 1000):
+    rng = random.Random(42)
+    print(f"📊 Near-Duplicate Lookup Benchmark ({queries} lookups per size, max distance {NEAR_DUPLICATE_DISTANCE})")
+    print(f"fingerprinting: {_fingerprint_cost(rng):.3f} ms per summary")
+    print(f"{'archive':>9}{'lsh µs':>10}{'candidates':>12}{'linear µs':>12}{'found':>8}")
+
+    for size in SIZES:
+        fingerprints = [rng.getrandbits(SIMHASH_BITS) for _ in range(size)]
+        index = NearDuplicateIndex()
+        for key, fingerprint in enumerate(fingerprints):
+            index.add(key, fingerprint)
+
+        probes = [
+            _perturb(rng, rng.choice(fingerprints)) if i % 2 == 0 else rng.getrandbits(SIMHASH_BITS)
+            for i in range(queries)
+        ]
+
+        started = time.perf_counter()
+        found = sum(index.find(probe) is not None for probe in probes)
+        lsh_us = (time.perf_counter() - started) * 1e6 / queries
+        candidates = sum(len(index.candidates(probe)) for probe in probes) / queries
+
+        linear_us = float("nan")
+        if size <= LINEAR_MAX_SIZE:
+            sample = probes[:max(1, queries // 20)]
+            started = time.perf_counter()
+            linear_found = sum(_linear_find(fingerprints, probe) for probe in sample)
+            linear_us = (time.perf_counter() - started) * 1e6 / len(sample)
+            # Pigeonhole: the banded lookup must find everything the full scan finds
+            assert linear_found == sum(index.find(probe) is not None for probe in sample)
+
+        print(f"{size:>9}{lsh_us:>10.1f}{candidates:>12.1f}{linear_us:>12.1f}{found:>8}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,267 @@
+import sys
+import os
+import time
+import json
+import random
+import asyncio
+import argparse
+import zlib
+import threading
+import contextlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_root = os.path.dirname(current_dir)
+sys.path.append(backend_root)
+
+# 벤치마크는 외부 API를 호출하지 않으므로 더미 키로 Settings 초기화
+os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+
+import mongomock
+import mongomock_motor
+from pymongo import InsertOne, UpdateOne
+
+from app.core.config import settings
+from app.engine.tools.v1 import function_tool, trend_archiver, trend_cache, trend_search_index
+from app.engine.tools.v1.search_client import (
+    FakeSearchClient,
+    HedgedSearch,
+    LatencyTracker,
+    RecordingSearchClient,
+    ReplaySearchClient,
+    lognormal_latency,
+)
+from app.engine.tools.v1.trend_archiver import TrendArchiver
+from app.engine.tools.v1.trend_cache import TrendSearchCache
+from app.engine.tools.v1.trend_search_index import TrendArchiveSearch
+
+# Trend Path Latency Benchmark (offline: recorded search responses + in-memory Mongo)
+# - 검색: ReplaySearchClient (기록된 응답 + lognormal 지연, slow tail, 실패 주입)
+#   fixture가 없으면 커리큘럼 주제로 합성 응답을 RecordingSearchClient로 기록해서 생성
+# - 워크로드: 커리큘럼 주제 키워드를 Zipf 분포로 반복 (인기 주제는 캐시/아카이브 적중)
+# - sync : f_get_techtree_trend를 스레드 풀에서 동시 실행 (스레드마다 별도 루프, 아카이브는 호출마다 inline bulk_write)
+# - async: af_get_techtree_trend를 이벤트 루프에서 동시 실행 (아카이빙 워커가 배치로 기록)
+# 지연은 TIME_SCALE로 축소 실행 후 모델 기준(ms)으로 환산. DB 쓰기 = 서버 왕복 기준 (bulk_write 1회 = 1)
+# Usage: python scripts/bench_trend_latency.py [--calls 400] [--concurrency 16] [--fixture path]
+
+# 1s of modelled latency = 100ms of wall time. In-process CPU work (Mongo stand-in, fingerprints) is not scaled
+# down, so it shows up 10x inflated in the modelled numbers: keep the scale coarse.
+TIME_SCALE = 0.1
+TRACK_DB_PATH = os.path.join(backend_root, "app", "source", "tracks.json")
+DEFAULT_FIXTURE = os.path.join(backend_root, ".cache", "bench_search_fixtures.jsonl")
+CATEGORIES = ("k_blog", "tech_news")
+
+# Search latency model (modelled seconds): median 1.2s, 5% slow tail 5~10s, 2% failures
+LATENCY_MEDIAN = 1.2
+LATENCY_SIGMA = 0.4
+TAIL_RATE = 0.05
+FAILURE_RATE = 0.02
+
+# ---------------------------------------------------------
+# DB write counting (mongomock, shared by the sync client and mongomock_motor)
+# ---------------------------------------------------------
+WRITES = Counter()
+_WRITE_LOCK = threading.Lock()
+_Collection = mongomock.collection.Collection
+_ORIGINAL = {name: getattr(_Collection, name) for name in ("insert_one", "insert_many", "update_one", "update_many", "delete_many")}
+
+def _counted(name):
+    original = _ORIGINAL[name]
+
+    def method(self, *args, **kwargs):
+        with _WRITE_LOCK:
+            WRITES[self.name] += 1
+        return original(self, *args, **kwargs)
+    return method
+
+def _bulk_write(self, requests, ordered=True, **kwargs):
+    """
+    One round trip. Replayed through the uncounted single-document methods because mongomock 4.3
+    rejects the UpdateOne of pymongo >= 4.11.
+    """
+    with _WRITE_LOCK:
+        WRITES[self.name] += 1
+    upserted, matched = 0, 0
+    for op in requests:
+        if isinstance(op, InsertOne):
+            _ORIGINAL["insert_one"](self, op._doc)
+            continue
+        assert isinstance(op, UpdateOne)
+        result = _ORIGINAL["update_one"](self, op._filter, op._doc, upsert=op._upsert)
+        upserted += result.upserted_id is not None
+        matched += result.matched_count
+    return type("BulkResult", (), {"upserted_count": upserted, "matched_count": matched})()
+
+def install_write_counter():
+    for name in _ORIGINAL:
+        setattr(_Collection, name, _counted(name))
+    _Collection.bulk_write = _bulk_write
+
+# ---------------------------------------------------------
+# Fixture + workload
+# ---------------------------------------------------------
+def _subjects() -> list[str]:
+    with open(TRACK_DB_PATH, "r", encoding="utf-8") as f:
+        tree = json.load(f)
+    subjects = []
+    for track in tree.values():
+        for step in track["steps"].values():
+            for opt_key, option in step.items():
+                if opt_key != "description":
+                    subjects.extend(title for title in option if title != "description")
+    return sorted(set(subjects))
+
+def _synthetic_response(kwargs: dict) -> dict:
+    """Five results per query; a mirror of the first result shows up in every global (basic) search."""
+    rng = random.Random(kwargs["query"] + kwargs["search_depth"])
+    topic = kwargs["query"]
+    results = []
+    for i in range(5 if kwargs["search_depth"] == "advanced" else 3):
+        words = " ".join(f"term{rng.randrange(3000)}" for _ in range(120))
+        results.append({"title": f"{topic} #{i}", "url": f"https://blog{i}.example.com/{zlib.crc32(topic.encode())}/{i}", "content": words})
+    if kwargs["search_depth"] == "basic":
+        results[1] = {**results[0], "url": results[0]["url"].replace("blog0", "mirror")}
+    return {"answer": f"{topic} summary", "results": results}
+
+def ensure_fixture(path: str, subjects: list[str]) -> int:
+    """Records primary + fallback responses per (subject, category) through the real query builder."""
+    if os.path.exists(path):
+        return 0
+    # Hedge delay 0 + a slower primary: the fallback search always starts too, so both requests get recorded
+    slow_primary = lambda kwargs: 0.005 if kwargs["search_depth"] == "advanced" else 0.0
+    recorder = RecordingSearchClient(FakeSearchClient(latency=slow_primary, respond=_synthetic_response), path)
+    record_search = HedgedSearch(0.5, hedge_default=0.0, deadline=None, max_workers=2)
+    record_search.latencies = LatencyTracker(min_samples=sys.maxsize)  # never leaves the default delay
+    original, function_tool.TREND_SEARCH = function_tool.TREND_SEARCH, record_search
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            for subject in subjects:
+                for category in CATEGORIES:
+                    function_tool._search_trends([subject], category, client=recorder)
+    finally:
+        function_tool.TREND_SEARCH = original
+        record_search._pool.shutdown(wait=True)
+    with open(path, "r", encoding="utf-8") as f:
+        return sum(1 for _ in f)
+
+def workload(subjects: list[str], calls: int, seed: int = 7) -> list[tuple[list[str], str]]:
+    """Zipf-like popularity: a few subjects get most of the lookups."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(subjects))]
+    picks = rng.choices(subjects, weights=weights, k=calls)
+    return [([subject], rng.choice(CATEGORIES)) for subject in picks]
+
+# ---------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------
+def _percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+def _setup(fixture: str, db, seed: int) -> ReplaySearchClient:
+    client = ReplaySearchClient(
+        fixture,
+        latency=lognormal_latency(
+            LATENCY_MEDIAN * TIME_SCALE, LATENCY_SIGMA, tail_rate=TAIL_RATE,
+            tail_range=(5.0 * TIME_SCALE, 10.0 * TIME_SCALE), seed=seed,
+        ),
+        failure_rate=FAILURE_RATE,
+        seed=seed,
+    )
+    for module in (trend_archiver, trend_cache, trend_search_index):
+        module.get_db = lambda: db
+    function_tool._get_tavily_client = lambda: client
+    function_tool.TREND_SEARCH = HedgedSearch(
+        settings.TREND_SEARCH_HEDGE_PERCENTILE,
+        hedge_default=settings.TREND_SEARCH_HEDGE_DEFAULT_SECONDS * TIME_SCALE,
+        deadline=settings.TREND_SEARCH_DEADLINE_SECONDS * TIME_SCALE,
+        max_workers=32,
+    )
+    function_tool.TREND_SEARCH_CACHE = TrendSearchCache(
+        settings.TREND_CACHE_SIZE, settings.TREND_CACHE_FRESH_SECONDS, settings.TREND_CACHE_STALE_SECONDS
+    )
+    function_tool.TREND_ARCHIVE_SEARCH = TrendArchiveSearch(
+        settings.TREND_ARCHIVE_MIN_HITS, settings.TREND_ARCHIVE_MIN_COVERAGE,
+        refresh_seconds=0.5 * TIME_SCALE, rebuild_seconds=settings.TREND_ARCHIVE_INDEX_REBUILD_SECONDS,
+    )
+    function_tool.TREND_ARCHIVER = TrendArchiver(
+        settings.TREND_ARCHIVE_QUEUE_SIZE, settings.TREND_ARCHIVE_BATCH_SIZE,
+        flush_interval=settings.TREND_ARCHIVE_FLUSH_SECONDS * TIME_SCALE, drain_timeout=settings.TREND_ARCHIVE_DRAIN_SECONDS,
+    )
+    return client
+
+def run_sync(fixture: str, calls: list, concurrency: int) -> dict:
+    # f_get_techtree_trend runs the async path on a private loop per call (no archiving worker -> inline writes)
+    db = mongomock_motor.AsyncMongoMockClient()["ai_techtree_bench"]
+    client = _setup(fixture, db, seed=1)
+    WRITES.clear()
+
+    def one_call(args):
+        started = time.perf_counter()
+        function_tool.f_get_techtree_trend(*args)
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(one_call, calls))
+    return {"latencies": latencies, "searches": client.calls, "failures": client.failures, "writes": dict(WRITES)}
+
+def run_async(fixture: str, calls: list, concurrency: int) -> dict:
+    db = mongomock_motor.AsyncMongoMockClient()["ai_techtree_bench"]
+    client = _setup(fixture, db, seed=1)
+    WRITES.clear()
+
+    async def scenario():
+        archiver = function_tool.TREND_ARCHIVER
+        await archiver.start()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one_call(args):
+            async with semaphore:
+                started = time.perf_counter()
+                await function_tool.af_get_techtree_trend(*args)
+                return time.perf_counter() - started
+
+        latencies = await asyncio.gather(*(one_call(args) for args in calls))
+        # Background refreshes and the last archive batch are part of the pipeline's write cost
+        await asyncio.gather(*list(function_tool._BACKGROUND_TASKS))
+        await archiver.stop()
+        return latencies
+
+    latencies = asyncio.run(scenario())
+    return {"latencies": latencies, "searches": client.calls, "failures": client.failures, "writes": dict(WRITES)}
+
+def report(name: str, calls: int, outcome: dict):
+    ms = [latency / TIME_SCALE * 1000 for latency in outcome["latencies"]]
+    writes = sum(outcome["writes"].values())
+    print(
+        f"{name:<7}{_percentile(ms, 0.50):>9.0f}{_percentile(ms, 0.95):>9.0f}{_percentile(ms, 0.99):>9.0f}"
+        f"{outcome['searches']:>10}{outcome['failures']:>10}{writes:>8}{writes / calls:>12.3f}"
+    )
+    print(f"{'':<7}writes by collection: {outcome['writes']}")
+
+def run(calls: int, concurrency: int, fixture: str):
+    subjects = _subjects()
+    recorded = ensure_fixture(fixture, subjects)
+    if recorded:
+        print(f"Recorded {recorded} synthetic responses -> {fixture}")
+    install_write_counter()
+    plan = workload(subjects, calls)
+
+    print(f"📊 Trend Path Benchmark ({calls} calls over {len(subjects)} subjects, concurrency {concurrency}, modelled ms)")
+    print(f"{'mode':<7}{'p50':>9}{'p95':>9}{'p99':>9}{'searches':>10}{'failures':>10}{'writes':>8}{'writes/call':>12}")
+    # The tool's own progress prints ([Fallback] ...) would drown the table
+    with contextlib.redirect_stdout(open(os.devnull, "w")):
+        sync_outcome = run_sync(fixture, plan, concurrency)
+        async_outcome = run_async(fixture, plan, concurrency)
+    report("sync", calls, sync_outcome)
+    report("async", calls, async_outcome)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline latency / DB write benchmark for the trend tool.")
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="Recorded search responses (JSONL); generated if missing.")
+    args = parser.parse_args()
+    run(args.calls, args.concurrency, args.fixture)
@@ -0,0 +1,83 @@
+import sys
+import os
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+# Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
+current_dir = os.path.dirname(os.path.abspath(__file__))
+backend_root = os.path.dirname(current_dir)
+sys.path.append(backend_root)
+
+# 벤치마크는 외부 API를 호출하지 않으므로 더미 키로 Settings 초기화
+os.environ.setdefault("OPENAI_API_KEY", "bench-dummy-key")
+
+from app.engine.tools.v1.search_client import FakeSearchClient, HedgedSearch
+
+# Trend Search Tail Latency Benchmark (FakeSearchClient, injected latencies)
+# - sequential: 도메인 검색 완료 후 결과가 없을 때만 글로벌 검색 (기존 동작, 마감 없음)
+# - hedged    : 도메인 검색이 최근 p90 지연을 넘기면 글로벌 검색 병렬 시작 + 전체 마감 시간
+# Latency model (seconds, before TIME_SCALE):
+#   domain-filtered advanced search: lognormal ~1.5s, 10% slow tail 5~10s, 15% empty
+#   global basic search            : lognormal ~0.8s
+# Usage: python scripts/bench_trend_search.py [calls]
+
+TIME_SCALE = 0.02  # 1s of modelled latency = 20ms of wall time
+DEADLINE = 6.0
+HEDGE_PERCENTILE = 0.9
+
+def _fake_client(seed: int) -> FakeSearchClient:
+    rng = random.Random(seed)
+
+    def latency(kwargs):
+        if kwargs["search_depth"] == "advanced":
+            seconds = rng.uniform(5.0, 10.0) if rng.random() < 0.10 else rng.lognormvariate(0.4, 0.3)
+        else:
+            seconds = rng.lognormvariate(-0.2, 0.3)
+        return seconds * TIME_SCALE
+
+    empty = {"answer": "", "results": []}
+    def respond(kwargs):
+        if kwargs["search_depth"] == "advanced" and rng.random() < 0.15:
+            return empty
+        return FakeSearchClient._default_response(kwargs)
+
+    return FakeSearchClient(latency=latency, respond=respond)
+
+def _percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+def run(calls: int = 300, concurrency: int = 8):
+    modes = {
+        "sequential": HedgedSearch(None, hedge_default=0.0, deadline=None, max_workers=32),
+        "hedged": HedgedSearch(HEDGE_PERCENTILE, hedge_default=4.0 * TIME_SCALE, deadline=DEADLINE * TIME_SCALE, max_workers=32),
+    }
+    primary = {"query": "rag", "search_depth": "advanced"}
+    fallback = {"query": "rag", "search_depth": "basic"}
+
+    print(f"📊 Trend Search Benchmark ({calls} calls, concurrency {concurrency}, modelled seconds)")
+    print(f"{'mode':<12}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'searches':>10}{'hedges':>8}{'timeouts':>10}{'empty':>7}")
+
+    for name, search in modes.items():
+        client = _fake_client(seed=42)
+
+        def one_call(_):
+            started = time.perf_counter()
+            outcome = search.search(client, primary, fallback)
+            answered = any(r and r.get("results") for r in (outcome["primary"], outcome["fallback"]))
+            return (time.perf_counter() - started) / TIME_SCALE, answered
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(one_call, range(calls)))
+        latencies = [latency for latency, _ in samples]
+        empty = sum(1 for _, answered in samples if not answered)
+
+        print(
+            f"{name:<12}{_percentile(latencies, 0.50):>8.2f}{_percentile(latencies, 0.95):>8.2f}"
+            f"{_percentile(latencies, 0.99):>8.2f}{max(latencies):>8.2f}{client.calls:>10}"
+            f"{search.hedges:>8}{search.timeouts:>10}{empty:>7}"
+        )
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -1,5 +1,6 @@
 import sys
 import os
+import asyncio
 
 # Backend root 경로를 path에 추가하여 app 모듈 import 가능하게 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -8,18 +9,18 @@ sys.path.append(backend_root)
 
 from pymongo import ASCENDING, DESCENDING
 from app.core.database import get_db
+from app.core.config import settings
 
-def init_db():
+async def _init_db(db):
+    """get_db()는 async Motor DB라서 create_index를 await 해야 실제로 인덱스가 생성됨"""
     print("🚀 Initializing Database Collections and Indexes...")
     
-    db = get_db()
-    
     # 1. Users Collections
     # Index: {"auth.email": 1} (Unique)
     # Index: {"auth.uid": 1}
     print("🔹 Setting up 'users' collection...")
-    db.users.create_index([("auth.email", ASCENDING)], unique=True)
-    db.users.create_index([("auth.uid", ASCENDING)])
+    await db.users.create_index([("auth.email", ASCENDING)], unique=True)
+    await db.users.create_index([("auth.uid", ASCENDING)])
     print("   - Created index: auth.email (Unique)")
     print("   - Created index: auth.uid")
 
@@ -27,15 +28,15 @@ def init_db():
     # Index: {"user_id": 1}
     # Index: {"meta.status": 1}
     print("🔹 Setting up 'interviews' collection...")
-    db.interviews.create_index([("user_id", ASCENDING)])
-    db.interviews.create_index([("meta.status", ASCENDING)])
+    await db.interviews.create_index([("user_id", ASCENDING)])
+    await db.interviews.create_index([("meta.status", ASCENDING)])
     print("   - Created index: user_id")
     print("   - Created index: meta.status")
 
     # 3. Tracks Collection
     # Index: {"title": 1} (Unique)
     print("🔹 Setting up 'tracks' collection...")
-    db.tracks.create_index([("title", ASCENDING)], unique=True)
+    await db.tracks.create_index([("title", ASCENDING)], unique=True)
     print("   - Created index: title (Unique)")
 
     # 4. Trends Collection (Refactored)
@@ -48,31 +49,62 @@ def init_db():
     # If standard indexes exist on 'category', create_index with unique=True might fail or convert depending on driver/version.
     # It is recommended to drop the 'trends' collection if the schema changed drastically.
     
-    db.trends.create_index([("category", ASCENDING)], unique=True)
-    db.trends.create_index([("items.link", ASCENDING)])
-    db.trends.create_index([("items.tags", ASCENDING)])
+    await db.trends.create_index([("category", ASCENDING)], unique=True)
+    await db.trends.create_index([("items.link", ASCENDING)])
+    await db.trends.create_index([("items.tags", ASCENDING)])
     
     print("   - Created index: category (Unique)")
     print("   - Created index: items.link")
     print("   - Created index: items.tags")
 
+    # 4-1. Trend Items Collection (one document per archived link, replaces trends.items)
+    # Index: {"category": 1, "link": 1} (Unique, idempotent upserts)
+    # Index: {"category": 1, "collected_at": -1} (Paginated reads per category)
+    # Index: {"tags": 1}, {"collected_at": -1}
+    print("🔹 Setting up 'trend_items' collection...")
+    await db.trend_items.create_index([("category", ASCENDING), ("link", ASCENDING)], unique=True)
+    await db.trend_items.create_index([("category", ASCENDING), ("collected_at", DESCENDING)])
+    await db.trend_items.create_index([("tags", ASCENDING)])
+    await db.trend_items.create_index([("collected_at", DESCENDING)])
+    await db.trend_items.create_index([("category", ASCENDING), ("view_count", DESCENDING)])
+    print("   - Created index: category + link (Unique)")
+    print("   - Created index: category + collected_at")
+    print("   - Created index: tags")
+    print("   - Created index: collected_at")
+    print("   - Created index: category + view_count")
+
+    # Trend Search Cache (Tavily results per keywords + category)
+    # TTL Index: {"cached_at": 1} -> documents removed after the stale window
+    print("🔹 Setting up 'trend_search_cache' collection...")
+    await db.trend_search_cache.create_index(
+        [("cached_at", ASCENDING)],
+        expireAfterSeconds=int(settings.TREND_CACHE_STALE_SECONDS)
+    )
+    print("   - Created index: cached_at (TTL)")
+
     # 5. Questions Collection
     # Index: {"subject": 1, "level": 1}
     print("🔹 Setting up 'questions' collection...")
-    db.questions.create_index([("subject", ASCENDING), ("level", ASCENDING)])
+    await db.questions.create_index([("subject", ASCENDING), ("level", ASCENDING)])
     print("   - Created index: subject + level")
     
     # 6. Concepts Collection
     # Index: {"subject": 1, "level": 1}
     # Index: {"name": 1}
     print("🔹 Setting up 'concepts' collection...")
-    db.concepts.create_index([("subject", ASCENDING), ("level", ASCENDING)])
-    db.concepts.create_index([("name", ASCENDING)])
+    await db.concepts.create_index([("subject", ASCENDING), ("level", ASCENDING)])
+    await db.concepts.create_index([("name", ASCENDING)])
     print("   - Created index: subject + level")
     print("   - Created index: name")
 
     print("\n✅ Database Initialization Completed!")
 
+def init_db():
+    db = get_db()
+    if db is None:
+        raise RuntimeError("Database connection returned None (MONGODB_URL 미설정)")
+    asyncio.run(_init_db(db))
+
 if __name__ == "__main__":
     try:
         init_db()
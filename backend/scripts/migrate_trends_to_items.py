@@ -0,0 +1,88 @@
+import sys
+import os
+import asyncio
+import logging
+import argparse
+
+# Add backend directory to path to allow imports from app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+try:
+    from app.core.database import get_db
+    from app.engine.tools.v1.trend_items import TREND_ITEMS_COLLECTION, build_item_upserts
+except ImportError as e:
+    print(f"Import Error: {e}")
+    sys.exit(1)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+LEGACY_COLLECTION = "trends"
+
+async def migrate_trends(db, batch_size: int = 500, drop_legacy: bool = False) -> dict:
+    """
+    Copies every embedded 'trends.items' entry into 'trend_items' (one document per link).
+    - Idempotent: upserts keyed by (category, link) with $setOnInsert, so re-running is safe
+      and items archived by the running service in the meantime are never overwritten.
+    - db is the async Motor database from get_db(), so every read/write is awaited.
+    - The legacy collection is kept unless drop_legacy is set (and every item was accounted for).
+    """
+    legacy = db[LEGACY_COLLECTION]
+    target = db[TREND_ITEMS_COLLECTION]
+    stats = {"categories": 0, "items": 0, "inserted": 0, "existing": 0, "skipped": 0}
+
+    async def flush(batch):
+        if not batch:
+            return
+        ops = build_item_upserts(batch)
+        result = await target.bulk_write(ops, ordered=False)
+        stats["inserted"] += result.upserted_count
+        stats["existing"] += len(ops) - result.upserted_count
+
+    async for doc in legacy.find({}, {"category": 1, "items": 1}):
+        category = doc.get("category")
+        items = doc.get("items") or []
+        stats["categories"] += 1
+        logger.info(f"Migrating '{category}' ({len(items)} items)...")
+
+        batch = []
+        for item in items:
+            stats["items"] += 1
+            if not category or not item.get("link"):
+                stats["skipped"] += 1
+                continue
+            batch.append((category, item))
+            if len(batch) >= batch_size:
+                await flush(batch)
+                batch = []
+        await flush(batch)
+
+    logger.info(
+        f"✅ {stats['items']} items in {stats['categories']} categories: "
+        f"{stats['inserted']} inserted, {stats['existing']} already present, {stats['skipped']} skipped (no link)."
+    )
+
+    if drop_legacy:
+        migrated = await target.count_documents({})
+        if migrated >= stats["inserted"] + stats["existing"]:
+            await legacy.drop()
+            logger.info(f"Dropped legacy '{LEGACY_COLLECTION}' collection.")
+        else:
+            logger.warning("Item count mismatch, legacy collection kept.")
+    return stats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate embedded trends.items to the trend_items collection.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--drop-legacy", action="store_true", help="Drop 'trends' after a successful migration.")
+    args = parser.parse_args()
+
+    db = get_db()
+    if db is None:
+        logger.error("Database connection returned None")
+        sys.exit(1)
+    asyncio.run(migrate_trends(db, batch_size=args.batch_size, drop_legacy=args.drop_legacy))
+
+
+# python backend/scripts/init_db.py && python backend/scripts/migrate_trends_to_items.py
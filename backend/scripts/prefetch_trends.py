@@ -0,0 +1,237 @@
+import sys
+import os
+import re
+import json
+import time
+import asyncio
+import logging
+import argparse
+from datetime import datetime
+
+# Add backend directory to path to allow imports from app
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+try:
+    from app.core.config import settings
+    from app.engine.tools.v1 import function_tool
+    from app.engine.tools.v1.curriculum_index import compute_curriculum_version
+    from app.engine.tools.v1.trend_cache import TREND_SEARCH_CACHE, trend_cache_key
+    from app.engine.tools.v1.trend_archiver import TREND_ARCHIVER
+except ImportError as e:
+    print(f"Import Error: {e}")
+    sys.exit(1)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# =========================================================
+# Offline Trend Prefetch
+# 커리큘럼(tracks.json)의 모든 Subject(+ 옵션: 개념 키워드)에 대해 트렌드 검색을 미리 실행하여
+# 검색 캐시(trend_search_cache)와 아카이브(trend_items)를 채운다.
+# -> 대화 중 커리큘럼 주제에 대한 get_techtree_trend는 캐시/아카이브에서 바로 응답
+# - 동시 실행 수 제한 + 초당 시작 횟수 제한 (Tavily rate limit)
+# - 완료된 작업을 체크포인트 파일에 기록 -> 중단 후 재실행 시 이어서 진행
+# - max age(기본 TREND_PREFETCH_MAX_AGE_SECONDS, cron 주기 이상) 안에 캐시된 검색은 건너뜀
+# Usage (cron, e.g. every 6h): python backend/scripts/prefetch_trends.py --concepts
+# =========================================================
+
+TRACK_DB_PATH = os.path.join(os.path.dirname(__file__), "../app/source/tracks.json")
+CHECKPOINT_PATH = os.path.join(os.path.dirname(__file__), "../.cache/prefetch_trends.checkpoint.json")
+
+DEFAULT_CATEGORIES = ("k_blog", "tech_news")
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE_PER_SECOND = 2.0
+
+# "GIL (Global Interpreter Lock)의 개념과 ..." -> "GIL"
+_CONCEPT_CUT_RE = re.compile(r"\s*[(:]")
+
+def _load_track_data():
+    with open(TRACK_DB_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def concept_keyword(concept: str) -> str:
+    return _CONCEPT_CUT_RE.split(concept, maxsplit=1)[0].strip()
+
+def build_prefetch_jobs(ai_tech_tree: dict, categories=DEFAULT_CATEGORIES, include_concepts: bool = False) -> list[dict]:
+    """
+    One job per (keywords, category); job id == trend cache key, so duplicates across tracks collapse.
+    Subjects use their title; concept jobs use [subject title, short concept keyword].
+    """
+    jobs = {}
+
+    def add(keywords: list[str]):
+        for category in categories:
+            key = trend_cache_key(keywords, category)
+            jobs.setdefault(key, {"id": key, "keywords": keywords, "category": category})
+
+    for track_data in ai_tech_tree.values():
+        for step_key in sorted(track_data["steps"].keys()):
+            for opt_key, opt_data in sorted(track_data["steps"][step_key].items()):
+                if opt_key == "description":
+                    continue
+                for subject_title, subject_val in opt_data.items():
+                    if subject_title == "description":
+                        continue
+                    add([subject_title])
+                    if not include_concepts or not isinstance(subject_val, dict):
+                        continue
+                    for level_key, concepts in sorted(subject_val.items()):
+                        if level_key == "description":
+                            continue
+                        for concept in concepts:
+                            keyword = concept_keyword(concept)
+                            if keyword:
+                                add([subject_title, keyword])
+    return list(jobs.values())
+
+# ---------------------------------------------------------
+# Checkpoint (resume support)
+# ---------------------------------------------------------
+def load_checkpoint(path: str, version: str) -> dict:
+    """Resumes an unfinished run of the same curriculum version, otherwise starts a new run."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("version") == version and not checkpoint.get("completed_at"):
+            return checkpoint
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {"version": version, "started_at": datetime.utcnow().isoformat(), "completed_at": None, "done": []}
+
+def save_checkpoint(path: str, checkpoint: dict):
+    # tmp + rename: a crash mid-write never leaves a truncated checkpoint
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+class RateLimiter:
+    """Spaces out job starts to at most 'rate' per second (shared by all workers)."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+# ---------------------------------------------------------
+# Runner
+# ---------------------------------------------------------
+async def prefetch_trends(
+    jobs: list[dict],
+    version: str,
+    checkpoint_path: str = CHECKPOINT_PATH,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE_PER_SECOND,
+    max_age: float = settings.TREND_PREFETCH_MAX_AGE_SECONDS,
+) -> dict:
+    """
+    Runs every job not yet in the checkpoint.
+    - Jobs cached within max_age seconds are skipped (no search). The serving cache's fresh window is far
+      shorter than the cron interval, so it cannot be the criterion here.
+    - Failed jobs are left out of the checkpoint and retried by the next run. _search_trends reports errors
+      in its response instead of raising, so a response that is not a web result with items counts as failed.
+    Returns {"total", "searched", "fresh", "resumed", "failed", "empty"}.
+    """
+    checkpoint = load_checkpoint(checkpoint_path, version)
+    done = set(checkpoint["done"])
+    pending = [job for job in jobs if job["id"] not in done]
+    stats = {"total": len(jobs), "searched": 0, "fresh": 0, "resumed": len(jobs) - len(pending), "failed": 0, "empty": 0}
+    if stats["resumed"]:
+        logger.info(f"Resuming run from {checkpoint['started_at']}: {stats['resumed']} jobs already done.")
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for job in pending:
+        queue.put_nowait(job)
+    limiter = RateLimiter(rate)
+
+    def mark_done(job: dict):
+        checkpoint["done"].append(job["id"])
+        save_checkpoint(checkpoint_path, checkpoint)
+
+    async def run_job(job: dict):
+        cached = await TREND_SEARCH_CACHE.aget(job["id"])
+        if cached and (datetime.utcnow() - cached["cached_at"]).total_seconds() < max_age:
+            stats["fresh"] += 1
+            return
+        await limiter.wait()
+        response = await function_tool._asearch_and_cache(job["keywords"], job["category"], job["id"])
+        if response.get("source") != "web":
+            raise RuntimeError(response.get("answer") or "search failed")
+        if not response.get("items"):
+            stats["empty"] += 1
+            raise RuntimeError("no search results")
+        stats["searched"] += 1
+
+    async def worker():
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                await run_job(job)
+                mark_done(job)
+            except Exception as e:
+                stats["failed"] += 1
+                logger.warning(f"Prefetch failed for {job['id']}: {e}")
+            finished = stats["resumed"] + stats["searched"] + stats["fresh"] + stats["failed"]
+            if finished % 20 == 0:
+                logger.info(f"Progress: {finished}/{stats['total']}")
+
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+
+    if not stats["failed"]:
+        checkpoint["completed_at"] = datetime.utcnow().isoformat()
+        save_checkpoint(checkpoint_path, checkpoint)
+    logger.info(
+        f"✅ Prefetch {'completed' if not stats['failed'] else 'incomplete'}: "
+        f"{stats['searched']} searched, {stats['fresh']} recently cached, "
+        f"{stats['resumed']} resumed, {stats['failed']} failed ({stats['empty']} without results)."
+    )
+    return stats
+
+async def main(args):
+    ai_tech_tree = _load_track_data()
+    jobs = build_prefetch_jobs(ai_tech_tree, args.categories, include_concepts=args.concepts)
+    logger.info(f"{len(jobs)} prefetch jobs ({', '.join(args.categories)}).")
+    if args.restart and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    # Results are archived through the batching worker; stop() drains it before exit
+    await TREND_ARCHIVER.start()
+    try:
+        await prefetch_trends(
+            jobs,
+            compute_curriculum_version(ai_tech_tree),
+            checkpoint_path=args.checkpoint,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            max_age=args.max_age,
+        )
+    finally:
+        await TREND_ARCHIVER.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prefetch trend searches for every curriculum subject.")
+    parser.add_argument("--categories", nargs="+", default=list(DEFAULT_CATEGORIES))
+    parser.add_argument("--concepts", action="store_true", help="Also prefetch '<subject> <concept>' searches.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE_PER_SECOND, help="Max searches started per second.")
+    parser.add_argument("--max-age", type=float, default=settings.TREND_PREFETCH_MAX_AGE_SECONDS,
+                        help="Skip searches cached within this many seconds (keep >= the cron interval).")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH)
+    parser.add_argument("--restart", action="store_true", help="Ignore an unfinished checkpoint.")
+    asyncio.run(main(parser.parse_args()))
+
+
+# crontab: 0 */6 * * * cd /app && python backend/scripts/prefetch_trends.py --concepts
@@ -1,5 +1,6 @@
 import sys
 import os
+import asyncio
 import logging
 from datetime import datetime
 
@@ -9,7 +10,12 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 import json
 
 try:
-    from app.core.database import mongodb
+    from app.core.database import get_db
+    from app.engine.tools.v1.curriculum_index import (
+        CURRICULUM_META_COLLECTION,
+        CURRICULUM_META_ID,
+        compute_curriculum_version,
+    )
     # from app.source.track import AI_TECH_TREE # Removed
 except ImportError as e:
     print(f"Import Error: {e}")
@@ -25,36 +31,15 @@ def _load_track_data():
     with open(TRACK_DB_PATH, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def sync_tracks():
+def build_track_docs(ai_tech_tree: dict) -> list[dict]:
     """
-    Synchronizes the AI_TECH_TREE data from python source to MongoDB 'tracks' collection.
-    - Clears existing tracks to ensure source of truth is the code.
-    - Transforms the nested dictionary structure into the DB dictionary format.
+    Transforms the nested dictionary structure (tracks.json) into 'tracks' documents.
     - Handles the unified 'Option' structure.
     """
-    logger.info("Connecting to Database...")
-    try:
-        mongodb.connect()
-        db = mongodb.db
-        if db is None:
-            raise Exception("Database connection returned None")
-    except Exception as e:
-        logger.error(f"Failed to connect to DB: {e}")
-        return
-
-    collection = db['tracks']
-    
-    # 1. Clear existing tracks
-    delete_result = collection.delete_many({})
-    logger.info(f"Cleared {delete_result.deleted_count} existing tracks.")
-
     new_docs = []
     order_counter = 1
 
-    # 2. Iterate and transform data
     # AI_TECH_TREE structure: Track -> Description/Steps -> Step -> Option -> Subject -> Levels
-    
-    ai_tech_tree = _load_track_data()
     for track_title, track_data in ai_tech_tree.items():
         logger.info(f"Processing {track_title}...")
         
@@ -130,13 +115,53 @@ def sync_tracks():
         new_docs.append(track_doc)
         order_counter += 1
 
+    return new_docs
+
+async def _sync_tracks(db):
+    """Awaited writes: get_db() is the async Motor database (its calls return awaitables)."""
+    collection = db['tracks']
+    
+    # 1. Clear existing tracks
+    delete_result = await collection.delete_many({})
+    logger.info(f"Cleared {delete_result.deleted_count} existing tracks.")
+
+    # 2. Transform data
+    ai_tech_tree = _load_track_data()
+    new_docs = build_track_docs(ai_tech_tree)
+
     # 3. Insert new tracks
     if new_docs:
-        result = collection.insert_many(new_docs)
+        result = await collection.insert_many(new_docs)
         logger.info(f"✅ Successfully inserted {len(result.inserted_ids)} tracks.")
     else:
         logger.warning("No tracks found to insert.")
 
+    # 4. Reload Hook: bump the curriculum version stamp
+    version = compute_curriculum_version(ai_tech_tree)
+    await db[CURRICULUM_META_COLLECTION].update_one(
+        {"_id": CURRICULUM_META_ID},
+        {"$set": {"version": version, "synced_at": datetime.utcnow()}},
+        upsert=True
+    )
+    logger.info(f"Curriculum version stamp updated: {version[:12]}")
+
+def sync_tracks():
+    """
+    Synchronizes the AI_TECH_TREE data from python source to MongoDB 'tracks' collection.
+    - Clears existing tracks to ensure source of truth is the code.
+    - Writes a version stamp to 'meta' so running processes reload their CurriculumIndex.
+    """
+    logger.info("Connecting to Database...")
+    try:
+        db = get_db()
+        if db is None:
+            raise Exception("Database connection returned None")
+    except Exception as e:
+        logger.error(f"Failed to connect to DB: {e}")
+        return
+
+    asyncio.run(_sync_tracks(db))
+
 if __name__ == "__main__":
     sync_tracks()
 
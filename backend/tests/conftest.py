@@ -0,0 +1,86 @@
+import os
+import sys
+import asyncio
+import importlib
+import pytest
+from types import SimpleNamespace
+
+# Settings 초기화용 더미 키 (외부 API 호출 없음). app 모듈 import 전에 설정되어야 하므로 conftest에서 한 번만.
+TEST_OPENAI_API_KEY = "test-dummy-key"
+os.environ.setdefault("OPENAI_API_KEY", TEST_OPENAI_API_KEY)
+# scripts/ 모듈 (sync_track_to_db, prefetch_trends, migrate_trends_to_items ...) import용
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+# get_db()를 직접 호출하는 모듈 (from-import 이므로 모듈별로 교체해야 함)
+DB_MODULES = (
+    "app.engine.tools.v1.curriculum_index",
+    "app.engine.tools.v1.trend_cache",
+    "app.engine.tools.v1.trend_archiver",
+    "app.engine.tools.v1.trend_items",
+    "app.engine.tools.v1.trend_search_index",
+    "app.engine.tools.v1.trend_views",
+    "sync_track_to_db",
+    "init_db",
+)
+
+
+def _use_db(monkeypatch, db):
+    for name in DB_MODULES:
+        monkeypatch.setattr(importlib.import_module(name), "get_db", lambda: db)
+    return db
+
+
+@pytest.fixture
+def motor_db(monkeypatch):
+    """Motor 인터페이스를 따르는 인메모리 Mongo 스탠드인 (실서비스의 get_db()와 같은 async API)"""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    return _use_db(monkeypatch, mongomock_motor.AsyncMongoMockClient()["ai_techtree_test"])
+
+
+@pytest.fixture
+def tracks_db(motor_db):
+    """tracks.json을 동기화한 Motor 스탠드인 (버전 스탬프 'v1'). 인덱스는 aget_curriculum_index()로 로드"""
+    from app.engine.tools.v1.curriculum_index import CURRICULUM_META_COLLECTION, CURRICULUM_META_ID, invalidate_curriculum_index
+    from sync_track_to_db import _load_track_data, build_track_docs
+
+    async def seed():
+        await motor_db["tracks"].insert_many(build_track_docs(_load_track_data()))
+        await motor_db[CURRICULUM_META_COLLECTION].insert_one({"_id": CURRICULUM_META_ID, "version": "v1"})
+
+    asyncio.run(seed())
+    invalidate_curriculum_index()
+    yield motor_db
+    invalidate_curriculum_index()
+
+
+@pytest.fixture
+def mongomock_bulk_write(monkeypatch):
+    """
+    mongomock 4.3 predates the 'sort' field pymongo (>= 4.11) adds to UpdateOne, so its bulk_write raises.
+    Replays bulk operations through mongomock's single-document methods instead (test stand-in only).
+    """
+    mongomock = pytest.importorskip("mongomock")
+    from pymongo import InsertOne, UpdateOne, UpdateMany
+
+    def bulk_write(self, requests, ordered=True, **kwargs):
+        counts = {"inserted_count": 0, "matched_count": 0, "modified_count": 0, "upserted_count": 0}
+        upserted_ids = {}
+        for position, op in enumerate(requests):
+            if isinstance(op, InsertOne):
+                self.insert_one(op._doc)
+                counts["inserted_count"] += 1
+                continue
+            if isinstance(op, UpdateOne):
+                result = self.update_one(op._filter, op._doc, upsert=op._upsert)
+            elif isinstance(op, UpdateMany):
+                result = self.update_many(op._filter, op._doc, upsert=op._upsert)
+            else:
+                raise NotImplementedError(type(op).__name__)
+            counts["matched_count"] += result.matched_count
+            counts["modified_count"] += result.modified_count
+            if result.upserted_id is not None:
+                counts["upserted_count"] += 1
+                upserted_ids[position] = result.upserted_id
+        return SimpleNamespace(**counts, upserted_ids=upserted_ids)
+
+    monkeypatch.setattr(mongomock.collection.Collection, "bulk_write", bulk_write)
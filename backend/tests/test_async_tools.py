@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.curriculum_index import aget_curriculum_index, get_curriculum_index
+
+
+@pytest.fixture
+def async_db(tracks_db, mongomock_bulk_write):
+    return tracks_db
+
+
+def test_concurrent_callers_share_one_build(async_db):
+    async def scenario():
+        return await asyncio.gather(*(aget_curriculum_index() for _ in range(10)))
+
+    indexes = asyncio.run(scenario())
+    assert len({id(index) for index in indexes}) == 1
+    assert "Track 1: AI Engineer" in indexes[0].tracks
+    # Sync callers (worker threads) read the same snapshot without touching Motor
+    assert get_curriculum_index() is indexes[0]
+
+
+def test_async_path_tool(async_db):
+    result = asyncio.run(function_tool.af_get_techtree_path("ai engineer"))
+    assert result["track"] == "Track 1: AI Engineer"
+    assert result["resolved_from"] == "ai engineer"
+
+
+def test_async_archive_skips_duplicates(async_db):
+    results = [
+        {"url": "https://toss.tech/article/rag", "title": "RAG 도입기", "content": "본문"},
+        {"url": "https://toss.tech/article/rag", "title": "RAG 도입기", "content": "본문"},
+        {"url": "", "title": "no link"},
+    ]
+    # No running archiver -> one inline bulk write
+    report = asyncio.run(function_tool._aarchive_results(results, ["rag"], "k_blog"))
+    assert report == {"inserted": 1, "skipped": 1, "duplicates": 0}
+
+    docs = asyncio.run(async_db["trend_items"].find({"category": "k_blog"}).to_list(None))
+    assert [doc["link"] for doc in docs] == ["https://toss.tech/article/rag"]
+    assert docs[0]["source_domain"] == "toss.tech"
@@ -0,0 +1,25 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # 'a' becomes most recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["hits"] == 3 and cache.stats()["misses"] == 1
+
+
+def test_ttl_expiry():
+    cache = TTLCache(maxsize=10, ttl=0.05)
+    cache.set(("llm", "rag"), [0.1, 0.2])
+    assert cache.get(("llm", "rag")) == [0.1, 0.2]
+
+    time.sleep(0.06)
+    assert cache.get(("llm", "rag")) is None
+    assert len(cache) == 0
@@ -0,0 +1,287 @@
+import json
+import time
+import asyncio
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from fastapi import FastAPI
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+from app.api.v1 import chat
+from app.api.v1.agent_registry import AgentToolRegistry
+
+LLM_SECONDS = 0.2
+TOOL_SECONDS = 0.1
+CONCURRENT_REQUESTS = 8
+
+
+class FakeToolModel:
+    """ChatOpenAI stand-in: first turn calls the tool, second turn answers (network latency = sleep)."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def bind_tools(self, tools):
+        return self
+
+    async def ainvoke(self, messages):
+        await asyncio.sleep(LLM_SECONDS)
+        if isinstance(messages[-1], HumanMessage):
+            return AIMessage(content="", tool_calls=[{"name": "slow_sync_tool", "args": {"topic": "rag"}, "id": "call_1"}])
+        return AIMessage(content=f"answer: {messages[-1].content}")
+
+
+def slow_sync_tool(topic: str) -> dict:
+    """Blocking tool (e.g. an embedding call); must run on the tool executor, not on the loop."""
+    time.sleep(TOOL_SECONDS)
+    return {"topic": topic}
+
+
+@pytest.fixture
+def chat_app(monkeypatch):
+    registry = AgentToolRegistry([slow_sync_tool], FakeToolModel())
+    monkeypatch.setattr(chat, "get_agent_registry", lambda: registry)
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/agent")
+    return app
+
+
+def test_concurrent_chats_overlap_on_one_loop(chat_app):
+    payload = {"messages": [{"role": "user", "content": "RAG 트렌드 알려줘"}]}
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=chat_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Event loop lag probe: stays small only if nothing blocks the loop
+            lags = []
+            stop = asyncio.Event()
+
+            async def probe():
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    await asyncio.sleep(0.01)
+                    lags.append(time.perf_counter() - started - 0.01)
+
+            probe_task = asyncio.create_task(probe())
+            started = time.perf_counter()
+            responses = await asyncio.gather(*(client.post("/agent/chat", json=payload) for _ in range(CONCURRENT_REQUESTS)))
+            elapsed = time.perf_counter() - started
+            stop.set()
+            await probe_task
+            return responses, elapsed, max(lags)
+
+    responses, elapsed, max_lag = asyncio.run(scenario())
+    assert all(r.status_code == 200 for r in responses)
+    assert responses[0].json()["tool_calls"][0]["result"] == "{'topic': 'rag'}"
+
+    one_request = 2 * LLM_SECONDS + TOOL_SECONDS
+    # Serialized: 8 x 0.5s = 4s. Overlapping: about one request's latency.
+    assert elapsed < 2 * one_request, f"{CONCURRENT_REQUESTS} requests took {elapsed:.2f}s"
+    assert max_lag < TOOL_SECONDS / 2
+
+
+# ---------------------------------------------------------
+# Parallel tool calls within one step
+# ---------------------------------------------------------
+async def tool_a(seconds: float) -> str:
+    await asyncio.sleep(seconds)
+    return f"a:{seconds}"
+
+def tool_b(seconds: float) -> str:
+    time.sleep(seconds)
+    return f"b:{seconds}"
+
+
+class MultiToolModel(FakeToolModel):
+    """First turn: several independent tool calls in one AIMessage."""
+    tool_calls = []
+
+    async def ainvoke(self, messages):
+        if isinstance(messages[-1], HumanMessage):
+            return AIMessage(content="", tool_calls=self.tool_calls)
+        return AIMessage(content="done")
+
+
+def _calls(*specs) -> list[dict]:
+    return [{"name": name, "args": {"seconds": seconds}, "id": f"call_{i}"} for i, (name, seconds) in enumerate(specs)]
+
+def _chat(monkeypatch, tool_calls: list[dict]) -> tuple[dict, float]:
+    monkeypatch.setattr(MultiToolModel, "tool_calls", tool_calls)
+    registry = AgentToolRegistry([tool_a, tool_b], MultiToolModel())
+    monkeypatch.setattr(chat, "get_agent_registry", lambda: registry)
+    request = chat.ChatRequest(messages=[{"role": "user", "content": "RAG 트랙 두 개 비교"}])
+    started = time.perf_counter()
+    response = asyncio.run(chat.chat_endpoint(request))
+    return response.model_dump(), time.perf_counter() - started
+
+
+def test_step_latency_is_the_slowest_tool_and_order_is_kept(monkeypatch):
+    response, elapsed = _chat(monkeypatch, _calls(("tool_a", 0.3), ("tool_b", 0.1), ("tool_a", 0.2), ("missing", 0)))
+    # Sequential: 0.6s
+    assert elapsed < 0.45
+    assert [log["result"] for log in response["tool_calls"]] == ["a:0.3", "b:0.1", "a:0.2", "Error: Tool not found."]
+
+
+def test_concurrency_cap_per_step(monkeypatch):
+    monkeypatch.setattr(chat.settings, "AGENT_TOOL_CONCURRENCY", 2)
+    _, elapsed = _chat(monkeypatch, _calls(*[("tool_a", 0.1)] * 4))
+    # 4 tools, 2 at a time -> two waves
+    assert 0.2 <= elapsed < 0.35
+
+
+def test_slow_tool_times_out_without_failing_the_step(monkeypatch):
+    monkeypatch.setattr(chat.settings, "AGENT_TOOL_TIMEOUT_SECONDS", 0.1)
+    response, elapsed = _chat(monkeypatch, _calls(("tool_a", 1.0), ("tool_a", 0.01)))
+    assert elapsed < 0.5
+    results = [log["result"] for log in response["tool_calls"]]
+    assert results == ["Error: Tool 'tool_a' timed out after 0.1s.", "a:0.01"]
+
+
+# ---------------------------------------------------------
+# Startup-built tool registry
+# ---------------------------------------------------------
+class RecordingModel(MultiToolModel):
+    def bind_tools(self, tools):
+        self.bound = tools
+        return self
+
+
+def test_registry_builds_schemas_once_and_is_reused(monkeypatch):
+    llm = RecordingModel()
+    registry = AgentToolRegistry([tool_a, tool_b], llm)
+    assert registry.get("tool_b") is tool_b
+    assert registry.get("missing") is None
+    assert [schema["function"]["name"] for schema in llm.bound] == ["tool_a", "tool_b"]
+
+    monkeypatch.setattr(chat, "get_agent_registry", lambda: registry)
+    monkeypatch.setattr(MultiToolModel, "tool_calls", _calls(("tool_b", 0)))
+    request = chat.ChatRequest(messages=[{"role": "user", "content": "hi"}])
+    for _ in range(2):
+        response = asyncio.run(chat.chat_endpoint(request))
+        assert response.tool_calls[0]["result"] == "b:0"
+    # No per-request rebinding
+    assert registry.model is llm
+
+
+# ---------------------------------------------------------
+# SSE streaming (/agent/chat/stream)
+# ---------------------------------------------------------
+ANSWER_TOKENS = ["RAG ", "트랙은 ", "검색 ", "증강입니다."]
+TOKEN_SECONDS = 0.05
+
+
+class StreamingModel(MultiToolModel):
+    """astream(): tool-call turn as tool_call_chunks (after an optional preamble), answer turn token by token."""
+    preamble = ""
+
+    async def astream(self, messages):
+        if isinstance(messages[-1], HumanMessage):
+            await asyncio.sleep(LLM_SECONDS)
+            if self.preamble:
+                yield AIMessageChunk(content=self.preamble)
+            for i, call in enumerate(self.tool_calls):
+                yield AIMessageChunk(content="", tool_call_chunks=[{
+                    "name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i
+                }])
+            return
+        for token in ANSWER_TOKENS:
+            await asyncio.sleep(TOKEN_SECONDS)
+            yield AIMessageChunk(content=token)
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _stream(monkeypatch, tool_calls: list[dict]):
+    monkeypatch.setattr(MultiToolModel, "tool_calls", tool_calls)
+    registry = AgentToolRegistry([tool_a, tool_b], StreamingModel())
+    monkeypatch.setattr(chat, "get_agent_registry", lambda: registry)
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/agent")
+    payload = {"messages": [{"role": "user", "content": "RAG 트랙 설명"}]}
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            body = ""
+            async with client.stream("POST", "/agent/chat/stream", json=payload) as response:
+                assert response.headers["content-type"].startswith("text/event-stream")
+                async for text in response.aiter_text():
+                    body += text
+            return _parse_sse(body)
+
+    return asyncio.run(scenario())
+
+
+def test_stream_sends_tool_events_then_tokens_then_done(monkeypatch):
+    events = _stream(monkeypatch, _calls(("tool_a", 0.2), ("tool_b", 0.05)))
+    kinds = [kind for kind, _ in events]
+    assert kinds == ["tool_start", "tool_start", "tool_result", "tool_result"] + ["token"] * len(ANSWER_TOKENS) + ["done"]
+
+    # tool results arrive in completion order, tagged with their position in the step
+    assert [(data["index"], data["result"]) for kind, data in events if kind == "tool_result"] == [(1, "b:0.05"), (0, "a:0.2")]
+    assert "".join(data["content"] for kind, data in events if kind == "token") == "".join(ANSWER_TOKENS)
+
+    done = events[-1][1]
+    assert done["response"] == "".join(ANSWER_TOKENS)
+    # the final log keeps the tool_calls order, like /chat
+    assert [log["result"] for log in done["tool_calls"]] == ["a:0.2", "b:0.05"]
+
+
+def test_stream_tags_tool_turn_preamble_with_its_step(monkeypatch):
+    monkeypatch.setattr(StreamingModel, "preamble", "먼저 트랙을 찾아볼게요. ")
+    events = _stream(monkeypatch, _calls(("tool_a", 0.01)))
+    kinds = [kind for kind, _ in events]
+    assert kinds == ["token", "tool_start", "tool_result"] + ["token"] * len(ANSWER_TOKENS) + ["done"]
+    assert events[0][1] == {"step": 1, "content": "먼저 트랙을 찾아볼게요. "}
+    assert events[1][1]["step"] == 1
+    assert {data["step"] for kind, data in events[3:-1]} == {2}
+
+    # Client rule (frontend/v1/main.py): tool_start resets the streamed answer
+    answer = ""
+    for kind, data in events:
+        if kind == "tool_start":
+            answer = ""
+        elif kind == "token":
+            answer += data["content"]
+    assert answer == events[-1][1]["response"] == "".join(ANSWER_TOKENS)
+
+
+def test_stream_first_event_arrives_before_the_loop_finishes(monkeypatch):
+    # httpx's ASGITransport buffers the whole body, so read the response iterator directly
+    monkeypatch.setattr(MultiToolModel, "tool_calls", _calls(("tool_a", 0.1)))
+    registry = AgentToolRegistry([tool_a, tool_b], StreamingModel())
+    monkeypatch.setattr(chat, "get_agent_registry", lambda: registry)
+    request = chat.ChatRequest(messages=[{"role": "user", "content": "RAG 트랙 설명"}])
+
+    async def scenario():
+        response = await chat.chat_stream_endpoint(request)
+        arrivals = []
+        started = time.perf_counter()
+        async for chunk in response.body_iterator:
+            arrivals.append((time.perf_counter() - started, chunk.split("\n", 1)[0]))
+        return arrivals
+
+    arrivals = asyncio.run(scenario())
+    # first event (tool_start) right after the first LLM turn, first token right after the tool
+    assert arrivals[0][1] == "event: tool_start" and arrivals[0][0] < LLM_SECONDS + 0.05
+    first_token = next(at for at, kind in arrivals if kind == "event: token")
+    assert first_token < LLM_SECONDS + 0.1 + TOKEN_SECONDS + 0.05
+    # the full loop takes every token on top of that
+    assert arrivals[-1][0] >= LLM_SECONDS + 0.1 + len(ANSWER_TOKENS) * TOKEN_SECONDS
+
+
+def test_stream_error_becomes_an_error_event(monkeypatch):
+    async def broken_astream(self, messages):
+        raise RuntimeError("upstream down")
+        yield
+
+    monkeypatch.setattr(StreamingModel, "astream", broken_astream)
+    events = _stream(monkeypatch, [])
+    assert events == [("error", {"detail": "upstream down"})]
@@ -0,0 +1,102 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.config import settings
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.curriculum_index import CurriculumIndex, collect_concepts
+from app.engine.tools.v1.schema_tool import SubjectOutput
+
+TRACKS = {
+    "Track 1: AI Engineer": {
+        "description": "Serving",
+        "steps": {
+            "Step 1: Backend": {
+                "description": "API servers",
+                # Direct subject
+                "FastAPI Essentials": {
+                    "Lv1": ["routing basics"], "Lv2": ["dependency injection"], "Lv3": ["lifespan startup hooks"]
+                },
+            },
+            "Step 2: Data": {
+                # Option -> subjects
+                "Option A: Storage": {
+                    "description": "Where vectors live",
+                    "Vector DB": {"Lv1": ["embedding index"], "Lv2": [], "Lv3": ["sharding replicas"]},
+                },
+            },
+        },
+    },
+}
+
+VOCAB = ["routing", "dependency", "injection", "lifespan", "startup", "hooks", "embedding", "index", "sharding", "replicas"]
+
+
+class BagOfWordsEmbeddings:
+    """임베딩 스텁: 고정 어휘의 단어 빈도 벡터 (네트워크 없음)"""
+    model_name = "stub-bow"
+
+    def _embed(self, text: str) -> list[float]:
+        words = text.lower().replace("(", " ").replace(")", " ").split()
+        return [float(words.count(word)) for word in VOCAB]
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+def test_collect_concepts_point_back_to_subject_level_and_track():
+    concepts = collect_concepts(TRACKS)
+    assert len(concepts) == 5
+    assert {"concept": "lifespan startup hooks", "level": "Lv3", "subject": "FastAPI Essentials",
+            "category": None, "track": "Track 1: AI Engineer"} in concepts
+    assert {"concept": "embedding index", "level": "Lv1", "subject": "Vector DB",
+            "category": "Option A: Storage", "track": "Track 1: AI Engineer"} in concepts
+
+
+@pytest.fixture
+def stub_concepts(monkeypatch, tmp_path):
+    index = CurriculumIndex(TRACKS)
+    model = BagOfWordsEmbeddings()
+    monkeypatch.setattr(function_tool, "get_curriculum_index", lambda: index)
+    monkeypatch.setattr(function_tool, "_get_embedding_model", lambda: model)
+    monkeypatch.setattr(settings, "EMBEDDING_STORE_DIR", str(tmp_path))
+    function_tool.CONCEPT_VECTORS.reset()
+    function_tool.QUERY_EMBEDDING_CACHE.clear()
+    yield function_tool
+    function_tool.CONCEPT_VECTORS.reset()
+    function_tool.QUERY_EMBEDDING_CACHE.clear()
+
+
+def test_search_concepts_ranks_by_similarity(stub_concepts):
+    hits = stub_concepts.search_concepts("sharding replicas", top_k=2)
+    assert hits[0]["concept"] == "sharding replicas" and hits[0]["subject"] == "Vector DB"
+    assert hits[0]["score"] == pytest.approx(1.0)
+
+
+def test_subject_fallback_answers_with_the_owning_subject(stub_concepts):
+    result = stub_concepts.f_get_techtree_subject("lifespan startup")
+
+    assert result["subject"] == "FastAPI Essentials"
+    assert result["matched_concepts"][0]["level"] == "Lv3"
+    assert "covered as a Lv3 concept" in result["message"]
+    # Valid against the tool output schema (ConceptMatch)
+    assert SubjectOutput(**result).matched_concepts[0].subject == "FastAPI Essentials"
+
+
+def test_subject_fallback_below_threshold_guides_to_track_tool(stub_concepts, monkeypatch):
+    # 'dependency' alone scores 1/sqrt(2) against 'dependency injection'
+    assert stub_concepts.search_concepts("dependency")[0]["score"] == pytest.approx(0.707, abs=1e-3)
+    monkeypatch.setattr(stub_concepts, "CONCEPT_MATCH_MIN_SCORE", 0.8)
+
+    result = stub_concepts.f_get_techtree_subject("dependency")
+    assert result["error"] == "Subject 'dependency' not found in the curriculum."
+    assert "get_techtree_track" in result["guide"]
+    assert "matched_concepts" not in result
+
+
+def test_subject_fallback_without_any_hit(stub_concepts):
+    result = stub_concepts.f_get_techtree_subject("quantum annealing")
+    assert result["error"] == "Subject 'quantum annealing' not found in the curriculum."
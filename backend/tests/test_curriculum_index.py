@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+
+from app.core.config import settings
+from app.engine.tools.v1 import curriculum_index
+from app.engine.tools.v1.curriculum_index import (
+    CURRICULUM_META_COLLECTION,
+    CURRICULUM_META_ID,
+    aget_curriculum_index,
+    get_curriculum_index,
+    invalidate_curriculum_index,
+)
+from sync_track_to_db import sync_tracks
+
+
+@pytest.fixture
+def index(tracks_db):
+    return asyncio.run(aget_curriculum_index())
+
+
+def test_index_is_built_once(tracks_db, monkeypatch):
+    """버전이 바뀌지 않으면 같은 스냅샷을 재사용해야 합니다."""
+    # Sync readers (tool worker threads) never touch the DB: empty until the first async load
+    assert len(get_curriculum_index()) == 0
+    first = asyncio.run(aget_curriculum_index())
+    assert "Track 1: AI Engineer" in first.tracks
+    assert first.source_stamp == "v1"
+    assert get_curriculum_index() is first
+
+    monkeypatch.setattr(settings, "CURRICULUM_VERSION_CHECK_SECONDS", 0.0)
+    assert asyncio.run(aget_curriculum_index()) is first
+
+
+def test_index_reloads_on_version_bump(tracks_db, monkeypatch):
+    """sync_track_to_db.py가 버전 스탬프를 올리면 다음 호출에서 재빌드됩니다."""
+    monkeypatch.setattr(settings, "CURRICULUM_VERSION_CHECK_SECONDS", 0.0)
+
+    async def scenario():
+        first = await aget_curriculum_index()
+        await tracks_db["tracks"].update_one({"order": 1}, {"$set": {"description": "changed"}})
+        await tracks_db[CURRICULUM_META_COLLECTION].update_one({"_id": CURRICULUM_META_ID}, {"$set": {"version": "v2"}})
+        return first, await aget_curriculum_index()
+
+    first, second = asyncio.run(scenario())
+    assert second is not first
+    assert second.source_stamp == "v2"
+    assert second.version != first.version
+
+
+def test_sync_script_bumps_the_stamp_on_motor(motor_db, monkeypatch):
+    """sync_track_to_db.py는 Motor(get_db) 위에서 동작하고, 실행 중인 인덱스가 새 버전을 읽어야 합니다."""
+    db = motor_db
+    monkeypatch.setattr(settings, "CURRICULUM_VERSION_CHECK_SECONDS", 0.0)
+    invalidate_curriculum_index()
+
+    sync_tracks()
+    first = asyncio.run(aget_curriculum_index())
+    assert "Track 1: AI Engineer" in first.tracks
+    assert first.source_stamp == first.version
+
+    # Re-sync over existing tracks: cleared and re-inserted, same content -> same stamp
+    sync_tracks()
+    assert asyncio.run(db["tracks"].count_documents({})) == len(first.tracks)
+    assert asyncio.run(aget_curriculum_index()).version == first.version
+    invalidate_curriculum_index()
+
+
+def test_index_is_read_only(index):
+    with pytest.raises(TypeError):
+        index.tracks["New Track"] = {}
+
+
+def test_subject_exact_lookup(index):
+    subjects = index.subjects
+    record = subjects.lookup("  fastapi essentials ")
+    assert record["subject"] == "FastAPI Essentials"
+    assert record["track"] == "Track 1: AI Engineer"
+    assert "Lv1" in record["details"]
+
+
+def test_subject_candidates_match_linear_scan(index):
+    """n-gram 후보 검색 결과는 전체 부분 문자열 스캔과 동일해야 합니다."""
+    subjects = index.subjects
+    for query in ["api", "Py", "data", "vector db", "없는과목"]:
+        expected = sorted(n for n in subjects.names if query.lower().strip() in n.lower())
+        assert subjects.candidates(query) == expected
+
+
+@pytest.mark.parametrize("query,expected", [
+    ("AI Engineer", "Track 1: AI Engineer"),
+    ("track1 ai engineer", "Track 1: AI Engineer"),
+    ("AI Enginer", "Track 1: AI Engineer"),
+    ("AI Modeler", "Track 2: AI Modeler / Researcher"),
+    ("engineer", None),  # 여러 트랙에 걸쳐 모호하면 자동 보정하지 않음
+    ("track 10", None),  # 'track10'은 'track1'을 포함하지만 다른 번호
+])
+def test_track_matcher_resolve(index, query, expected):
+    assert index.track_matcher.resolve(query) == expected
+
+
+def test_track_matcher_rank_is_scored(index):
+    ranked = index.track_matcher.rank("engineer")
+    scores = [score for _, score in ranked]
+    assert scores == sorted(scores, reverse=True)
+    assert ranked[0][0] == "Track 1: AI Engineer"
+
+
+def test_track_matcher_short_and_numbered_queries(index):
+    matcher = index.track_matcher
+    # 2글자 질의도 단어 단위로 포함되면 후보
+    assert {title for title, _ in matcher.rank("AI")} >= {"Track 1: AI Engineer", "Track 2: AI Modeler / Researcher"}
+    assert "Track 1: AI Engineer" not in [title for title, _ in matcher.rank("track 10")]
+
+
+def test_track_matcher_pruning_matches_full_scan():
+    """Bound-pruned rank() == 모든 alias에 대해 점수를 계산한 결과"""
+    import random
+    rng = random.Random(7)
+    words = ["AI", "Data", "ML", "Platform", "Vision", "Cloud", "Search", "LLM", "Agent"]
+    roles = ["Engineer", "Researcher", "Scientist", "Architect"]
+    titles = [f"Track {i}: {rng.choice(words)} {rng.choice(words)} {rng.choice(roles)}" for i in range(120)]
+    matcher = curriculum_index.TrackMatcher(titles)
+
+    def full_scan(query, limit=5):
+        normalized = curriculum_index._normalize_title(query)
+        best = {}
+        for variant in {normalized, normalized.replace(" ", "")}:
+            grams = curriculum_index._char_ngrams(f" {variant} ")
+            for title, alias, alias_grams in matcher._aliases:
+                best[title] = max(best.get(title, 0.0), curriculum_index._similarity(variant, grams, alias, alias_grams))
+        return sorted(round(score, 3) for score in best.values() if score >= curriculum_index.TRACK_CANDIDATE_MIN_SCORE)[::-1][:limit]
+
+    for query in ["track 10", "cloud architectt", "AI", "vision enginer", "track 7 ml", "없는 트랙"]:
+        assert [score for _, score in matcher.rank(query)] == full_scan(query)
@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.config import settings
+from app.engine.tools.v1 import curriculum_index, function_tool
+from app.engine.tools.v1.embedding_provider import LocalHashingEmbeddings
+
+
+@pytest.fixture
+def offline_tools(tracks_db, monkeypatch, tmp_path):
+    """Motor 스탠드인 커리큘럼 + local 임베딩 백엔드 (네트워크 없이 추천 경로 전체 실행)"""
+    monkeypatch.setattr(settings, "EMBEDDING_PROVIDER", "local")
+    monkeypatch.setattr(settings, "EMBEDDING_STORE_DIR", str(tmp_path))
+
+    curriculum_index.invalidate_curriculum_index()
+    for resource in (function_tool.EMBEDDING_MODEL, function_tool.TRACK_VECTORS, function_tool.CONCEPT_VECTORS):
+        resource.reset()
+    function_tool.QUERY_EMBEDDING_CACHE.clear()
+    yield function_tool
+    for resource in (function_tool.EMBEDDING_MODEL, function_tool.TRACK_VECTORS, function_tool.CONCEPT_VECTORS):
+        resource.reset()
+    curriculum_index.invalidate_curriculum_index()
+
+
+def test_local_embeddings_are_deterministic():
+    corpus = ["FastAPI 비동기 서버", "PyTorch 모델 학습", "Spark 데이터 파이프라인"]
+    a = LocalHashingEmbeddings(dim=64, corpus=corpus)
+    b = LocalHashingEmbeddings(dim=64, corpus=list(reversed(corpus)))
+
+    assert a.model_name == b.model_name
+    assert a.embed_query("fastapi server") == b.embed_query("fastapi server")
+    assert abs(np.linalg.norm(a.embed_query("fastapi server")) - 1.0) < 1e-5
+
+
+def test_offline_track_recommendation(offline_tools):
+    result = asyncio.run(offline_tools.af_get_techtree_track(["mlops", "kubernetes", "model serving"], "intermediate"))
+
+    assert "error" not in result
+    assert result["recommended_track"] in offline_tools.get_curriculum_index().tracks
+    assert len(result["alternatives"]) == offline_tools.TRACK_SEARCH_TOP_K - 1
+    assert offline_tools.EMBEDDING_MODEL.get().model_name.startswith("local-hash-")
+
+
+def test_offline_concept_fallback(offline_tools):
+    result = asyncio.run(offline_tools.af_get_techtree_subject("Lifespan Events (Startup/Shutdown) 처리"))
+
+    assert result["subject"] == "FastAPI Essentials"
+    assert result["matched_concepts"][0]["level"] == "Lv3"
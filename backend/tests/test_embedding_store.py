@@ -0,0 +1,107 @@
+import os
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.engine.tools.v1.embedding_store import EmbeddingStore, VectorIndex
+
+
+class CountingEmbeddings:
+    """embed_documents 호출 횟수를 기록하는 가짜 임베딩 모델"""
+    def __init__(self):
+        self.embedded = []
+
+    def embed_documents(self, texts):
+        self.embedded.extend(texts)
+        return [[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts]
+
+
+def test_only_changed_texts_are_embedded(tmp_path):
+    store = EmbeddingStore("tracks", directory=str(tmp_path))
+    model = CountingEmbeddings()
+
+    keys, matrix = store.sync(model, "fake-model", ["a", "b"], ["text a", "text b"])
+    assert model.embedded == ["text a", "text b"]
+    assert matrix.shape == (2, 3)
+
+    # Second process: same texts -> no embedding call, read-only memory map
+    other = CountingEmbeddings()
+    keys, matrix = EmbeddingStore("tracks", directory=str(tmp_path)).sync(other, "fake-model", ["a", "b"], ["text a", "text b"])
+    assert other.embedded == []
+    assert isinstance(matrix, np.memmap)
+    assert not matrix.flags.writeable
+
+    # Track 'b' changed -> only it is re-embedded
+    keys, matrix = store.sync(other, "fake-model", ["a", "b"], ["text a", "text b v2"])
+    assert other.embedded == ["text b v2"]
+    assert matrix[1][0] == float(len("text b v2"))
+
+
+def test_empty_sync_keeps_the_shared_store(tmp_path):
+    """빈 커리큘럼(예: DB 연결 실패)으로 sync해도 다른 프로세스의 벡터를 지우지 않아야 합니다."""
+    store = EmbeddingStore("tracks", directory=str(tmp_path))
+    store.sync(CountingEmbeddings(), "fake-model", ["a", "b"], ["text a", "text b"])
+    files = sorted(os.listdir(tmp_path))
+
+    keys, matrix = store.sync(CountingEmbeddings(), "fake-model", [], [])
+    assert keys == [] and matrix.shape[0] == 0
+    assert sorted(os.listdir(tmp_path)) == files
+    entries, stored = store.load("fake-model")
+    assert [e["key"] for e in entries] == ["a", "b"] and stored.shape == (2, 3)
+
+
+def test_model_change_invalidates_store(tmp_path):
+    store = EmbeddingStore("tracks", directory=str(tmp_path))
+    store.sync(CountingEmbeddings(), "model-a", ["a"], ["text a"])
+
+    model = CountingEmbeddings()
+    store.sync(model, "model-b", ["a"], ["text a"])
+    assert model.embedded == ["text a"]
+    # Superseded vector files of the same model are cleaned up
+    store.sync(CountingEmbeddings(), "model-b", ["a"], ["text a v2"])
+    assert len([f for f in os.listdir(tmp_path) if f.endswith(".npy")]) == 2
+
+
+def test_other_models_keep_their_live_matrix(tmp_path):
+    """다른 임베딩 모델을 쓰는 프로세스가 publish해도 기존 모델의 벡터 파일은 남아 있어야 합니다."""
+    store_a = EmbeddingStore("tracks", directory=str(tmp_path))
+    _, live = store_a.sync(CountingEmbeddings(), "org/model-a", ["a", "b"], ["text a", "text b"])
+
+    store_b = EmbeddingStore("tracks", directory=str(tmp_path))
+    store_b.sync(CountingEmbeddings(), "model-b", ["a"], ["text a"])
+    store_b.sync(CountingEmbeddings(), "model-b", ["a"], ["text a v2"])
+
+    assert os.path.exists(live.filename)
+    model = CountingEmbeddings()
+    _, matrix = store_a.sync(model, "org/model-a", ["a", "b"], ["text a", "text b"])
+    assert model.embedded == [] and np.array_equal(matrix, live)
+
+
+def test_vector_index_top_k_matches_brute_force():
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(2000, 64))
+    keys = [f"track-{i}" for i in range(len(vectors))]
+    index = VectorIndex(keys, vectors)
+    query = rng.normal(size=64)
+
+    brute = sorted(
+        ((k, float(np.dot(v, query) / (np.linalg.norm(v) * np.linalg.norm(query)))) for k, v in zip(keys, vectors)),
+        key=lambda item: item[1], reverse=True
+    )[:5]
+    ranked = index.top_k(query, 5)
+
+    assert [k for k, _ in ranked] == [k for k, _ in brute]
+    assert all(abs(a[1] - b[1]) < 1e-4 for a, b in zip(ranked, brute))
+    assert index.matrix.dtype == np.float32 and index.matrix.flags.c_contiguous
+
+
+def test_track_vectors_are_not_built_from_an_empty_curriculum(monkeypatch, tmp_path):
+    from app.engine.tools.v1 import function_tool
+    from app.engine.tools.v1.curriculum_index import CurriculumIndex
+
+    model = CountingEmbeddings()
+    monkeypatch.setattr(function_tool, "get_curriculum_index", lambda: CurriculumIndex({}))
+    monkeypatch.setattr(function_tool, "_get_embedding_model", lambda: model)
+    monkeypatch.setattr(function_tool, "TRACK_EMBEDDING_STORE", EmbeddingStore("track_vectors", directory=str(tmp_path)))
+    assert function_tool._build_track_vectors() is None
+    assert os.listdir(tmp_path) == []
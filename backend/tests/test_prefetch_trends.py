@@ -0,0 +1,94 @@
+import json
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.trend_cache import TrendSearchCache
+import prefetch_trends
+from prefetch_trends import build_prefetch_jobs, concept_keyword, prefetch_trends as run_prefetch
+
+TREE = {
+    "Track A": {"description": "", "steps": {"Step 1": {
+        "description": "",
+        "Option 1": {"description": "", "RAG": {"description": "", "Lv1": ["Chunking 전략", "GIL (Global Interpreter Lock)의 개념"]}},
+    }}},
+    "Track B": {"description": "", "steps": {"Step 1": {"Option 1": {"RAG": {"Lv1": []}}}}},
+}
+
+
+@pytest.fixture
+def searches(monkeypatch, motor_db, mongomock_bulk_write):
+    cache = TrendSearchCache(maxsize=64, fresh_seconds=60, stale_seconds=3600)
+    monkeypatch.setattr(function_tool, "TREND_SEARCH_CACHE", cache)
+    monkeypatch.setattr(prefetch_trends, "TREND_SEARCH_CACHE", cache)
+
+    calls = []
+    def fake_search(keywords, category):
+        calls.append(tuple(keywords))
+        # Like the real _search_trends: errors come back as a response, never as an exception
+        if "fail" in keywords:
+            return {"answer": "검색 중 오류가 발생했습니다: search down",
+                    "items": [{"title": "Search Error", "link": "", "summary": "search down"}], "category": category}, [], ["fail"]
+        if "empty" in keywords:
+            return {"answer": "a", "items": [], "category": category, "source": "web"}, [], ["empty"]
+        results = [{"url": f"https://toss.tech/{len(calls)}", "title": "t", "content": ""}]
+        return {"answer": "a", "items": [{"title": "t"}], "category": category, "source": "web"}, results, ["rag"]
+
+    monkeypatch.setattr(function_tool, "_search_trends", fake_search)
+    return calls
+
+
+def test_jobs_cover_subjects_and_concepts_once():
+    assert concept_keyword("GIL (Global Interpreter Lock)의 개념") == "GIL"
+    subject_jobs = build_prefetch_jobs(TREE, ("k_blog",))
+    assert [job["keywords"] for job in subject_jobs] == [["RAG"]]
+    concept_jobs = build_prefetch_jobs(TREE, ("k_blog", "tech_news"), include_concepts=True)
+    assert len(concept_jobs) == 6
+    assert ["RAG", "GIL"] in [job["keywords"] for job in concept_jobs]
+
+
+def test_resume_skips_done_and_retries_failed(searches, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    jobs = [{"id": f"k_blog|{k}", "keywords": [k], "category": "k_blog"} for k in ("rag", "fail", "llm", "empty")]
+
+    first = asyncio.run(run_prefetch(jobs, "v1", checkpoint_path=checkpoint, concurrency=2, rate=0))
+    assert first["searched"] == 2 and first["failed"] == 2 and first["empty"] == 1
+    with open(checkpoint) as f:
+        state = json.load(f)
+    assert sorted(state["done"]) == ["k_blog|llm", "k_blog|rag"] and state["completed_at"] is None
+
+    searches.clear()
+    jobs[1]["keywords"] = ["ok"]
+    jobs[3]["keywords"] = ["found"]
+    second = asyncio.run(run_prefetch(jobs, "v1", checkpoint_path=checkpoint, concurrency=2, rate=0))
+    assert sorted(searches) == [("found",), ("ok",)]
+    assert second["resumed"] == 2 and second["failed"] == 0
+
+
+def test_completed_run_restarts_and_skips_fresh_cache(searches, tmp_path):
+    checkpoint = str(tmp_path / "checkpoint.json")
+    jobs = [{"id": "k_blog|rag", "keywords": ["rag"], "category": "k_blog"}]
+
+    async def scenario():
+        await run_prefetch(jobs, "v1", checkpoint_path=checkpoint, rate=0)
+        return await run_prefetch(jobs, "v1", checkpoint_path=checkpoint, rate=0)
+
+    second = asyncio.run(scenario())
+    # Completed checkpoint -> new run, but the cache entry written by the first run is still fresh
+    assert second["resumed"] == 0 and second["fresh"] == 1
+    assert len(searches) == 1
+
+
+def test_recently_cached_jobs_are_skipped_past_the_fresh_window(searches, tmp_path):
+    cache = prefetch_trends.TREND_SEARCH_CACHE
+    jobs = [{"id": "k_blog|rag", "keywords": ["rag"], "category": "k_blog"}]
+    # Cached 30 minutes ago: stale for serving (fresh window 60s), still inside the prefetch max age
+    cache.set_local("k_blog|rag", {"answer": "a", "items": [{"title": "t"}], "source": "web"},
+                    datetime.utcnow() - timedelta(minutes=30))
+
+    recent = asyncio.run(run_prefetch(jobs, "v1", checkpoint_path=str(tmp_path / "a.json"), rate=0))
+    assert recent["fresh"] == 1 and searches == []
+
+    expired = asyncio.run(run_prefetch(jobs, "v1", checkpoint_path=str(tmp_path / "b.json"), rate=0, max_age=600))
+    assert expired["searched"] == 1 and searches == [("rag",)]
@@ -0,0 +1,92 @@
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.resource import LazyResource
+
+
+def _slow_factory(counter: list, delay: float = 0.05, value="resource"):
+    def factory():
+        counter.append(threading.get_ident())
+        time.sleep(delay)
+        return value
+    return factory
+
+
+def test_single_flight_under_thread_burst():
+    """콜드 프로세스에 동시 요청이 몰려도 factory는 한 번만 실행되어야 합니다."""
+    calls = []
+    resource = LazyResource("burst", _slow_factory(calls))
+    barrier = threading.Barrier(64)
+
+    def worker():
+        barrier.wait()
+        return resource.get()
+
+    with ThreadPoolExecutor(max_workers=64) as pool:
+        results = list(pool.map(lambda _: worker(), range(64)))
+
+    assert len(calls) == 1
+    assert results == ["resource"] * 64
+    assert resource.status()["state"] == "ready"
+
+
+def test_single_flight_shared_by_sync_and_async_callers():
+    calls = []
+    resource = LazyResource("mixed", _slow_factory(calls, delay=0.1))
+
+    async def main():
+        threads = [threading.Thread(target=resource.get) for _ in range(16)]
+        for t in threads:
+            t.start()
+        results = await asyncio.gather(*(resource.aget() for _ in range(16)))
+        for t in threads:
+            t.join()
+        return results
+
+    assert asyncio.run(main()) == ["resource"] * 16
+    assert len(calls) == 1
+
+
+def test_stale_value_is_served_during_rebuild():
+    version = {"current": 1}
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.1)
+        return version["current"]
+
+    resource = LazyResource("versioned", factory, is_stale=lambda v: v != version["current"])
+    assert resource.get() == 1
+
+    version["current"] = 2
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        results = list(pool.map(lambda _: resource.get(), range(32)))
+
+    # 재빌드는 한 번만, 나머지 호출자는 기다리지 않고 이전 값을 받음
+    assert len(calls) == 2
+    assert set(results) <= {1, 2} and 2 in results
+    assert resource.get() == 2
+
+
+def test_failure_backoff_and_retry():
+    attempts = []
+
+    def factory():
+        attempts.append(1)
+        raise RuntimeError("api key missing")
+
+    resource = LazyResource("failing", factory, retry_after=0.05)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda _: resource.get(), range(16)))
+
+    assert results == [None] * 16
+    assert len(attempts) == 1
+    assert resource.status()["state"] == "failed"
+    assert "api key missing" in resource.status()["error"]
+
+    time.sleep(0.06)
+    resource.get()
+    assert len(attempts) == 2
@@ -0,0 +1,128 @@
+import time
+import pytest
+
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.search_client import (
+    FakeSearchClient,
+    HedgedSearch,
+    RecordingSearchClient,
+    ReplaySearchClient,
+    SearchReplayError,
+    create_search_client,
+)
+
+PRIMARY = {"query": "rag", "search_depth": "advanced"}
+FALLBACK = {"query": "rag", "search_depth": "basic"}
+
+
+def _latency(primary: float, fallback: float):
+    return lambda kwargs: primary if kwargs["search_depth"] == "advanced" else fallback
+
+def _empty_primary(kwargs):
+    if kwargs["search_depth"] == "advanced":
+        return {"answer": "", "results": []}
+    return FakeSearchClient._default_response(kwargs)
+
+
+def test_fast_primary_skips_fallback():
+    client = FakeSearchClient(latency=_latency(0.0, 0.0))
+    outcome = HedgedSearch(0.9, hedge_default=1.0, deadline=1.0, max_workers=4).search(client, PRIMARY, FALLBACK)
+    assert outcome["primary"]["results"] and outcome["fallback"] is None
+    assert client.calls == 1
+
+
+def test_empty_primary_falls_back():
+    client = FakeSearchClient(latency=_latency(0.0, 0.0), respond=_empty_primary)
+    outcome = HedgedSearch(None, hedge_default=1.0, deadline=None, max_workers=4).search(client, PRIMARY, FALLBACK)
+    assert outcome["fallback"]["results"] and not outcome["hedged"]
+
+
+def test_slow_primary_is_hedged():
+    client = FakeSearchClient(latency=_latency(0.5, 0.01))
+    started = time.monotonic()
+    outcome = HedgedSearch(0.9, hedge_default=0.05, deadline=2.0, max_workers=4).search(client, PRIMARY, FALLBACK)
+    assert time.monotonic() - started < 0.3
+    assert outcome["hedged"] and outcome["fallback"]["results"]
+
+
+def test_deadline_returns_partial():
+    client = FakeSearchClient(latency=_latency(0.5, 0.5))
+    search = HedgedSearch(0.9, hedge_default=0.02, deadline=0.1, max_workers=4)
+    started = time.monotonic()
+    outcome = search.search(client, PRIMARY, FALLBACK)
+    assert time.monotonic() - started < 0.3
+    assert outcome["timed_out"] and outcome["primary"] is None and outcome["fallback"] is None
+    assert search.stats()["timeouts"] == 1
+
+
+def test_repeated_deadlines_release_the_pool():
+    # Abandoned calls are cut at the deadline, so later searches still get workers
+    client = FakeSearchClient(latency=_latency(5.0, 5.0))
+    search = HedgedSearch(0.9, hedge_default=0.02, deadline=0.1, max_workers=2)
+    started = time.monotonic()
+    for _ in range(5):
+        outcome = search.search(client, PRIMARY, FALLBACK)
+        assert outcome["timed_out"]
+    assert time.monotonic() - started < 1.5
+    assert client.calls >= 5 and search.stats()["timeouts"] == 5
+    time.sleep(0.1)
+    assert search.stats()["in_flight"] == 0
+
+
+def test_hedge_is_skipped_when_pool_is_saturated():
+    client = FakeSearchClient(latency=_latency(0.2, 0.0))
+    search = HedgedSearch(0.9, hedge_default=0.02, deadline=None, max_workers=1)
+    outcome = search.search(client, PRIMARY, FALLBACK)
+    assert outcome["primary"]["results"] and not outcome["hedged"]
+    assert client.calls == 1 and search.stats()["hedges_skipped"] == 1
+
+
+def test_timeout_is_not_part_of_the_fixture(tmp_path):
+    path = str(tmp_path / "fixtures.jsonl")
+    recorded = RecordingSearchClient(FakeSearchClient(), path).search(timeout=3.0, **PRIMARY)
+    assert ReplaySearchClient(path, strict=True).search(timeout=1.0, **PRIMARY) == recorded
+
+
+def test_search_trends_uses_fallback_results():
+    client = FakeSearchClient(respond=_empty_primary)
+    response, results, terms = function_tool._search_trends(["RAG"], "k_blog", client=client)
+    assert [r["url"] for r in results] == ["https://example.com/basic"]
+    assert response["items"][0]["link"] == "https://example.com/basic"
+    assert terms == ["rag"]
+
+
+def test_record_then_replay(tmp_path):
+    path = str(tmp_path / "fixtures.jsonl")
+    recorder = RecordingSearchClient(FakeSearchClient(), path)
+    recorded = recorder.search(query="rag", search_depth="advanced", include_domains=["toss.tech", "d2.naver.com"])
+
+    replay = ReplaySearchClient(path)
+    # Same request with a reordered domain list -> exact match
+    assert replay.search(include_domains=["d2.naver.com", "toss.tech"], search_depth="advanced", query="rag") == recorded
+    # Unknown query -> a recorded response of the same depth (strict: empty)
+    assert replay.search(query="llm", search_depth="advanced") == recorded
+    assert replay.search(query="llm", search_depth="basic")["results"] == []
+    assert ReplaySearchClient(path, strict=True).search(query="llm", search_depth="advanced")["results"] == []
+    assert replay.calls == 3 and replay.misses == 2
+
+
+def test_replay_injects_latency_and_failures(tmp_path):
+    path = str(tmp_path / "fixtures.jsonl")
+    RecordingSearchClient(FakeSearchClient(), path).search(**PRIMARY)
+
+    slow = ReplaySearchClient(path, latency=lambda kwargs: 0.05)
+    started = time.monotonic()
+    slow.search(**PRIMARY)
+    assert time.monotonic() - started >= 0.05
+
+    failing = ReplaySearchClient(path, failure_rate=1.0, seed=1)
+    with pytest.raises(SearchReplayError):
+        failing.search(**PRIMARY)
+    assert failing.failures == 1
+
+
+def test_replay_backend_from_settings(tmp_path):
+    path = str(tmp_path / "fixtures.jsonl")
+    RecordingSearchClient(FakeSearchClient(), path).search(**PRIMARY)
+    assert isinstance(create_search_client("replay", None, path), ReplaySearchClient)
+    assert create_search_client("tavily", None, path) is None
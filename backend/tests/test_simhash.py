@@ -0,0 +1,91 @@
+import random
+import asyncio
+
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.simhash import (
+    NearDuplicateIndex,
+    collapse_near_duplicates,
+    from_int64,
+    hamming,
+    simhash,
+    to_int64,
+)
+from app.engine.tools.v1.trend_archiver import TrendArchiver
+
+ARTICLE = (
+    "토스는 사내 문서 검색에 RAG 파이프라인을 도입하면서 청크 크기와 임베딩 모델을 여러 차례 바꿔 보았고 "
+    "검색 품질을 평가하기 위한 골든셋을 직접 만들어 회귀 테스트에 사용하고 있습니다"
+)
+OTHER = (
+    "Kubernetes operators let platform teams encode day two operations such as backups upgrades and failover "
+    "into controllers that reconcile the desired state of stateful services continuously"
+)
+
+
+def test_mirrors_collide_and_unrelated_texts_do_not():
+    mirror = "  " + ARTICLE.replace("RAG", "rag") + "\n"
+    assert hamming(simhash(ARTICLE), simhash(mirror)) == 0
+    assert hamming(simhash(ARTICLE), simhash(OTHER)) > 3
+    assert simhash("too short") is None
+
+
+def test_int64_round_trip():
+    fingerprint = (1 << 64) - 5
+    assert -(1 << 63) <= to_int64(fingerprint) < 0
+    assert from_int64(to_int64(fingerprint)) == fingerprint
+
+
+def test_banded_lookup_matches_full_scan():
+    rng = random.Random(7)
+    fingerprints = {key: rng.getrandbits(64) for key in range(2000)}
+    index = NearDuplicateIndex(max_distance=3)
+    for key, fingerprint in fingerprints.items():
+        index.add(key, fingerprint)
+
+    for key in range(0, 2000, 50):
+        probe = fingerprints[key]
+        for bit in rng.sample(range(64), 3):
+            probe ^= 1 << bit
+        assert index.find(probe) == key
+        assert index.find(probe, exclude=key) is None
+
+
+def test_collapse_keeps_first_of_each_group():
+    items = [{"content": ARTICLE, "url": "a"}, {"content": OTHER, "url": "b"}, {"content": ARTICLE + " ", "url": "c"}]
+    assert [item["url"] for item in collapse_near_duplicates(items, lambda item: item["content"])] == ["a", "b"]
+
+
+def test_archiver_drops_mirrors_of_archived_items(motor_db, mongomock_bulk_write):
+
+    def item(link: str, content: str) -> dict:
+        return function_tool._build_archive_item({"url": link, "title": "t", "content": content}, ["rag"])
+
+    archiver = TrendArchiver(maxsize=10, batch_size=10, flush_interval=0, drain_timeout=1)
+    first = asyncio.run(archiver.flush([("k_blog", item("https://toss.tech/rag", ARTICLE))]))
+    assert first == {"inserted": 1, "skipped": 0, "duplicates": 0}
+
+    # New process: fingerprints come back from the archive
+    restarted = TrendArchiver(maxsize=10, batch_size=10, flush_interval=0, drain_timeout=1)
+    asyncio.run(restarted.load_fingerprints())
+    second = asyncio.run(restarted.flush([
+        ("k_blog", item("https://mirror.example.com/rag", ARTICLE)),
+        ("k_blog", item("https://toss.tech/k8s", OTHER)),
+        ("tech_news", item("https://news.example.com/rag", ARTICLE)),  # other category: kept
+    ]))
+    assert second == {"inserted": 2, "skipped": 0, "duplicates": 1}
+    assert restarted.metrics()["fingerprints"] == 3
+
+
+def test_search_response_collapses_mirrors():
+    from app.engine.tools.v1.search_client import FakeSearchClient
+
+    def respond(kwargs):
+        return {"answer": "a", "results": [
+            {"title": "원문", "url": "https://toss.tech/rag", "content": ARTICLE},
+            {"title": "미러", "url": "https://mirror.example.com/rag", "content": ARTICLE},
+            {"title": "other", "url": "https://toss.tech/k8s", "content": OTHER},
+        ]}
+
+    response, results, _ = function_tool._search_trends(["RAG"], "k_blog", client=FakeSearchClient(respond=respond))
+    assert [res["url"] for res in results] == ["https://toss.tech/rag", "https://toss.tech/k8s"]
+    assert len(response["items"]) == 2
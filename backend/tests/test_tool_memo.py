@@ -0,0 +1,116 @@
+import asyncio
+import pytest
+
+from app.core.config import settings
+from app.engine.tools.v1.curriculum_index import CURRICULUM_META_COLLECTION, CURRICULUM_META_ID
+from app.engine.tools.v1.schema_tool import PathOutput
+from app.engine.tools.v1.tool_memo import TOOL_MEMO, ToolResultMemo
+from app.api_mcp.v1 import tools
+
+
+def _memo(maxsize: int = 8):
+    state = {"version": "v1", "calls": []}
+
+    async def version_of():
+        return state["version"]
+
+    memo = ToolResultMemo(maxsize=maxsize, version_of=version_of)
+
+    @memo.memoize
+    async def lookup(name: str, depth: int = 1) -> PathOutput:
+        state["calls"].append((name, depth))
+        if name == "missing":
+            return PathOutput(error="not found")
+        return PathOutput(track=f"{name}@{state['version']}")
+
+    return memo, lookup, state
+
+
+def test_equivalent_calls_share_one_entry():
+    memo, lookup, state = _memo()
+
+    async def scenario():
+        first = await lookup("Track 1")
+        # positional / keyword / default spellings are the same call
+        assert await lookup(name="Track 1") is first
+        assert await lookup("Track 1", depth=1) is first
+        await lookup("Track 1", 2)
+
+    asyncio.run(scenario())
+    assert state["calls"] == [("Track 1", 1), ("Track 1", 2)]
+    assert memo.stats()["hits"] == 2 and memo.stats()["misses"] == 2
+    assert lookup.__name__ == "lookup"
+
+
+def test_size_is_bounded_and_errors_are_not_kept():
+    memo, lookup, state = _memo(maxsize=2)
+
+    async def scenario():
+        for name in ("a", "b", "c", "missing", "missing"):
+            await lookup(name)
+
+    asyncio.run(scenario())
+    assert len(memo._cache) == 2
+    assert state["calls"].count(("missing", 1)) == 2
+    assert memo.stats()["uncached"] == 2
+
+
+def test_version_change_invalidates():
+    memo, lookup, state = _memo()
+
+    async def scenario():
+        assert (await lookup("Track 1")).track == "Track 1@v1"
+        state["version"] = "v2"
+        return await lookup("Track 1")
+
+    assert asyncio.run(scenario()).track == "Track 1@v2"
+    assert memo.stats()["invalidations"] == 1
+    assert len(memo._cache) == 1
+
+
+@pytest.fixture
+def memo_db(tracks_db, monkeypatch):
+    monkeypatch.setattr(settings, "CURRICULUM_VERSION_CHECK_SECONDS", 0.0)
+    TOOL_MEMO.clear()
+    yield tracks_db
+    TOOL_MEMO.clear()
+
+
+def test_mcp_path_tool_is_memoized_until_resync(memo_db):
+    tracks_db = memo_db
+    track = "Track 1: AI Engineer"
+
+    async def scenario():
+        first = await tools.get_techtree_path(track)
+        second = await tools.get_techtree_path(track_name=track)
+        # re-sync: new content + new version stamp
+        await tracks_db["tracks"].update_one({"title": track}, {"$set": {"description": "re-synced"}})
+        await tracks_db[CURRICULUM_META_COLLECTION].update_one({"_id": CURRICULUM_META_ID}, {"$set": {"version": "v2"}})
+        third = await tools.get_techtree_path(track)
+        return first, second, third
+
+    hits = TOOL_MEMO.stats()["hits"]
+    invalidations = TOOL_MEMO.invalidations
+    first, second, third = asyncio.run(scenario())
+    assert second is first
+    assert TOOL_MEMO.stats()["hits"] == hits + 1
+    assert third.description == "re-synced"
+    assert TOOL_MEMO.invalidations == invalidations + 1
+
+
+def test_empty_survey_fallback_is_not_memoized(memo_db, monkeypatch):
+    survey = {"intro_message": "hi", "questions": [{"id": "q1", "text": "?", "options": []}]}
+    loads = [{"intro_message": "설문 데이터를 불러오는 중 오류가 발생했습니다.", "questions": []}, survey]
+
+    async def load_survey():
+        return loads.pop(0) if len(loads) > 1 else loads[0]
+
+    monkeypatch.setattr(tools, "af_get_techtree_survey", load_survey)
+
+    async def scenario():
+        return [await tools.get_techtree_survey() for _ in range(3)]
+
+    fallback, first, second = asyncio.run(scenario())
+    assert fallback.questions == []
+    # The failed load is retried; the real survey is then memoized
+    assert len(first.questions) == 1 and second is first
@@ -0,0 +1,54 @@
+import asyncio
+import pytest
+
+from app.engine.tools.v1.trend_archiver import TrendArchiver
+
+
+def _item(n: int) -> dict:
+    return {"title": f"post {n}", "link": f"https://toss.tech/{n}", "summary": "", "tags": ["rag"]}
+
+
+@pytest.fixture
+def trends_db(motor_db, mongomock_bulk_write):
+    return motor_db
+
+
+def test_batches_flush_and_drain_on_stop(trends_db):
+    archiver = TrendArchiver(maxsize=100, batch_size=10, flush_interval=5.0, drain_timeout=5.0)
+
+    async def scenario():
+        await archiver.start()
+        archiver.submit("k_blog", [_item(n) for n in range(25)])
+        archiver.submit("k_blog", [_item(0), _item(1)])  # already archived links
+        await archiver.stop()
+        return await trends_db["trend_items"].count_documents({"category": "k_blog"})
+
+    assert asyncio.run(scenario()) == 25
+    # 27 items -> 3 full/partial batches, not 27 round trips
+    assert archiver.flushes == 3
+    metrics = archiver.metrics()
+    assert metrics["inserted"] == 25 and metrics["skipped"] == 2 and metrics["queue_depth"] == 0
+
+
+def test_overflow_is_dropped_and_counted(trends_db):
+    archiver = TrendArchiver(maxsize=5, batch_size=100, flush_interval=5.0, drain_timeout=5.0)
+
+    async def scenario():
+        await archiver.start()
+        archiver.submit("research", [_item(n) for n in range(8)])
+        await archiver.stop()
+
+    asyncio.run(scenario())
+    assert archiver.enqueued == 5 and archiver.dropped == 3
+
+
+def test_submit_from_worker_thread(trends_db):
+    archiver = TrendArchiver(maxsize=100, batch_size=100, flush_interval=0.01, drain_timeout=5.0)
+
+    async def scenario():
+        await archiver.start()
+        await asyncio.to_thread(archiver.submit, "engineering", [_item(1)])
+        await archiver.stop()
+        return await trends_db["trend_items"].count_documents({"link": "https://toss.tech/1"})
+
+    assert asyncio.run(scenario()) == 1
@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+
+from app.core.config import settings
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.trend_cache import TrendSearchCache, trend_cache_key
+
+
+@pytest.fixture
+def search_calls(monkeypatch, motor_db, mongomock_bulk_write):
+    """Tavily 대신 호출 횟수를 기록하는 가짜 검색 + 인메모리 Motor DB"""
+    monkeypatch.setattr(function_tool, "TREND_SEARCH_CACHE", TrendSearchCache(maxsize=16, fresh_seconds=60, stale_seconds=3600))
+    # 캐시 동작만 검증 (아카이브 우선 검색은 test_trend_search_index.py)
+    monkeypatch.setattr(settings, "TREND_ARCHIVE_FIRST", False)
+
+    calls = []
+    def fake_search(keywords, category):
+        calls.append((tuple(keywords), category))
+        results = [{"url": f"https://toss.tech/{len(calls)}", "title": "RAG", "content": "본문"}]
+        return {"answer": f"answer {len(calls)}", "items": [], "category": category}, results, ["rag"]
+
+    monkeypatch.setattr(function_tool, "_search_trends", fake_search)
+    return calls
+
+
+def test_key_ignores_keyword_order_and_case():
+    assert trend_cache_key(["RAG", "llm "], "k_blog") == trend_cache_key(["llm", "rag", "Rag"], "K_BLOG")
+
+
+def test_fresh_hit_skips_search(search_calls):
+    async def scenario():
+        first = await function_tool.af_get_techtree_trend(["RAG", "LLM"], "k_blog")
+        second = await function_tool.af_get_techtree_trend(["llm", "rag"], "k_blog")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert len(search_calls) == 1
+    assert "cached_at" not in first
+    assert second["answer"] == first["answer"] and second["cached_at"]
+
+
+def test_shared_tier_serves_other_processes(search_calls):
+    asyncio.run(function_tool.af_get_techtree_trend(["RAG"], "k_blog"))
+    # New process: empty in-process tier, same Mongo collection
+    function_tool.TREND_SEARCH_CACHE.clear()
+
+    result = asyncio.run(function_tool.af_get_techtree_trend(["RAG"], "k_blog"))
+    assert len(search_calls) == 1
+    assert result["answer"] == "answer 1"
+    assert function_tool.TREND_SEARCH_CACHE.stats()["remote_hits"] == 1
+
+
+def test_stale_hit_is_served_then_refreshed_once(search_calls):
+    cache = function_tool.TREND_SEARCH_CACHE
+
+    async def scenario():
+        await function_tool.af_get_techtree_trend(["RAG"], "k_blog")
+        cache.fresh_seconds = 0  # everything cached is now stale
+        stale = await asyncio.gather(*(function_tool.af_get_techtree_trend(["RAG"], "k_blog") for _ in range(5)))
+        await asyncio.gather(*function_tool._BACKGROUND_TASKS)
+        return stale
+
+    stale = asyncio.run(scenario())
+    assert all(result["answer"] == "answer 1" for result in stale)
+    # Five stale hits -> a single background refresh
+    assert len(search_calls) == 2
+    assert cache.get_local(trend_cache_key(["RAG"], "k_blog"))["response"]["answer"] == "answer 2"
+
+
+def test_sync_entry_point_archives_through_motor(search_calls, motor_db):
+    # No running archiver and no event loop in this thread (scripts): the awaited flush runs on a private loop
+    response = function_tool.f_get_techtree_trend(["RAG"], "k_blog")
+    assert response["answer"] == "answer 1"
+
+    docs = asyncio.run(motor_db["trend_items"].find({"category": "k_blog"}).to_list(None))
+    assert [doc["link"] for doc in docs] == ["https://toss.tech/1"]
+    cached = asyncio.run(motor_db["trend_search_cache"].find_one({"_id": trend_cache_key(["RAG"], "k_blog")}))
+    assert cached["response"]["answer"] == "answer 1"
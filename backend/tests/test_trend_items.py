@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.engine.tools.v1.trend_items import alist_trend_items
+from init_db import init_db
+from migrate_trends_to_items import migrate_trends
+
+BASE_TIME = datetime(2026, 1, 1)
+
+
+def _item(n: int, minutes: int = 0) -> dict:
+    return {
+        "title": f"post {n}", "link": f"https://toss.tech/{n}", "summary": "", "tags": ["rag"] if n % 2 else ["llm"],
+        "source_domain": "toss.tech", "collected_at": BASE_TIME + timedelta(minutes=minutes), "view_count": 0
+    }
+
+
+@pytest.fixture
+def items_db(motor_db):
+    # Items 0~9 share one timestamp: pages must still neither repeat nor skip
+    docs = [{**_item(n, minutes=0 if n < 10 else n), "category": "k_blog"} for n in range(25)]
+    asyncio.run(motor_db["trend_items"].insert_many(docs))
+    return motor_db
+
+
+def test_pages_cover_every_item_once(items_db):
+    async def read_all():
+        seen, cursor = [], None
+        while True:
+            page = await alist_trend_items(category="k_blog", limit=7, cursor=cursor)
+            seen.extend(doc["link"] for doc in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return seen
+
+    seen = asyncio.run(read_all())
+    assert len(seen) == 25 and len(set(seen)) == 25
+    assert seen[0] == "https://toss.tech/24"  # newest first
+
+
+def test_time_range_and_tag_filter(items_db):
+    page = asyncio.run(alist_trend_items(
+        tags=["RAG"], since=BASE_TIME + timedelta(minutes=10), until=BASE_TIME + timedelta(minutes=20)
+    ))
+    assert [doc["link"] for doc in page["items"]] == [f"https://toss.tech/{n}" for n in (19, 17, 15, 13, 11)]
+    assert page["next_cursor"] is None
+
+
+def test_migration_is_idempotent(motor_db, mongomock_bulk_write):
+    db = motor_db
+
+    async def migrate():
+        await db["trends"].insert_many([
+            {"category": "k_blog", "items": [_item(1), _item(2), {"title": "no link"}]},
+            {"category": "research", "items": [_item(1)]},
+        ])
+        first = await migrate_trends(db)
+        same_link = await db["trend_items"].count_documents({"link": "https://toss.tech/1"})
+        second = await migrate_trends(db, drop_legacy=True)
+        return first, same_link, second, await db.list_collection_names()
+
+    first, same_link, second, collections = asyncio.run(migrate())
+    assert first["inserted"] == 3 and first["skipped"] == 1
+    # Same link in two categories stays two documents
+    assert same_link == 2
+    assert second["inserted"] == 0 and second["existing"] == 3
+    assert "trends" not in collections
+
+
+def test_init_db_creates_the_trend_indexes(motor_db):
+    init_db()
+
+    async def index_info():
+        return (
+            await motor_db["trend_items"].index_information(),
+            await motor_db["trend_search_cache"].index_information(),
+        )
+
+    items, cache = asyncio.run(index_info())
+    keys = {tuple(spec["key"]): spec for spec in items.values()}
+    assert keys[(("category", 1), ("link", 1))].get("unique")
+    assert (("category", 1), ("view_count", -1)) in keys
+    ttl = [spec for spec in cache.values() if spec["key"] == [("cached_at", 1)]]
+    assert ttl and ttl[0]["expireAfterSeconds"] == int(settings.TREND_CACHE_STALE_SECONDS)
@@ -0,0 +1,72 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+
+from app.engine.tools.v1 import function_tool
+from app.engine.tools.v1.trend_items import TREND_ITEMS_COLLECTION
+from app.engine.tools.v1.trend_search_index import TrendArchiveSearch, tokenize
+
+
+def _item(i: int, title: str, category: str = "k_blog", age_hours: float = 1, tags=None) -> dict:
+    return {
+        "title": title, "link": f"https://toss.tech/article/{i}", "summary": "",
+        "tags": tags or [], "source_domain": "toss.tech", "category": category,
+        "collected_at": datetime.utcnow() - timedelta(hours=age_hours), "view_count": 0,
+    }
+
+
+def _search(**kwargs) -> TrendArchiveSearch:
+    options = {"min_hits": 2, "min_coverage": 0.6, "refresh_seconds": 60, "rebuild_seconds": 3600}
+    return TrendArchiveSearch(**{**options, **kwargs})
+
+
+def test_korean_words_become_bigrams():
+    assert tokenize("RAG 도입기를") == ["rag", "도입", "입기", "기를"]
+    assert tokenize("검색") == ["검색"]
+
+
+def test_ranking_and_category_freshness(motor_db):
+    asyncio.run(motor_db[TREND_ITEMS_COLLECTION].insert_many([
+        _item(1, "RAG 파이프라인 도입기", tags=["rag"]),
+        _item(2, "사내 RAG 검색 개선"),
+        _item(3, "Kubernetes 운영 노하우"),
+        _item(4, "RAG 뉴스", category="tech_news", age_hours=48),  # tech_news 신선도(24h) 초과
+    ]))
+    search = _search()
+    asyncio.run(search.arefresh(force=True))
+
+    hits = search.search(["RAG", "도입"], "k_blog")
+    assert [hit["link"] for hit in hits] == ["https://toss.tech/article/1"]
+    assert [hit["link"] for hit in search.search(["rag"], "k_blog")][0] == "https://toss.tech/article/1"
+    assert search.search(["rag"], "tech_news") == []
+
+
+def test_too_few_hits_fall_through(motor_db):
+    asyncio.run(motor_db[TREND_ITEMS_COLLECTION].insert_one(_item(1, "RAG 도입기")))
+    search = _search()
+    asyncio.run(search.arefresh(force=True))
+    assert search.answer(["RAG"], "k_blog") is None
+    assert search.stats()["misses"] == 1
+
+
+def test_incremental_refresh_adds_new_items_once(motor_db):
+    collection = motor_db[TREND_ITEMS_COLLECTION]
+    asyncio.run(collection.insert_one(_item(1, "LLM 서빙")))
+    search = _search()
+    asyncio.run(search.arefresh(force=True))
+    asyncio.run(collection.insert_one(_item(2, "LLM 평가", age_hours=0)))
+    asyncio.run(search.arefresh(force=True))
+    asyncio.run(search.arefresh(force=True))
+    assert len(search) == 2
+    assert len(search.answer(["llm"], "k_blog")) == 2
+
+
+def test_archive_answers_before_web(motor_db, monkeypatch):
+    asyncio.run(motor_db[TREND_ITEMS_COLLECTION].insert_many([_item(i, f"RAG 사례 {i}") for i in range(3)]))
+    monkeypatch.setattr(function_tool, "TREND_ARCHIVE_SEARCH", _search(refresh_seconds=0))
+    monkeypatch.setattr(function_tool.TREND_SEARCH_CACHE, "aget", lambda key: asyncio.sleep(0))
+    monkeypatch.setattr(function_tool, "_search_trends", lambda *args: pytest.fail("web search called"))
+
+    result = asyncio.run(function_tool.af_get_techtree_trend(["RAG"], "k_blog"))
+    assert result["source"] == "archive"
+    assert len(result["items"]) == 3 and result["items"][0]["title"].endswith("| toss.tech")
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+from datetime import datetime
+import pytest
+
+from app.api.v1 import trends
+from app.engine.tools.v1 import trend_views
+from app.engine.tools.v1.trend_items import TREND_ITEMS_COLLECTION
+from app.engine.tools.v1.trend_views import ShardedCounter, TrendViewTracker
+
+
+def _link(i: int) -> str:
+    return f"https://toss.tech/article/{i}"
+
+
+@pytest.fixture
+def views_db(motor_db, mongomock_bulk_write):
+    asyncio.run(motor_db[TREND_ITEMS_COLLECTION].insert_many([
+        {"category": "k_blog", "title": f"post {i}", "link": _link(i), "collected_at": datetime.utcnow(), "view_count": 0}
+        for i in range(3)
+    ]))
+    return motor_db
+
+
+def test_sharded_counter_aggregates_across_threads():
+    counter = ShardedCounter(shards=4)
+
+    def hammer():
+        for i in range(1000):
+            counter.add(("k_blog", _link(i % 10)))
+
+    threads = [threading.Thread(target=hammer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    drained = counter.drain()
+    assert sum(drained.values()) == 4000 and drained[("k_blog", _link(0))] == 400
+    assert counter.pending() == 0
+
+
+def test_flush_writes_aggregated_increments(views_db):
+    tracker = TrendViewTracker(shards=4, flush_interval=60, top_n=2, top_refresh_interval=60)
+    for _ in range(5):
+        tracker.record([{"link": _link(0)}, {"link": _link(1)}], "k_blog")
+    tracker.record([{"link": _link(2), "category": "k_blog"}, {"link": "https://not-archived"}], "k_blog")
+
+    written = asyncio.run(tracker.flush())
+    assert written == 12
+    counts = {doc["link"]: doc["view_count"] for doc in asyncio.run(views_db[TREND_ITEMS_COLLECTION].find().to_list(None))}
+    assert counts == {_link(0): 5, _link(1): 5, _link(2): 1}
+    # 4 aggregated updates in one flush, one for a link that is not archived
+    assert tracker.metrics()["flushes"] == 1 and tracker.unmatched == 1
+
+
+def test_failed_flush_keeps_counts(views_db, monkeypatch):
+    tracker = TrendViewTracker(shards=4, flush_interval=60, top_n=2, top_refresh_interval=60)
+    tracker.record([{"link": _link(0)}], "k_blog")
+    monkeypatch.setattr(trend_views, "get_db", lambda: None)
+    assert asyncio.run(tracker.flush()) == 0
+    assert tracker.metrics()["pending_views"] == 1 and tracker.failed_flushes == 1
+
+
+def test_top_viewed_is_precomputed(views_db):
+    tracker = TrendViewTracker(shards=4, flush_interval=60, top_n=2, top_refresh_interval=60)
+
+    async def scenario():
+        await tracker.start()
+        tracker.record([{"link": _link(2)}] * 3 + [{"link": _link(0)}], "k_blog")
+        before = tracker.top_viewed("k_blog")
+        await tracker.stop()  # final flush
+        await tracker.refresh_top()
+        return before
+
+    before = asyncio.run(scenario())
+    assert before == []
+    assert [doc["link"] for doc in tracker.top_viewed("k_blog")] == [_link(2), _link(0)]
+    assert tracker.top_viewed("research") == []
+
+
+def test_timer_refreshes_top_on_its_own_interval(views_db, monkeypatch):
+    tracker = TrendViewTracker(shards=4, flush_interval=0.005, top_n=2, top_refresh_interval=0.05)
+    refreshes = []
+    refresh_top = tracker.refresh_top
+
+    async def counted_refresh():
+        refreshes.append(1)
+        await refresh_top()
+
+    monkeypatch.setattr(tracker, "refresh_top", counted_refresh)
+
+    async def scenario():
+        await tracker.start()
+        # Counted by another API worker: nothing pending here, the next top refresh must still pick it up
+        await views_db[TREND_ITEMS_COLLECTION].update_one({"link": _link(1)}, {"$inc": {"view_count": 7}})
+        await asyncio.sleep(0.2)
+        await tracker.stop()
+
+    asyncio.run(scenario())
+    assert [doc["link"] for doc in tracker.top_viewed("k_blog")] == [_link(1)]
+    # ~40 flush ticks, but the top list is only recomputed every top_refresh_interval
+    assert 2 <= len(refreshes) <= 6
+
+
+def test_listing_is_not_a_view_but_opening_an_item_is(views_db, monkeypatch):
+    tracker = TrendViewTracker(shards=4, flush_interval=60, top_n=2, top_refresh_interval=60)
+    monkeypatch.setattr(trends, "TREND_VIEWS", tracker)
+
+    async def scenario():
+        page = await trends.list_trends(category="k_blog", tag=None, since=None, until=None, limit=10, cursor=None)
+        opened = await trends.get_trend(page.items[0].id)
+        return page, opened
+
+    page, opened = asyncio.run(scenario())
+    assert len(page.items) == 3
+    assert tracker.recorded == 1 and opened.link == page.items[0].link
+
+    with pytest.raises(trends.HTTPException) as invalid:
+        asyncio.run(trends.get_trend("not-an-id"))
+    assert invalid.value.status_code == 400
+    with pytest.raises(trends.HTTPException) as missing:
+        asyncio.run(trends.get_trend("0" * 24))
+    assert missing.value.status_code == 404
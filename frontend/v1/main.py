@@ -15,7 +15,8 @@ load_dotenv(os.path.join(current_dir, "../.env"))
 
 # Backend URL Configuration
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
-API_ENDPOINT = f"{BACKEND_URL}/api/v1/agent/chat"
+# SSE 스트리밍 엔드포인트 (툴 실행 과정/답변 토큰을 생성되는 대로 수신)
+STREAM_ENDPOINT = f"{BACKEND_URL}/api/v1/agent/chat/stream"
 
 st.set_page_config(page_title="AI TechTree MCP", page_icon="", layout="wide")
 
@@ -43,6 +44,23 @@ for msg in st.session_state["messages"]:
         with st.expander(f"🛠️ Tool Output: {msg.name}"):
             st.code(msg.content, language="json")
 
+# -------------------------------------------------------------------------
+# SSE Parsing
+# -------------------------------------------------------------------------
+def iter_sse(response):
+    """'event: <type>' / 'data: <json>' 블록을 (type, data) 로 변환 (빈 줄 = 이벤트 끝)"""
+    event_type, data_lines = None, []
+    for line in response.iter_lines(decode_unicode=True):
+        if line:
+            field, _, value = line.partition(": ")
+            if field == "event":
+                event_type = value
+            elif field == "data":
+                data_lines.append(value)
+        elif event_type and data_lines:
+            yield event_type, json.loads("\n".join(data_lines))
+            event_type, data_lines = None, []
+
 # -------------------------------------------------------------------------
 # Chat Logic: Handle User Input
 # -------------------------------------------------------------------------
@@ -51,57 +69,84 @@ if prompt := st.chat_input("예: 데이터 분석 학습 순서 알려줘"):
     st.chat_message("user").write(prompt)
     st.session_state["messages"].append(HumanMessage(content=prompt))
 
-    # 2. Call Backend API
+    # 2. Call Backend API (SSE: 툴 실행/답변 토큰을 받는 즉시 표시)
     with st.chat_message("assistant"):
-        with st.spinner("AI is Thinking..."):
-            try:
-                # Prepare Payload
-                # 객체 -> JSON 변환 (role, content 만 추출)
-                # ToolMessage는 API 요청에 포함하지 않아도 됨 (필요시 포함 가능하지만, 현재 로직상 불필요)
-                filtered_history = []
-                for m in st.session_state["messages"]:
-                    if isinstance(m, HumanMessage):
-                        filtered_history.append({"role": "user", "content": m.content})
-                    elif isinstance(m, AIMessage):
-                        filtered_history.append({"role": "assistant", "content": m.content})
-                
-                payload = {"messages": filtered_history}
-                
-                # API 호출
-                response = requests.post(API_ENDPOINT, json=payload)
+        thinking = st.empty()
+        thinking.caption("AI is Thinking...")
+        try:
+            # Prepare Payload
+            # 객체 -> JSON 변환 (role, content 만 추출)
+            # ToolMessage는 API 요청에 포함하지 않아도 됨 (필요시 포함 가능하지만, 현재 로직상 불필요)
+            filtered_history = []
+            for m in st.session_state["messages"]:
+                if isinstance(m, HumanMessage):
+                    filtered_history.append({"role": "user", "content": m.content})
+                elif isinstance(m, AIMessage):
+                    filtered_history.append({"role": "assistant", "content": m.content})
+
+            payload = {"messages": filtered_history}
+
+            # API 호출 (stream=True: 응답 전체를 기다리지 않고 이벤트 단위로 읽음)
+            with requests.post(STREAM_ENDPOINT, json=payload, stream=True) as response:
                 response.raise_for_status()
-                
-                data = response.json()
-                ai_response = data.get("response", "")
-                tool_calls = data.get("tool_calls", [])
-
-                # 3. Display Tool Logs (복원된 스타일)
-                for tool in tool_calls:
-                    tool_name = tool["name"]
-                    tool_result = tool["result"]
-                    tool_args = tool.get("args", {})
-                    
-                    # Toast 알림 (이전 스타일 복원)
-                    st.toast(f"🛠️ {tool_name} 도구를 실행했습니다.", icon="🔧")
-                    
-                    # UI 표시 (Expander)
-                    with st.expander(f"⚡ Tool Execution: {tool_name}"):
-                        st.json(tool_args)
-                        st.code(tool_result, language="json") # 결과가 JSON 문자열일 확률이 높음
-                    
-                    # 히스토리에 ToolMessage로 저장 (그래야 UI 루프에서 다시 그려짐)
-                    st.session_state["messages"].append(ToolMessage(
-                        tool_call_id=f"tool_{tool_name}", # 임시 ID
-                        name=tool_name,
-                        content=str(tool_result)
-                    ))
-
-                # 4. Display Final Answer
-                if ai_response:
-                    st.write(ai_response)
-                    st.session_state["messages"].append(AIMessage(content=ai_response))
-
-            except requests.exceptions.ConnectionError:
-                st.error(f"❌ 백엔드 서버({BACKEND_URL})에 연결할 수 없습니다.")
-            except Exception as e:
-                st.error(f"❌ 오류가 발생했습니다: {str(e)}")
+
+                tool_panels = {}      # 현재 스텝의 tool_call index -> st.status
+                answer_box = None
+                answer = ""
+
+                for event_type, data in iter_sse(response):
+                    thinking.empty()
+
+                    # 3. Display Tool Logs (실행 시작 시 표시, 결과가 오면 채움)
+                    if event_type == "tool_start":
+                        if data["index"] == 0:
+                            tool_panels = {}
+                            # 툴 호출로 끝난 스텝의 텍스트는 서두일 뿐 최종 답변이 아님 -> 누적 답변 초기화
+                            answer = ""
+                            if answer_box is not None:
+                                answer_box.empty()
+                                answer_box = None
+                        # Toast 알림
+                        st.toast(f"🛠️ {data['name']} 도구를 실행합니다.", icon="🔧")
+                        panel = st.status(f"⚡ Tool Execution: {data['name']}", state="running")
+                        panel.json(data.get("args", {}))
+                        tool_panels[data["index"]] = panel
+
+                    elif event_type == "tool_result":
+                        panel = tool_panels.get(data["index"])
+                        if panel is not None:
+                            panel.code(data["result"], language="json") # 결과가 JSON 문자열일 확률이 높음
+                            panel.update(state="error" if data["result"].startswith("Error:") else "complete", expanded=False)
+
+                    # 4. Display Final Answer (토큰 단위로 이어 붙이며 표시)
+                    elif event_type == "token":
+                        if answer_box is None:
+                            answer_box = st.empty()
+                        answer += data["content"]
+                        answer_box.markdown(answer + "▌")
+
+                    elif event_type == "done":
+                        ai_response = data.get("response", "")
+                        if answer_box is None:
+                            answer_box = st.empty()
+                        answer_box.markdown(ai_response)
+
+                        # 히스토리에 ToolMessage로 저장 (그래야 UI 루프에서 다시 그려짐)
+                        for tool in data.get("tool_calls", []):
+                            st.session_state["messages"].append(ToolMessage(
+                                tool_call_id=f"tool_{tool['name']}", # 임시 ID
+                                name=tool["name"],
+                                content=str(tool["result"])
+                            ))
+                        if ai_response:
+                            st.session_state["messages"].append(AIMessage(content=ai_response))
+
+                    elif event_type == "error":
+                        st.error(f"❌ 오류가 발생했습니다: {data.get('detail')}")
+
+        except requests.exceptions.ConnectionError:
+            thinking.empty()
+            st.error(f"❌ 백엔드 서버({BACKEND_URL})에 연결할 수 없습니다.")
+        except Exception as e:
+            thinking.empty()
+            st.error(f"❌ 오류가 발생했습니다: {str(e)}")